@@ -14,6 +14,9 @@ from importlib.metadata import entry_points
 
 import click
 
+from .components import components
+from .mappings import mappings
+from .reindex import reindex
 from .search import init as search_init  # noqa just to register it
 
 
@@ -22,6 +25,10 @@ def oarepo() -> None:
     """OARepo commands. See invenio oarepo --help for details."""
 
 
+oarepo.add_command(components)
+oarepo.add_command(mappings)
+oarepo.add_command(reindex)
+
 # register additional commands to the oarepo group
 for ep in entry_points(group="oarepo.cli"):
     oarepo.add_command(ep.load())  # pragma: nocover
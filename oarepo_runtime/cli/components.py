@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Validation and export of service component orderings."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import click
+from flask.cli import with_appcontext
+
+from oarepo_runtime.proxies import current_runtime
+from oarepo_runtime.services.config.components import ComponentsOrderingMixin
+
+if TYPE_CHECKING:
+    from typing import TextIO
+
+
+@click.group()
+def components() -> None:
+    """Service components ordering commands."""
+
+
+def compute_components_orderings() -> dict[str, dict[str, Any]]:
+    """Compute component orderings of all registered services.
+
+    :raise click.ClickException: if ordering of any of the services fails (e.g. on a dependency cycle).
+    """
+    orderings: dict[str, dict[str, Any]] = {}
+    errors: list[str] = []
+    for service_id, service in sorted(current_runtime.services.items()):
+        if not isinstance(service, ComponentsOrderingMixin):
+            continue
+        try:
+            orderings[service_id] = service.get_components_ordering_info()
+        except (ValueError, TypeError) as e:
+            errors.append(f"{service_id}: {e}")
+    if errors:
+        raise click.ClickException("Invalid service components:\n" + "\n".join(errors))
+    return orderings
+
+
+def _dot_id(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def orderings_to_dot(orderings: dict[str, dict[str, Any]]) -> str:
+    """Convert component orderings to a graphviz DOT graph.
+
+    Edges go from a component to the components that must be run after it.
+    """
+    lines = ["digraph components {", "    rankdir=LR;"]
+    for service_id, info in orderings.items():
+        lines.append(f"    subgraph {_dot_id('cluster_' + service_id)} {{")
+        lines.append(f"        label={_dot_id(service_id)};")
+        for idx, name in enumerate(info["order"]):
+            label = f"{idx + 1}. {name.rsplit('.', 1)[-1]}"
+            lines.append(f"        {_dot_id(service_id + ':' + name)} [label={_dot_id(label)}];")
+        for name, dependencies in info["graph"].items():
+            for dependency in dependencies:
+                lines.append(f"        {_dot_id(service_id + ':' + dependency)} -> {_dot_id(service_id + ':' + name)};")
+        lines.append("    }")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+@components.command(name="check")
+@with_appcontext
+def check_components() -> None:
+    """Check that components of all registered services can be ordered."""
+    for service_id, info in compute_components_orderings().items():
+        click.secho(f"{service_id}: {len(info['order'])} components ok", fg="green")
+
+
+@components.command(name="dump")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "dot"]),
+    default="json",
+    help="Output format. JSON output can be loaded by workers via OAREPO_RUNTIME_COMPONENT_ORDERING_FILE.",
+)
+@click.option("--output", type=click.File("w"), default="-", help="Output file, stdout by default.")
+@with_appcontext
+def dump_components(output_format: str, output: TextIO) -> None:
+    """Dump the resolved component order and dependency graph of all registered services."""
+    orderings = compute_components_orderings()
+    if output_format == "dot":
+        output.write(orderings_to_dot(orderings))
+    else:
+        json.dump(orderings, output, indent=2)
+        output.write("\n")
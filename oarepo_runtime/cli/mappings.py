@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Update of search index mappings of registered record classes."""
+
+from __future__ import annotations
+
+import click
+from flask.cli import with_appcontext
+
+from oarepo_runtime.records.mapping import MappingUpdatePlan
+from oarepo_runtime.records.systemfields.custom_fields import add_relation_fields_mapping
+from oarepo_runtime.services.records.mapping import get_all_record_classes
+
+
+@click.group()
+def mappings() -> None:
+    """Search index mappings commands."""
+
+
+@mappings.command(name="update")
+@click.option("--dry-run", is_flag=True, default=False, help="Only print the changes, do not modify the indices.")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Maximum number of indices updated in parallel.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Compare all indices, even those whose stored mapping fingerprint has not changed.",
+)
+@with_appcontext
+def update_mappings(dry_run: bool, workers: int, force: bool) -> None:
+    """Update mappings of system fields and custom fields relations of all registered record classes.
+
+    Indices whose mapping fingerprint stored by the previous update matches are skipped.
+    """
+    plan = MappingUpdatePlan(source="all_fields")
+    for record_class in get_all_record_classes():
+        plan.add_record_class(record_class)
+        add_relation_fields_mapping(plan, record_class)
+
+    changes = plan.execute(dry_run=dry_run, workers=workers, force=force)
+    for change in changes:
+        click.echo(str(change))
+    if not changes:
+        click.secho("All mappings are up to date.", fg="green")
+    elif dry_run:
+        click.secho(f"{len(changes)} changes would be made.", fg="yellow")
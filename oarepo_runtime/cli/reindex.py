@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Reindex of registered models into new versioned indices."""
+
+from __future__ import annotations
+
+import click
+from flask.cli import with_appcontext
+
+from oarepo_runtime.proxies import current_runtime
+from oarepo_runtime.records.reindex import ReindexError, ReindexJob, ReindexProgress
+
+
+@click.command(name="reindex")
+@click.argument("model_codes", nargs=-1)
+@click.option(
+    "--source",
+    type=click.Choice(["search", "db"]),
+    default="search",
+    show_default=True,
+    help="Copy documents from the current index, or index records from the database.",
+)
+@click.option(
+    "--slices",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Number of slices copied in parallel.",
+)
+@click.option(
+    "--requests-per-second",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Throttle the copy to this number of documents per second.",
+)
+@click.option("--batch-size", type=click.IntRange(min=1), default=500, show_default=True, help="Bulk batch size.")
+@click.option("--delete-old", is_flag=True, default=False, help="Delete the old index after the aliases are swapped.")
+@with_appcontext
+def reindex(  # noqa: PLR0913 command options
+    model_codes: tuple[str, ...],
+    source: str,
+    slices: int,
+    requests_per_second: float | None,
+    batch_size: int,
+    delete_old: bool,
+) -> None:
+    """Reindex records and drafts of the given models (all models if none given) into new indices.
+
+    The current index is used until the new one is complete, then all its aliases are
+    moved to the new index at once. An interrupted reindex continues when started again.
+    """
+    models = current_runtime.models
+    unknown = set(model_codes) - set(models)
+    if unknown:
+        raise click.BadParameter(f"Unknown models: {', '.join(sorted(unknown))}", param_hint="MODEL_CODES")
+
+    def report(progress: ReindexProgress) -> None:
+        click.echo(str(progress))
+
+    for code in model_codes or tuple(models):
+        model = models[code]
+        for record_class in (model.record_cls, model.draft_cls):
+            if record_class is None or getattr(record_class, "index", None) is None:
+                continue
+            job = ReindexJob(
+                record_class,
+                source=source,  # type: ignore[arg-type]
+                slices=slices,
+                requests_per_second=requests_per_second,
+                batch_size=batch_size,
+                progress=report,
+            )
+            try:
+                job.run(delete_old=delete_old)
+            except ReindexError as e:
+                raise click.ClickException(str(e)) from e
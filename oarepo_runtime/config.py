@@ -41,6 +41,52 @@ def build_config[T](config_class: type[T], app: Flask, *args: Any, **kwargs: Any
 # Configuration for the extension.
 #
 
+OAREPO_RUNTIME_COMPONENT_TIMING = False
+"""If True, wall time and call counts of service component hooks are recorded.
+
+See ``oarepo_runtime.services.config.timing.component_timings``.
+"""
+
+OAREPO_RUNTIME_COMPONENT_ORDERING_FILE: str | None = None
+"""Path to a JSON file with component orderings precomputed by ``invenio oarepo components dump``.
+
+If set, the orderings are loaded at application startup instead of being computed by each worker.
+"""
+
+OAREPO_RUNTIME_QUERY_CACHE_SIZE = 1024
+"""Maximum number of query strings cached by ``CachedQueryParser``, 0 disables the cache.
+
+See ``oarepo_runtime.services.queryparsers.cache.query_cache`` for hit-rate statistics.
+"""
+
+OAREPO_RUNTIME_VOCABULARY_LABELS_CACHE_SIZE = 10000
+"""Maximum number of localized labels cached by vocabulary facets, 0 disables the cache.
+
+Expired labels are purged and least recently used labels evicted when the cache is full.
+See ``oarepo_runtime.services.facets.vocabulary.vocabulary_labels_cache``.
+"""
+
+OAREPO_RUNTIME_ACTION_ACCESS_CACHE_TTL = 60
+"""Number of seconds results of action access checks of administration generators are cached, 0 disables the cache.
+
+Grants and revocations made through the database session of the same process (including
+bulk ORM deletes such as ``invenio access remove``) invalidate the cache immediately.
+Changes made by other processes are visible after this number of seconds.
+"""
+
+INFO_ENDPOINT_CACHE_TTL = 300
+"""Number of seconds serialized responses of the info endpoint are cached, 0 disables the cache.
+
+Cached responses are dropped when vocabulary types are changed through the database session of the
+same process. Changes made by other processes are visible after this number of seconds.
+"""
+
+INFO_ENDPOINT_CACHE_MAX_AGE = 60
+"""Max age (in seconds) of the ``Cache-Control`` header of info endpoint responses."""
+
+INFO_ENDPOINT_CACHE_SIZE = 256
+"""Maximum number of serialized info endpoint responses (per locale, host and content type) kept in memory."""
+
 OAREPO_MODELS: dict[str, Model] = {
     # default invenio vocabularies
     "vocabularies": Model(
@@ -25,6 +25,10 @@ from lxml.etree import fromstring
 
 from . import config
 from .api import ExportRepresentation
+from .services.config.components import load_precomputed_component_orderings
+from .services.facets.vocabulary import vocabulary_labels_cache
+from .services.generators import action_access_cache
+from .services.queryparsers.cache import query_cache
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Iterable
@@ -56,8 +60,28 @@ class OARepoRuntime:
         self.init_config(app)
         app.extensions["oarepo-runtime"] = self
 
+        ordering_file = app.config["OAREPO_RUNTIME_COMPONENT_ORDERING_FILE"]
+        if ordering_file:
+            load_precomputed_component_orderings(ordering_file)
+        query_cache.maxsize = app.config["OAREPO_RUNTIME_QUERY_CACHE_SIZE"]
+        action_access_cache.ttl = app.config["OAREPO_RUNTIME_ACTION_ACCESS_CACHE_TTL"]
+        vocabulary_labels_cache.maxsize = app.config["OAREPO_RUNTIME_VOCABULARY_LABELS_CACHE_SIZE"]
+
     def init_config(self, app: Flask) -> None:
         """Initialize the configuration for the extension."""
+        app.config.setdefault("OAREPO_RUNTIME_COMPONENT_TIMING", config.OAREPO_RUNTIME_COMPONENT_TIMING)
+        app.config.setdefault(
+            "OAREPO_RUNTIME_COMPONENT_ORDERING_FILE",
+            config.OAREPO_RUNTIME_COMPONENT_ORDERING_FILE,
+        )
+        app.config.setdefault("OAREPO_RUNTIME_QUERY_CACHE_SIZE", config.OAREPO_RUNTIME_QUERY_CACHE_SIZE)
+        app.config.setdefault("OAREPO_RUNTIME_ACTION_ACCESS_CACHE_TTL", config.OAREPO_RUNTIME_ACTION_ACCESS_CACHE_TTL)
+        app.config.setdefault(
+            "OAREPO_RUNTIME_VOCABULARY_LABELS_CACHE_SIZE", config.OAREPO_RUNTIME_VOCABULARY_LABELS_CACHE_SIZE
+        )
+        app.config.setdefault("INFO_ENDPOINT_CACHE_TTL", config.INFO_ENDPOINT_CACHE_TTL)
+        app.config.setdefault("INFO_ENDPOINT_CACHE_MAX_AGE", config.INFO_ENDPOINT_CACHE_MAX_AGE)
+        app.config.setdefault("INFO_ENDPOINT_CACHE_SIZE", config.INFO_ENDPOINT_CACHE_SIZE)
         app.config.setdefault("OAREPO_MODELS", {})
         for k, v in config.OAREPO_MODELS.items():
             if k not in app.config["OAREPO_MODELS"]:
@@ -10,16 +10,25 @@
 
 from __future__ import annotations
 
+import dataclasses
+import hashlib
 import importlib
 import logging
 import os
 import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from functools import cached_property
+from importlib.metadata import version
 from typing import TYPE_CHECKING, Any, ClassVar, Protocol, cast
 from urllib.parse import urljoin, urlparse, urlunparse
 
 import marshmallow as ma
-from flask import Blueprint, Flask, current_app, request, url_for
+import sqlalchemy as sa
+from flask import Blueprint, Flask, Response, current_app, request, url_for
+from flask_babel import get_locale
 from flask_resources import (
     ResourceConfig,
     from_conf,
@@ -40,6 +49,8 @@ from werkzeug.routing import BuildError
 from oarepo_runtime.proxies import current_runtime
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
     from invenio_records.systemfields import ConstantField
     from invenio_records_resources.records.api import Record
 
@@ -48,6 +59,104 @@ if TYPE_CHECKING:
 logger = logging.getLogger("oarepo_runtime.info")
 
 
+@dataclasses.dataclass(frozen=True)
+class CachedResponse:
+    """Serialized body of an info endpoint response."""
+
+    body: bytes
+    mimetype: str
+    etag: str
+    expires: float
+
+
+class InfoResponseCache:
+    """Thread-safe, bounded LRU cache of serialized info endpoint responses with a time to live.
+
+    Keys contain the request host and locale, so the number of entries is bounded by ``maxsize``:
+    expired responses are purged whenever a response is stored and the least recently used
+    responses are evicted when the cache is full.
+
+    All caches of the process are cleared by :func:`invalidate_info_cache`, which is
+    called when vocabulary types are created, modified or deleted through the database
+    session of this process. Changes made by other processes become visible after the
+    time to live expires.
+    """
+
+    _instances: ClassVar[weakref.WeakSet[InfoResponseCache]] = weakref.WeakSet()
+
+    def __init__(self, ttl: float = 300, maxsize: int = 256) -> None:
+        """Create an empty cache.
+
+        :param ttl: number of seconds a response is kept, 0 disables the cache.
+        :param maxsize: maximum number of cached responses, 0 disables the cache.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._responses: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._instances.add(self)
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        """Return the cached response, or None if it is not cached or has expired."""
+        with self._lock:
+            response = self._responses.get(key)
+            if response is None:
+                return None
+            if response.expires < time.monotonic():
+                del self._responses[key]
+                return None
+            self._responses.move_to_end(key)
+            return response
+
+    def set(self, key: Hashable, body: bytes, mimetype: str) -> CachedResponse:
+        """Cache the serialized body and return the cached response."""
+        response = CachedResponse(
+            body=body,
+            mimetype=mimetype,
+            etag=hashlib.sha256(body).hexdigest()[:32],
+            expires=time.monotonic() + self.ttl,
+        )
+        if self.ttl > 0 and self.maxsize > 0:
+            with self._lock:
+                self._responses[key] = response
+                self._responses.move_to_end(key)
+                self._purge()
+        return response
+
+    def _purge(self) -> None:
+        """Drop expired responses and the least recently used ones above ``maxsize``, called with the lock held."""
+        now = time.monotonic()
+        for key in [key for key, response in self._responses.items() if response.expires < now]:
+            del self._responses[key]
+        while len(self._responses) > self.maxsize:
+            self._responses.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        with self._lock:
+            return len(self._responses)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._responses.clear()
+
+
+def invalidate_info_cache(*_args: Any) -> None:
+    """Drop cached responses of all info resources of this process."""
+    for cache in list(InfoResponseCache._instances):  # noqa: SLF001
+        cache.clear()
+
+
+try:
+    from invenio_vocabularies.records.models import VocabularyType
+except ImportError:  # pragma: no cover
+    pass
+else:
+    for _event in ("after_insert", "after_update", "after_delete"):
+        sa.event.listen(VocabularyType, _event, invalidate_info_cache)
+
+
 class InfoComponent(Protocol):
     """Info component protocol."""
 
@@ -74,6 +183,21 @@ class InfoConfig(ResourceConfig):
         """Initialize Info config."""
         self.app = app
 
+    @property
+    def cache_ttl(self) -> float:
+        """Seconds a serialized response is kept by the resource, 0 disables the cache."""
+        return cast("float", self.app.config["INFO_ENDPOINT_CACHE_TTL"])
+
+    @property
+    def cache_max_age(self) -> int:
+        """Max age of the responses in the Cache-Control header."""
+        return cast("int", self.app.config["INFO_ENDPOINT_CACHE_MAX_AGE"])
+
+    @property
+    def cache_size(self) -> int:
+        """Maximum number of serialized responses kept by the resource, 0 disables the cache."""
+        return cast("int", self.app.config["INFO_ENDPOINT_CACHE_SIZE"])
+
     @cached_property
     def components(self) -> tuple[type[InfoComponent], ...]:
         """Get the components for the info resource from config."""
@@ -88,7 +212,11 @@ model_view_args = request_parser(from_conf("model_view_args"), location="view_ar
 
 
 class InfoResource(BaseResource):
-    """Info resource."""
+    """Info resource.
+
+    Responses are computed once per locale, host and content type and served
+    as cached bytes with an ETag, so they must not depend on the current user.
+    """
 
     def create_url_rules(self) -> list[dict[str, Any]]:
         """Create the URL rules for the info resource."""
@@ -109,17 +237,43 @@ class InfoResource(BaseResource):
         """Get the components for the info resource from config."""
         return [x(self) for x in self.config.components]
 
+    @cached_property
+    def response_cache(self) -> InfoResponseCache:
+        """Cache of serialized responses of this resource."""
+        return InfoResponseCache(self.config.cache_ttl, self.config.cache_size)
+
+    def cached_response(self, key: tuple, factory: Callable[[], Any], many: bool = False) -> Response:
+        """Return the response with the serialized result of the factory, computing it only on cache miss.
+
+        Conditional requests with a matching ETag get an empty 304 response.
+        """
+        mimetype = resource_requestctx.accept_mimetype
+        full_key = (*key, mimetype, request.host_url, str(get_locale()))
+        cached = self.response_cache.get(full_key)
+        if cached is None:
+            serializer = resource_requestctx.response_handler.serializer
+            body = serializer.serialize_object_list(factory()) if many else serializer.serialize_object(factory())
+            cached = self.response_cache.set(full_key, body.encode() if isinstance(body, str) else body, mimetype)
+
+        response = Response(cached.body, status=200, mimetype=cached.mimetype)
+        response.set_etag(cached.etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = self.config.cache_max_age
+        return response.make_conditional(request)
+
     @response_handler(many=True)
-    def models(self) -> tuple[list[dict], int]:
+    def models(self) -> tuple[Response, int]:
         """Models endpoint."""
-        return self.model_data + self.vocabulary_data, 200
+        return self.cached_response(("models",), lambda: self.model_data + self.vocabulary_data, many=True), 200
 
     @schema_view_args
     @response_handler()
-    def schema(self) -> tuple[dict, int]:
+    def schema(self) -> tuple[Response, int]:
         """Return jsonschema for the current schema."""
         schema = resource_requestctx.view_args["schema"]
-        return current_jsonschemas.get_schema(schema, resolved=True), 200
+        return self.cached_response(
+            ("schema", schema), lambda: current_jsonschemas.get_schema(schema, resolved=True)
+        ), 200
 
     def _get_model_content_types(self, model: Model) -> list[dict]:
         """Get the content types supported by the model.
@@ -242,9 +396,9 @@ class InfoResource(BaseResource):
         data.sort(key=lambda x: x["type"])
         return data
 
-    @cached_property
+    @property
     def vocabulary_data(self) -> list[dict]:
-        """Get the vocabulary data."""
+        """Get the vocabulary data, localized to the current language."""
         ret: list[dict] = []
         try:
             from invenio_vocabularies.contrib.affiliations.api import Affiliation
@@ -381,8 +535,12 @@ class InfoResource(BaseResource):
         return ret
 
     @response_handler()
-    def repository(self) -> tuple[dict, int]:
+    def repository(self) -> tuple[Response, int]:
         """Repository endpoint."""
+        return self.cached_response(("repository",), self.repository_data), 200
+
+    def repository_data(self) -> dict:
+        """Get the repository data."""
         endpoint = request.endpoint
         self_url = url_for(endpoint, _external=True) if endpoint else request.url
         links = {
@@ -417,7 +575,7 @@ class InfoResource(BaseResource):
             ret["default_model"] = self.model_data[0]["name"]
 
         self.call_components("repository", data=ret)
-        return ret, 200
+        return ret
 
 
 def create_wellknown_blueprint(app: Flask) -> Blueprint:
@@ -432,9 +590,7 @@ def create_wellknown_blueprint(app: Flask) -> Blueprint:
 
 def get_package_version(package_name: str) -> str | None:
     """Get package version."""
-    from pkg_resources import get_distribution
-
-    return re.sub(r"\+.*", "", get_distribution(package_name).version)
+    return re.sub(r"\+.*", "", version(package_name))
 
 
 def replace_path_in_url(url: str, path: str) -> str:
@@ -461,8 +617,6 @@ def _add_feature_if_can_import(feature: str, module: str) -> list[str]:
 def to_current_language(data: dict | Any) -> Any:
     """Convert data to current language."""
     if isinstance(data, dict):
-        from flask_babel import get_locale
-
         current_locale = get_locale()
         if current_locale:
             return data.get(current_locale.language)
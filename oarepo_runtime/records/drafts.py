@@ -10,20 +10,31 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from invenio_db import db
+
+from oarepo_runtime.proxies import current_runtime
+from oarepo_runtime.request_cache import request_cache
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from invenio_drafts_resources.records.api import Record
     from invenio_records.api import Record as RecordBase
 
-from oarepo_runtime.proxies import current_runtime
-
 
 def has_draft(record: RecordBase) -> bool:
     """Check if record has draft."""
     return get_draft(record) is not None
 
 
+def _get_draft_cls(record: RecordBase) -> type[Record] | None:
+    """Return the draft class of the service of the record."""
+    record_service = current_runtime.get_record_service_for_record(record)
+    return getattr(record_service.config, "draft_cls", None)
+
+
 def get_draft(record: RecordBase) -> RecordBase | None:
     """Get the draft of a published record, if it exists.
 
@@ -33,23 +44,83 @@ def get_draft(record: RecordBase) -> RecordBase | None:
     - if it has a has_draft attribute (that means, it is a published record)
     - the has_draft is True meaning that the record has a draft ('edit metadata' button)
     - if the record has a parent and the parent has a draft (edited 'new version' of the record)
+
+    Within a read-only request, drafts (and their absence) are cached, see ``get_drafts``.
     """
     if getattr(record, "is_draft", False):
         return record
     if not hasattr(record, "parent") or not hasattr(record, "has_draft"):
         return None
 
-    record_service = current_runtime.get_record_service_for_record(record)
+    parent = getattr(record, "parent", None)
+    if parent is None:
+        return None  # pragma: no cover  # just a safety check, parent should be there
+    draft_cls = _get_draft_cls(record)
+    if draft_cls is None:
+        return None  # pragma: no cover  # just a safety check, draft_cls should be there
+
+    cache = request_cache("drafts", read_only=True)
+    if cache is not None and (draft_cls, parent.id) in cache:
+        return cache[draft_cls, parent.id]
+    # the first non-deleted draft of the parent, None if no draft is found
+    draft = next(draft_cls.get_records_by_parent(parent, with_deleted=False), None)
+    if cache is not None:
+        cache[draft_cls, parent.id] = draft
+    return draft
+
+
+def get_drafts(records: Iterable[RecordBase]) -> list[RecordBase | None]:
+    """Get drafts of several records at once, in the same way as ``get_draft``.
+
+    Drafts of published records are fetched with a single query per draft class.
+    Within a read-only request the drafts are cached, so that subsequent calls
+    to ``get_draft`` and ``has_draft`` (for example when rendering links of search
+    results) do not query the database again.
 
-    try:
-        parent = getattr(record, "parent", None)
+    :return: list of drafts (or None if the record has no draft) in the order of the records
+    """
+    records = list(records)
+    drafts: list[RecordBase | None] = [None] * len(records)
+    cache = request_cache("drafts", read_only=True)
+    # draft class => parent id => (parent, indices of records with this parent)
+    to_fetch: dict[type[Record], dict[Any, tuple[Any, list[int]]]] = {}
+
+    for idx, record in enumerate(records):
+        if getattr(record, "is_draft", False):
+            drafts[idx] = record
+            continue
+        parent = getattr(record, "parent", None) if hasattr(record, "has_draft") else None
         if parent is None:
-            return None  # pragma: no cover  # just a safety check, parent should be there
-        draft_cls: Record | None = getattr(record_service.config, "draft_cls", None)
+            continue
+        draft_cls = _get_draft_cls(record)
         if draft_cls is None:
-            return None  # pragma: no cover  # just a safety check, draft_cls should be there
+            continue  # pragma: no cover  # just a safety check, draft_cls should be there
+        if cache is not None and (draft_cls, parent.id) in cache:
+            drafts[idx] = cache[draft_cls, parent.id]
+            continue
+        to_fetch.setdefault(draft_cls, {}).setdefault(parent.id, (parent, []))[1].append(idx)
 
-        return next(draft_cls.get_records_by_parent(parent, with_deleted=False))
-    except StopIteration:
-        # no draft found
-        return None
+    for draft_cls, parents in to_fetch.items():
+        found = _fetch_drafts_by_parents(draft_cls, parents)
+        for parent_id, (_parent, indices) in parents.items():
+            draft = found.get(parent_id)
+            if cache is not None:
+                cache[draft_cls, parent_id] = draft
+            for idx in indices:
+                drafts[idx] = draft
+    return drafts
+
+
+def _fetch_drafts_by_parents(draft_cls: type[Record], parents: dict[Any, tuple[Any, list[int]]]) -> dict[Any, Record]:
+    """Fetch non-deleted drafts of the parents in a single query, returning a mapping parent id => draft."""
+    model_cls = draft_cls.model_cls
+    found: dict[Any, Record] = {}
+    with db.session.no_autoflush:
+        models = model_cls.query.filter(
+            model_cls.parent_id.in_(list(parents)),
+            model_cls.is_deleted.is_(False),
+        )
+        for model in models:
+            if model.parent_id not in found:
+                found[model.parent_id] = draft_cls(model.data, model=model, parent=parents[model.parent_id][0])
+    return found
@@ -10,14 +10,19 @@
 
 from __future__ import annotations
 
-import inspect
+import copy
+import dataclasses
+import hashlib
+import json
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal
 
 from invenio_search import current_search_client
 from invenio_search.engine import dsl
 from invenio_search.utils import build_alias_name
 
+from oarepo_runtime.records.systemfields.base import get_class_fields
 from oarepo_runtime.records.systemfields.mapping import MappingSystemFieldMixin
 
 if TYPE_CHECKING:
@@ -81,4 +86,286 @@ def get_mapping_fields(
     record_class: type[RecordBase],
 ) -> Iterable[MappingSystemFieldMixin]:
     """Get all mapping fields from the record class."""
-    return (attr for _, attr in inspect.getmembers(record_class, lambda x: isinstance(x, MappingSystemFieldMixin)))
+    return (attr for _, attr in get_class_fields(record_class, MappingSystemFieldMixin))
+
+
+def merge_mappings(target: dict, source: dict) -> dict:
+    """Deep merge the source mapping (or settings) into the target, values of source take precedence."""
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge_mappings(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+    return target
+
+
+def _dynamic_template_key(template: dict) -> Any:
+    """Return the name of a dynamic template, or the whole template if it is not named."""
+    if len(template) == 1:
+        return next(iter(template))
+    return repr(sorted(template.items()))
+
+
+def merge_dynamic_templates(target: list, source: Iterable[dict]) -> list:
+    """Merge dynamic templates, templates of source replace those with the same name in target."""
+    positions = {_dynamic_template_key(template): idx for idx, template in enumerate(target)}
+    for template in source:
+        key = _dynamic_template_key(template)
+        if key in positions:
+            target[positions[key]] = copy.deepcopy(template)
+        else:
+            positions[key] = len(target)
+            target.append(copy.deepcopy(template))
+    return target
+
+
+def _flatten_settings(settings: dict, prefix: str = "") -> dict[str, str]:
+    """Flatten settings to dotted keys with string values, as returned by the search engine."""
+    ret: dict[str, str] = {}
+    for key, value in settings.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            ret.update(_flatten_settings(value, f"{path}."))
+        elif isinstance(value, list):
+            ret[path] = str([str(v) for v in value])
+        else:
+            ret[path] = str(value).lower() if isinstance(value, bool) else str(value)
+    return ret
+
+
+def _normalize_settings(settings: dict) -> dict[str, str]:
+    """Flatten settings and prefix them with 'index.' like the settings of a live index."""
+    return {
+        key if key.startswith("index.") else f"index.{key}": value for key, value in _flatten_settings(settings).items()
+    }
+
+
+@dataclasses.dataclass(frozen=True)
+class MappingChange:
+    """A difference between the desired and the live mapping of an index."""
+
+    index: str
+    kind: Literal["settings", "mapping", "dynamic_templates"]
+    path: str
+    old: Any
+    new: Any
+
+    def __str__(self) -> str:
+        """Return a human readable description of the change."""
+        if self.old is None:
+            return f"{self.index}: add {self.kind} {self.path} = {self.new!r}"
+        return f"{self.index}: change {self.kind} {self.path} from {self.old!r} to {self.new!r}"
+
+
+def _diff_properties(index: str, desired: dict, live: dict, path: str = "") -> list[MappingChange]:
+    changes: list[MappingChange] = []
+    for key, value in desired.items():
+        key_path = f"{path}.{key}" if path else key
+        live_value = live.get(key)
+        if isinstance(value, dict) and isinstance(live_value, dict):
+            if "properties" in value and "type" not in live_value:
+                # the get mapping api omits the default "object" type of fields with properties
+                live_value = {"type": "object", **live_value}
+            changes.extend(_diff_properties(index, value, live_value, key_path))
+        elif value != live_value:
+            changes.append(MappingChange(index, "mapping", key_path, live_value, value))
+    return changes
+
+
+MAPPING_FINGERPRINTS_META_KEY = "oarepo_mapping_fingerprints"
+"""Key of the index mapping ``_meta`` holding fingerprints of applied mapping updates, per source."""
+
+
+def mapping_fingerprint(settings: dict, properties: dict, dynamic_templates: list) -> str:
+    """Return a stable fingerprint of the desired settings, mapping properties and dynamic templates."""
+    serialized = json.dumps(
+        {"settings": settings, "properties": properties, "dynamic_templates": dynamic_templates},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+@dataclasses.dataclass
+class IndexMappingUpdate:
+    """Settings, mapping and dynamic templates to be applied to a single index.
+
+    When the update is applied, its fingerprint is stored in the ``_meta`` of the index
+    mapping under the name of its source. If the stored fingerprint matches on the next
+    run, the index is not compared nor modified.
+    """
+
+    index: str
+    settings: dict = dataclasses.field(default_factory=dict)
+    properties: dict = dataclasses.field(default_factory=dict)
+    dynamic_templates: list = dataclasses.field(default_factory=list)
+    source: str = "default"
+    """Name of the source of the update, updates of different sources are fingerprinted separately."""
+
+    @property
+    def fingerprint(self) -> str:
+        """Return the fingerprint of the desired settings, mapping and dynamic templates."""
+        return mapping_fingerprint(self.settings, self.properties, self.dynamic_templates)
+
+    def add(self, settings: dict | None, mapping: dict | None, dynamic_templates: list | None = None) -> None:
+        """Merge settings, mapping properties and dynamic templates of a field into this update."""
+        if settings:
+            merge_mappings(self.settings, settings)
+        if mapping:
+            merge_mappings(self.properties, mapping)
+        if dynamic_templates:
+            merge_dynamic_templates(self.dynamic_templates, dynamic_templates)
+
+    def diff(self, live_settings: dict, live_mapping: dict, index: str | None = None) -> list[MappingChange]:
+        """Return the changes of the live index needed to apply this update.
+
+        :param live_settings: settings of the live index, as returned by the get settings api
+        :param live_mapping: mapping of the live index, as returned by the get mapping api
+        :param index: name of the concrete index the changes are reported for, defaults to the update's index
+        """
+        index = index or self.index
+        changes: list[MappingChange] = []
+
+        flat_live_settings = _flatten_settings(live_settings)
+        for key, value in _normalize_settings(self.settings).items():
+            if flat_live_settings.get(key) != value:
+                changes.append(MappingChange(index, "settings", key, flat_live_settings.get(key), value))
+
+        changes.extend(_diff_properties(index, self.properties, live_mapping.get("properties", {})))
+
+        live_templates = {
+            _dynamic_template_key(template): template for template in live_mapping.get("dynamic_templates", [])
+        }
+        for template in self.dynamic_templates:
+            key = _dynamic_template_key(template)
+            if live_templates.get(key) != template:
+                changes.append(MappingChange(index, "dynamic_templates", str(key), live_templates.get(key), template))
+        return changes
+
+    def apply(self, client: Any, dry_run: bool = False, force: bool = False) -> list[MappingChange]:
+        """Apply the changes to all concrete indices behind the index (alias) and return them.
+
+        Settings are changed with a single close/open of an index and only if they differ
+        from its live settings. Mapping, dynamic templates and the fingerprint of the update
+        are sent in a single request per index. If the fingerprints stored in all the indices
+        match, they are left untouched after a single request reading their mappings.
+
+        :param client: search client
+        :param dry_run: only compute the changes, do not modify the indices
+        :param force: compare the indices with the update even if the fingerprints match
+        """
+        live_mappings = {
+            index: value.get("mappings", {})
+            for index, value in dict(client.indices.get_mapping(index=self.index)).items()
+        }
+        fingerprint = self.fingerprint
+        if not force and all(
+            _stored_fingerprints(mapping).get(self.source) == fingerprint for mapping in live_mappings.values()
+        ):
+            return []
+
+        live_settings = {
+            index: value.get("settings", {})
+            for index, value in dict(client.indices.get_settings(index=self.index)).items()
+        }
+        changes: list[MappingChange] = []
+        for index, live_mapping in live_mappings.items():
+            index_changes = self.diff(live_settings.get(index, {}), live_mapping, index)
+            changes.extend(index_changes)
+            if not dry_run:
+                self._apply_index(client, index, live_mapping, index_changes)
+        return changes
+
+    def _apply_index(self, client: Any, index: str, live_mapping: dict, changes: list[MappingChange]) -> None:
+        """Apply the changes of a single concrete index and store the fingerprint of the update in it."""
+        if any(change.kind == "settings" for change in changes):
+            client.indices.close(index=index)
+            try:
+                client.indices.put_settings(index=index, body=self.settings)
+            finally:
+                client.indices.open(index=index)
+
+        body: dict[str, Any] = {}
+        if any(change.kind == "mapping" for change in changes):
+            body["properties"] = self.properties
+        if any(change.kind == "dynamic_templates" for change in changes):
+            # dynamic templates are replaced as a whole, so keep the ones that are already there
+            body["dynamic_templates"] = merge_dynamic_templates(
+                copy.deepcopy(live_mapping.get("dynamic_templates", [])), self.dynamic_templates
+            )
+        # _meta is replaced as a whole, so keep the entries of other sources
+        live_meta = live_mapping.get("_meta", {})
+        body["_meta"] = {
+            **live_meta,
+            MAPPING_FINGERPRINTS_META_KEY: {**_stored_fingerprints(live_mapping), self.source: self.fingerprint},
+        }
+        client.indices.put_mapping(index=index, body=body)
+
+
+def _stored_fingerprints(live_mapping: dict) -> dict:
+    """Return the fingerprints of applied mapping updates stored in the ``_meta`` of a live index mapping."""
+    return live_mapping.get("_meta", {}).get(MAPPING_FINGERPRINTS_META_KEY, {})
+
+
+class MappingUpdatePlan:
+    """Plan of mapping updates of search indices.
+
+    Mappings of all fields of all record classes are merged per index, so that each
+    index is updated by at most one ``put_mapping`` request and closed at most once for
+    settings changes. Independent indices are updated in parallel.
+    """
+
+    def __init__(self, source: str = "default") -> None:
+        """Create an empty plan.
+
+        :param source: name under which fingerprints of the updates are stored in the indices
+        """
+        self.source = source
+        self.updates: dict[str, IndexMappingUpdate] = {}
+
+    def index_update(self, index: dsl.Index) -> IndexMappingUpdate:
+        """Return the update of the (prefixed) index, creating it if needed."""
+        name = prefixed_index(index)._name  # noqa: SLF001
+        update = self.updates.get(name)
+        if update is None:
+            update = self.updates[name] = IndexMappingUpdate(name, source=self.source)
+        return update
+
+    def add_record_class(self, record_class: type[RecordBase]) -> None:
+        """Add mapping system fields of the record class to the plan."""
+        index = getattr(record_class, "index", None)
+        if not index:
+            return
+        fields = list(get_mapping_fields(record_class))
+        if not fields:
+            return
+        update = self.index_update(index)
+        for fld in fields:
+            update.add(fld.mapping_settings, fld.mapping, fld.dynamic_templates)
+
+    def execute(self, dry_run: bool = False, workers: int = 4, force: bool = False) -> list[MappingChange]:
+        """Apply the plan and return the changes made (or to be made in case of a dry run).
+
+        Indices whose stored fingerprint matches the update are skipped.
+
+        :param dry_run: only compute the changes against the live indices, do not modify them
+        :param workers: maximum number of indices updated in parallel
+        :param force: compare all indices, even those with a matching fingerprint
+        :raise search.RequestError: If there is an error while updating an index.
+        """
+        updates = [
+            update
+            for update in self.updates.values()
+            if update.settings or update.properties or update.dynamic_templates
+        ]
+        if not updates:
+            return []
+        # the client proxy can not be resolved in worker threads which have no application context
+        client = current_search_client._get_current_object()  # noqa: SLF001
+        if workers <= 1 or len(updates) == 1:
+            results = [update.apply(client, dry_run, force) for update in updates]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda update: update.apply(client, dry_run, force), updates))
+        return [change for changes in results for change in changes]
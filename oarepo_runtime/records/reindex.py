@@ -0,0 +1,525 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Reindexing of records into a new versioned index without downtime.
+
+The records are copied into a new index while the old one keeps serving
+searches and writes through its aliases. When the copy is finished, all
+aliases of the old index are moved to the new one in a single atomic request,
+the records modified during the copy are copied again and the records deleted
+during the copy are removed from the new index.
+
+The state of the reindex is kept in the ``_meta`` of the mapping of the new
+index, so that an interrupted reindex continues where it stopped when it is
+started again.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Literal, override
+
+from flask import current_app
+from invenio_indexer.api import RecordIndexer
+from invenio_search import current_search, current_search_client
+from invenio_search.engine import search
+from invenio_search.utils import build_alias_name, build_index_name, timestamp_suffix
+from sqlalchemy.orm.exc import NoResultFound
+
+from oarepo_runtime.records.mapping import (
+    MAPPING_FINGERPRINTS_META_KEY,
+    MappingUpdatePlan,
+    merge_dynamic_templates,
+    merge_mappings,
+)
+from oarepo_runtime.records.systemfields.custom_fields import add_relation_fields_mapping
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from invenio_records.api import RecordBase
+
+REINDEX_META_KEY = "oarepo_reindex"
+"""Key of the mapping ``_meta`` of the new index holding the state of the reindex."""
+
+MAPPING_SOURCE = "all_fields"
+"""Source name of the mapping fingerprint stored in the new index."""
+
+BULK_SETTINGS = {"index": {"refresh_interval": "-1", "number_of_replicas": 0}}
+"""Settings of the new index while the records are copied into it."""
+
+HTTP_CONFLICT = 409
+HTTP_NOT_FOUND = 404
+
+type ReindexSource = Literal["search", "db"]
+type ProgressCallback = Callable[["ReindexProgress"], None]
+
+
+class ReindexError(Exception):
+    """Raised when an index can not be reindexed."""
+
+
+class ReindexProgress:
+    """Progress of a reindex, passed to the progress callback."""
+
+    def __init__(self, alias: str, phase: str, done: int = 0, total: int | None = None) -> None:
+        """Create the progress report."""
+        self.alias = alias
+        self.phase = phase
+        self.done = done
+        self.total = total
+
+    def __str__(self) -> str:
+        """Return a human readable progress message."""
+        if self.total:
+            return f"{self.alias}: {self.phase} {self.done}/{self.total} ({100 * self.done // self.total}%)"
+        if self.done:
+            return f"{self.alias}: {self.phase} {self.done}"
+        return f"{self.alias}: {self.phase}"
+
+
+class Throttle:
+    """Thread-safe limiter of the number of processed documents per second."""
+
+    def __init__(self, per_second: float | None) -> None:
+        """Create the limiter, None or 0 means no limit."""
+        self.per_second = per_second
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def wait(self, count: int) -> None:
+        """Wait until ``count`` more documents can be processed."""
+        if not self.per_second:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + count / self.per_second
+        if start > now:
+            time.sleep(start - now)
+
+
+class TargetIndexer(RecordIndexer):
+    """Record indexer sending all records to a given (already prefixed) index."""
+
+    def __init__(self, target: str, **kwargs: Any) -> None:
+        """Create the indexer."""
+        super().__init__(record_to_index=lambda _record: target, **kwargs)
+        self.target = target
+
+    @override
+    def _prepare_index(self, index: str) -> str:
+        return self.target
+
+
+class ReindexJob:
+    """Reindex of the search index of a record class into a new versioned index.
+
+    :param record_class: record (or draft) class whose index is reindexed
+    :param source: ``search`` copies the documents of the old index by sliced ``_reindex``
+        requests run by the search engine, ``db`` indexes the records from the database
+    :param slices: number of slices the copy is split into and run in parallel
+    :param requests_per_second: throttling of the copy in documents per second
+    :param batch_size: number of documents in a single bulk request (or reindex batch)
+    :param progress: callback called with :class:`ReindexProgress` reports
+    :param updated_field: indexed field with the time of the last modification, used to
+        copy the records modified during the copy after the aliases have been swapped
+    :param poll_interval: seconds between checks of the server-side reindex tasks
+    """
+
+    def __init__(  # noqa: PLR0913 configuration of the reindex
+        self,
+        record_class: type[RecordBase],
+        *,
+        source: ReindexSource = "search",
+        slices: int = 4,
+        requests_per_second: float | None = None,
+        batch_size: int = 500,
+        progress: ProgressCallback | None = None,
+        updated_field: str = "updated",
+        poll_interval: float = 5,
+    ) -> None:
+        """Create the job, nothing is modified until :meth:`run` is called."""
+        index = getattr(record_class, "index", None)
+        if index is None:
+            raise ReindexError(f"Record class {record_class.__name__} has no index")
+        self.record_class = record_class
+        self.index_name: str = index._name  # noqa: SLF001
+        self.alias = build_alias_name(self.index_name)
+        self.source = source
+        self.slices = max(1, slices)
+        self.throttle = Throttle(requests_per_second)
+        self.requests_per_second = requests_per_second
+        self.batch_size = batch_size
+        self.progress = progress or (lambda _progress: None)
+        self.updated_field = updated_field
+        self.poll_interval = poll_interval
+        # the client proxy can not be resolved in worker threads which have no application context
+        self.client = current_search_client._get_current_object()  # noqa: SLF001
+        self._state_lock = threading.Lock()
+        self._registered_settings: dict[str, Any] | None = None
+        self.state: dict[str, Any] = {}
+        self.target: str | None = None
+
+    #
+    # Public API
+    #
+    def run(self, delete_old: bool = False) -> str:
+        """Run (or resume) the reindex and return the name of the new index.
+
+        :param delete_old: delete the old index after the aliases have been swapped
+        """
+        current = self.current_index()
+        self.target = self.find_unfinished_target(current) or self.create_target(current)
+        old_index = self.state["source_index"]
+
+        if self.state["status"] == "created":
+            self._save_state(status="copying", started=datetime.now(UTC).isoformat())
+        if self.state["status"] == "copying":
+            self.copy()
+            self._save_state(status="copied")
+        if self.state["status"] == "copied":
+            self.finish_target()
+            # documents created after the swap are written to the new index only,
+            # the time is taken before the swap so that they are not treated as deleted
+            swapped = datetime.now(UTC).isoformat()
+            self.swap_aliases(old_index)
+            self._save_state(status="swapped", swapped=swapped)
+        if self.state["status"] == "swapped":
+            self.catch_up(old_index)
+            self._save_state(status="done")
+
+        if delete_old and self.client.indices.exists(index=old_index):
+            self.client.indices.delete(index=old_index)
+        self.progress(ReindexProgress(self.alias, f"done, using index {self.target}"))
+        return self.target
+
+    def current_index(self) -> str:
+        """Return the name of the index the alias points to."""
+        if not self.client.indices.exists_alias(name=self.alias):
+            raise ReindexError(
+                f"{self.alias} is not an alias, the index needs to be recreated by 'invenio index init' with suffixes"
+            )
+        indices = list(self.client.indices.get_alias(name=self.alias))
+        if len(indices) != 1:
+            raise ReindexError(f"Alias {self.alias} points to {len(indices)} indices, expected exactly one")
+        return indices[0]
+
+    def find_unfinished_target(self, current: str) -> str | None:
+        """Return the new index of an interrupted reindex, if there is one.
+
+        :param current: name of the index the alias points to, which is either the source
+            of the interrupted reindex or its target if the aliases have already been swapped
+        """
+        mappings = self.client.indices.get_mapping(index=f"{self.alias}-*", allow_no_indices=True)
+        for name, value in sorted(mappings.items(), reverse=True):
+            state = value.get("mappings", {}).get("_meta", {}).get(REINDEX_META_KEY)
+            if not state or state.get("status") == "done":
+                continue
+            if state.get("source_index") == current or name == current:
+                self.state = state
+                self.progress(ReindexProgress(self.alias, f"resuming reindex into {name} ({state['status']})"))
+                return name
+        return None
+
+    def create_target(self, old_index: str) -> str:
+        """Create the new versioned index with the merged mapping and return its name."""
+        target = build_index_name(self.index_name, suffix=timestamp_suffix())
+        body = self.target_body()
+        self.state = {"source_index": old_index, "status": "created", "source": self.source, "checkpoints": {}}
+        body["mappings"].setdefault("_meta", {})[REINDEX_META_KEY] = self.state
+        # copy faster, the original settings are restored when the copy is finished
+        body["settings"] = merge_mappings(body.get("settings", {}), BULK_SETTINGS)
+        self.client.indices.create(index=target, body=body)
+        self.progress(ReindexProgress(self.alias, f"created index {target}"))
+        return target
+
+    def target_body(self) -> dict[str, Any]:
+        """Return the body of the new index, the registered mapping merged with system fields mappings."""
+        try:
+            mapping_path = current_search.mappings[self.index_name]
+        except KeyError as e:
+            raise ReindexError(f"No mapping is registered for index {self.index_name}") from e
+        with open(mapping_path) as f:  # noqa: PTH123
+            body: dict[str, Any] = json.load(f)
+
+        plan = MappingUpdatePlan(source=MAPPING_SOURCE)
+        plan.add_record_class(self.record_class)
+        add_relation_fields_mapping(plan, self.record_class)
+        mappings = body.setdefault("mappings", {})
+        for update in plan.updates.values():
+            if update.settings:
+                merge_mappings(body.setdefault("settings", {}), update.settings)
+            if update.properties:
+                merge_mappings(mappings.setdefault("properties", {}), update.properties)
+            if update.dynamic_templates:
+                mappings["dynamic_templates"] = merge_dynamic_templates(
+                    mappings.get("dynamic_templates", []), update.dynamic_templates
+                )
+            mappings.setdefault("_meta", {})[MAPPING_FINGERPRINTS_META_KEY] = {MAPPING_SOURCE: update.fingerprint}
+        self._registered_settings = copy.deepcopy(body.get("settings", {}))
+        return body
+
+    def copy(self) -> None:
+        """Copy all documents into the new index."""
+        if self.source == "db":
+            self.copy_from_db()
+        else:
+            self.copy_from_search(self.state["source_index"])
+
+    def finish_target(self) -> None:
+        """Restore the settings changed for the copy, refresh the new index and verify it.
+
+        :raises ReindexError: if the new index misses documents, the aliases must not be swapped then
+        """
+        index_settings = self._registered_index_settings()
+        self.client.indices.put_settings(
+            index=self.target,
+            body={
+                "index": {
+                    "refresh_interval": index_settings.get("refresh_interval"),
+                    "number_of_replicas": index_settings.get("number_of_replicas"),
+                }
+            },
+        )
+        self.client.indices.refresh(index=self.target)
+        self.verify_target()
+
+    def verify_target(self) -> None:
+        """Check that the new index contains all documents not modified since the copy started.
+
+        Documents modified or created later are copied after the swap. Documents deleted
+        during the copy might still be in the new index, so it may contain more documents.
+
+        :raises ReindexError: if the new index contains fewer documents than the source
+        """
+        not_modified = {"query": {"range": {self.updated_field: {"lt": self.state["started"]}}}}
+        if self.source == "db":
+            source_count = len(self._record_ids(modified_before=datetime.fromisoformat(self.state["started"])))
+        else:
+            source_count = self.client.count(index=self.state["source_index"], body=not_modified)["count"]
+        target_count = self.client.count(index=self.target, body=not_modified)["count"]
+        self.progress(ReindexProgress(self.alias, f"copied {target_count} of {source_count} documents"))
+        if target_count < source_count:
+            raise ReindexError(
+                f"Index {self.target} contains {target_count} documents not modified since the copy started, "
+                f"but the source contains {source_count}; the aliases of {self.alias} were not moved"
+            )
+
+    def swap_aliases(self, old_index: str) -> None:
+        """Move all aliases of the old index to the new one in a single atomic request."""
+        aliases = self.client.indices.get_alias(index=old_index).get(old_index, {}).get("aliases", {})
+        actions: list[dict[str, Any]] = []
+        for alias, alias_definition in aliases.items():
+            actions.append({"remove": {"index": old_index, "alias": alias}})
+            actions.append({"add": {"index": self.target, "alias": alias, **alias_definition}})
+        self.client.indices.update_aliases(body={"actions": actions})
+        self.progress(ReindexProgress(self.alias, f"aliases {', '.join(sorted(aliases))} moved to {self.target}"))
+
+    def catch_up(self, old_index: str) -> None:
+        """Copy records modified and remove records deleted during the copy, which were written to the old index."""
+        started = datetime.fromisoformat(self.state["started"]) - timedelta(minutes=1)
+        if self.source == "db":
+            self.copy_from_db(updated_since=started)
+            self.remove_deleted(set(self._record_ids()))
+        elif self.client.indices.exists(index=old_index):
+            self.copy_from_search(old_index, query={"range": {self.updated_field: {"gte": started.isoformat()}}})
+            self.remove_deleted(self._index_ids(old_index))
+
+    def remove_deleted(self, existing_ids: set[str]) -> None:
+        """Remove documents that are not among the existing ids from the new index.
+
+        Only documents written before the swap are considered, documents written
+        later were created through the aliases of the new index.
+        """
+        query = {"range": {self.updated_field: {"lt": self.state["swapped"]}}}
+        deleted = sorted(self._index_ids(self.target, query) - existing_ids)
+        for batch in _batches(deleted, self.batch_size):
+            self._bulk([{"_op_type": "delete", "_index": self.target, "_id": doc_id} for doc_id in batch])
+        if deleted:
+            self.progress(ReindexProgress(self.alias, f"removed {len(deleted)} deleted documents"))
+
+    def _index_ids(self, index: str, query: dict | None = None) -> set[str]:
+        body: dict[str, Any] = {"_source": False, "query": query or {"match_all": {}}}
+        return {hit["_id"] for hit in search.helpers.scan(self.client, index=index, query=body, size=self.batch_size)}
+
+    #
+    # Copy from the old index
+    #
+    def copy_from_search(self, source_index: str, query: dict | None = None) -> None:
+        """Copy documents of the source index by a sliced server-side reindex.
+
+        Documents keep their versions and existing newer documents are not overwritten,
+        so the copy can be safely restarted.
+        """
+        task_id = self.state.get("task") if query is None else None
+        if task_id:
+            try:
+                task = self.client.tasks.get(task_id=task_id)
+            except search.exceptions.NotFoundError:
+                # the task result is no longer available, copy again
+                task = {"completed": True, "error": "not found"}
+            if not task.get("completed"):
+                self._wait_for_task(task_id)
+                return
+            if not task.get("error") and not task.get("response", {}).get("failures"):
+                return
+
+        body: dict[str, Any] = {
+            "conflicts": "proceed",
+            "source": {"index": source_index, "size": self.batch_size},
+            "dest": {"index": self.target, "version_type": "external"},
+        }
+        if query is not None:
+            body["source"]["query"] = query
+        response = self.client.reindex(
+            body=body,
+            slices=self.slices,
+            requests_per_second=self.requests_per_second or -1,
+            wait_for_completion=False,
+        )
+        if query is None:
+            self._save_state(task=response["task"])
+        self._wait_for_task(response["task"])
+
+    def _wait_for_task(self, task_id: str) -> None:
+        while True:
+            task = self.client.tasks.get(task_id=task_id)
+            status = task.get("task", {}).get("status", {})
+            done = status.get("created", 0) + status.get("updated", 0) + status.get("version_conflicts", 0)
+            self.progress(ReindexProgress(self.alias, "copying", done, status.get("total")))
+            if task.get("completed"):
+                failures = task.get("error") or task.get("response", {}).get("failures")
+                if failures:
+                    raise ReindexError(f"Reindex of {self.alias} failed: {failures}")
+                return
+            time.sleep(self.poll_interval)
+
+    #
+    # Copy from the database
+    #
+    def copy_from_db(self, updated_since: datetime | None = None) -> None:
+        """Index records from the database into the new index, in parallel slices.
+
+        Each slice stores the id of its last indexed record, so that an interrupted copy
+        continues after it. Modified records are indexed by catch up with ``updated_since``.
+        """
+        ids = self._record_ids(updated_since)
+        total = len(ids)
+        slice_size = -(-total // self.slices) if total else 0
+        slices = {str(idx): ids[idx * slice_size : (idx + 1) * slice_size] for idx in range(self.slices)}
+        checkpoints = self.state.get("checkpoints", {}) if updated_since is None else {}
+        done = [0]
+        app = current_app._get_current_object()  # noqa: SLF001
+
+        def run_slice(slice_id: str, slice_ids: list[str]) -> None:
+            checkpoint = checkpoints.get(slice_id)
+            if checkpoint in slice_ids:
+                skipped = slice_ids.index(checkpoint) + 1
+                slice_ids = slice_ids[skipped:]
+                with self._state_lock:
+                    done[0] += skipped
+            with app.app_context():
+                for batch in _batches(slice_ids, self.batch_size):
+                    self.throttle.wait(len(batch))
+                    self._index_batch(batch)
+                    with self._state_lock:
+                        done[0] += len(batch)
+                        if updated_since is None:
+                            checkpoints[slice_id] = batch[-1]
+                            self._save_state(checkpoints=checkpoints)
+                        self.progress(ReindexProgress(self.alias, "indexing", done[0], total))
+
+        if self.slices == 1:
+            run_slice("0", slices["0"])
+        else:
+            with ThreadPoolExecutor(max_workers=self.slices) as executor:
+                for future in [executor.submit(run_slice, *item) for item in slices.items()]:
+                    future.result()
+
+    def _record_ids(
+        self, updated_since: datetime | None = None, modified_before: datetime | None = None
+    ) -> list[str]:
+        """Return sorted ids of the records that are not deleted, optionally filtered by their modification time."""
+        model_cls = self.record_class.model_cls
+        query = model_cls.query.with_entities(model_cls.id)
+        if hasattr(model_cls, "is_deleted"):
+            query = query.filter(model_cls.is_deleted.is_(False))
+        if updated_since is not None:
+            query = query.filter(model_cls.updated >= updated_since.astimezone(UTC).replace(tzinfo=None))
+        if modified_before is not None:
+            query = query.filter(model_cls.updated < modified_before.astimezone(UTC).replace(tzinfo=None))
+        return [str(row[0]) for row in query.order_by(model_cls.id)]
+
+    def _index_batch(self, ids: list[str]) -> None:
+        indexer = self._indexer()
+        actions = []
+        for record_id in ids:
+            try:
+                actions.append(indexer._index_action({"id": record_id}))  # noqa: SLF001
+            except NoResultFound:
+                # deleted since the ids were listed, removed from the new index by catch up
+                continue
+        self._bulk(actions)
+
+    def _bulk(self, actions: list[dict]) -> None:
+        """Send the bulk actions, raising on failures.
+
+        Version conflicts (a newer version is already indexed) and deletes of missing
+        documents are expected when records are modified during the reindex and are ignored.
+        """
+        _, errors = search.helpers.bulk(self.client, actions, raise_on_error=False, raise_on_exception=True)
+        failures = [
+            error
+            for error in errors
+            for op_type, result in error.items()
+            if result.get("status") != HTTP_CONFLICT
+            and not (op_type == "delete" and result.get("status") == HTTP_NOT_FOUND)
+        ]
+        if failures:
+            raise ReindexError(f"Indexing into {self.target} failed for {len(failures)} documents: {failures[:5]}")
+
+    def _indexer(self) -> RecordIndexer:
+        return TargetIndexer(
+            self.target,
+            search_client=self.client,
+            record_cls=self.record_class,
+            version_type="external_gte",
+        )
+
+    #
+    # State
+    #
+    def _save_state(self, **changes: Any) -> None:
+        """Store the state of the reindex in the mapping of the new index."""
+        self.state.update(changes)
+        meta = self.client.indices.get_mapping(index=self.target)[self.target]["mappings"].get("_meta", {})
+        meta[REINDEX_META_KEY] = self.state
+        self.client.indices.put_mapping(index=self.target, body={"_meta": meta})
+
+    def _registered_index_settings(self) -> dict[str, Any]:
+        if self._registered_settings is None:
+            # resumed reindex, the registered mapping has not been loaded yet
+            self.target_body()
+        settings = self._registered_settings or {}
+        index_settings = dict(settings.get("index", {}))
+        for key in ("refresh_interval", "number_of_replicas"):
+            if key in settings:
+                index_settings[key] = settings[key]
+        return index_settings
+
+
+def _batches(ids: list[str], size: int) -> Iterator[list[str]]:
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
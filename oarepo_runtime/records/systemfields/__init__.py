@@ -11,10 +11,12 @@
 from __future__ import annotations
 
 from .base import TypedSystemField
+from .draft_type import DraftTypeSystemField
 from .mapping import MappingSystemFieldMixin
 from .publication_status import PublicationStatusSystemField
 
 __all__ = (
+    "DraftTypeSystemField",
     "MappingSystemFieldMixin",
     "PublicationStatusSystemField",
     "TypedSystemField",
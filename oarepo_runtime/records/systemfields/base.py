@@ -17,6 +17,29 @@ from invenio_records.extensions import ExtensionMixin
 from invenio_records.systemfields import SystemField
 
 
+_class_fields_cache: dict[tuple[type, type], tuple[tuple[str, Any], ...]] = {}
+
+
+def get_class_fields[F](record_class: type, field_class: type[F]) -> tuple[tuple[str, F], ...]:
+    """Return (attribute name, field) pairs of the class attributes that are instances of field_class.
+
+    Only class dictionaries along the MRO are looked at, so no descriptors are evaluated.
+    Attributes of subclasses take precedence over those of base classes, the pairs are sorted
+    by attribute name. The result is computed once per class and field class.
+    """
+    key = (record_class, field_class)
+    fields = _class_fields_cache.get(key)
+    if fields is None:
+        attributes: dict[str, Any] = {}
+        for base in reversed(record_class.__mro__):
+            attributes.update(vars(base))
+        fields = _class_fields_cache.setdefault(
+            key,
+            tuple((name, value) for name, value in sorted(attributes.items()) if isinstance(value, field_class)),
+        )
+    return fields
+
+
 class TypedSystemField[R: Record = Record, V: Any = Any](SystemField, ExtensionMixin):
     """Base class for typed system fields."""
 
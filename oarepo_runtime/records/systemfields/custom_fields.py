@@ -10,7 +10,6 @@
 
 from __future__ import annotations
 
-import inspect
 from typing import TYPE_CHECKING
 
 from flask import current_app
@@ -18,12 +17,15 @@ from invenio_records.systemfields.relations import MultiRelationsField
 from invenio_vocabularies.records.systemfields.relations import CustomFieldsRelation
 
 from oarepo_runtime.records.mapping import prefixed_index, update_record_index
+from oarepo_runtime.records.systemfields.base import get_class_fields
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from invenio_records.api import RecordBase
 
+    from oarepo_runtime.records.mapping import MappingUpdatePlan
+
 
 def update_record_system_fields_mapping_relation_field(
     record_class: type[RecordBase],
@@ -37,25 +39,45 @@ def update_record_system_fields_mapping_relation_field(
     if not index:
         return
 
+    for mapping in get_relation_fields_mappings(record_class):
+        # upload mapping
+        update_record_index(prefixed_index(index), {}, mapping, None)
+
+
+def add_relation_fields_mapping(plan: MappingUpdatePlan, record_class: type[RecordBase]) -> None:
+    """Add mapping of custom fields relations of the record class to the mapping update plan."""
+    index = getattr(record_class, "index", None)
+    if not index:
+        return
+
+    mappings = get_relation_fields_mappings(record_class)
+    if mappings:
+        update = plan.index_update(index)
+        for mapping in mappings:
+            update.add({}, mapping)
+
+
+def get_relation_fields_mappings(record_class: type[RecordBase]) -> list[dict]:
+    """Get mappings of custom fields of the custom fields relations of the record class."""
+    mappings = []
     for field_name, fld in get_mapping_relation_fields(record_class):
         custom_fields = current_app.config.get(fld._fields_var, [])  # noqa: SLF001
 
         props: dict[str, dict] = {}
-        mapping = {field_name: {"type": "object", "properties": props}}
         for cf in custom_fields:
             # get mapping
             props[cf.name] = cf.mapping
 
-        # upload mapping
         if props:
-            update_record_index(prefixed_index(index), {}, mapping, None)
+            mappings.append({field_name: {"type": "object", "properties": props}})
+    return mappings
 
 
 def get_mapping_relation_fields(
     record_class: type[RecordBase],
 ) -> Iterable[tuple[str, CustomFieldsRelation]]:
     """Get all mapping fields from the record class."""
-    for _, relation_fields in inspect.getmembers(record_class, lambda x: isinstance(x, MultiRelationsField)):
+    for _, relation_fields in get_class_fields(record_class, MultiRelationsField):
         yield from (
             (field_name, relation_field)
             for field_name, relation_field in relation_fields._original_fields.items()  # noqa: SLF001
@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Draft type system field."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal, Self, override
+
+from invenio_records.api import Record
+
+from .base import TypedSystemField, get_class_fields
+from .mapping import MappingSystemFieldMixin
+
+if TYPE_CHECKING:
+    from invenio_records.dumpers import Dumper
+
+type DraftType = Literal["initial", "metadata", "new_version"]
+
+
+def compute_draft_type(record: Any) -> DraftType | None:
+    """Compute the type of a draft from its versions state.
+
+    Returns None for records that are not drafts. Note that accessing the versions
+    state might load the parent and its versions state from the database.
+    """
+    if not getattr(record, "is_draft", False):
+        return None
+
+    versions = record.versions
+    index = versions.index
+    is_latest = versions.is_latest
+    if index == 1 and not is_latest:
+        return "initial"
+    if index > 1 and not is_latest:
+        return "new_version"
+    return "metadata"
+
+
+class DraftTypeSystemField(MappingSystemFieldMixin, TypedSystemField[Record, "DraftType | None"]):
+    """A system field with the type of a draft ('initial', 'metadata' or 'new_version').
+
+    The type is computed from the versions state of the draft and stored in the search
+    index, so that drafts of a given type can be filtered by an exact term query.
+    Records loaded from the search index take the type from the indexed value and do not
+    need to load their versions state. The value is None for published records.
+
+    The default key for this field is 'draft_type', but it can be customized.
+    """
+
+    def __init__(self, key: str | None = "draft_type"):
+        """Initialize the system field with an optional key."""
+        super().__init__(key)
+
+    @property
+    def mapping(self) -> dict:
+        """Return the mapping for the field in the search index."""
+        return {
+            self.key: {
+                "type": "keyword",
+            },
+        }
+
+    @override
+    def post_load(self, record: Record, data: dict, loader: Dumper | None = None) -> None:
+        draft_type = data.pop(self.key, None)
+        if draft_type is not None:
+            self._set_cache(record, draft_type)
+
+    @override
+    def post_dump(self, record: Record, data: dict, dumper: Dumper | None = None) -> None:
+        draft_type = self.__get__(record, type(record))
+        if draft_type is not None:
+            data[self.key] = draft_type
+
+    @override
+    def __get__(self, instance: Record | None, owner: type[Record]) -> Self | DraftType | None:  # type: ignore[override]
+        """Access the attribute."""
+        if instance is None:
+            return self
+        if not getattr(instance, "is_draft", False):
+            return None
+        draft_type = self._get_cache(instance)
+        if draft_type is None:
+            draft_type = compute_draft_type(instance)
+            self._set_cache(instance, draft_type)
+        return draft_type  # type: ignore[no-any-return]
+
+
+def get_draft_type(record: Any) -> DraftType | None:
+    """Return the type of a draft, using its draft type system field if the record class has one."""
+    record_cls = type(record)
+    fields = get_class_fields(record_cls, DraftTypeSystemField)
+    if not fields:
+        return compute_draft_type(record)
+    return fields[0][1].__get__(record, record_cls)
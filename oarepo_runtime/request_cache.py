@@ -0,0 +1,53 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Caches living for the duration of a single request."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from flask import has_request_context, request
+
+REQUEST_CACHES_ENVIRON_KEY = "oarepo_runtime.request_caches"
+"""Key of the WSGI environ entry holding caches of the request."""
+
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+"""HTTP methods that do not modify data."""
+
+
+def request_cache(name: str, read_only: bool = False) -> dict[Any, Any] | None:
+    """Return a named dictionary that is discarded at the end of the current request.
+
+    Outside of a request (for example in celery tasks or cli commands, where
+    the data might change while the application context lives) None is returned
+    and callers should not cache anything.
+
+    :param read_only: return the cache only in requests with safe http methods, which do not
+        modify data - for caches whose entries would become stale when data are modified
+    """
+    if not has_request_context():
+        return None
+    if read_only and request.method not in SAFE_METHODS:
+        return None
+    caches: dict[str, dict[Any, Any]] = request.environ.setdefault(REQUEST_CACHES_ENVIRON_KEY, {})
+    cache = caches.get(name)
+    if cache is None:
+        cache = caches[name] = {}
+    return cache
+
+
+def clear_request_cache(name: str | None = None) -> None:
+    """Clear the named request cache or all request caches of the current request."""
+    if not has_request_context():
+        return
+    caches: dict[str, dict[Any, Any]] = request.environ.get(REQUEST_CACHES_ENVIRON_KEY, {})
+    if name is None:
+        caches.clear()
+    else:
+        caches.pop(name, None)
@@ -10,7 +10,13 @@
 
 from __future__ import annotations
 
+from .compiled_permissions import (
+    CompiledPermissionPolicyMixin,
+    PermissionPlan,
+    compile_permission_plan,
+)
 from .link_conditions import (
+    compile_conditions,
     has_draft,
     has_draft_permission,
     has_permission,
@@ -19,9 +25,15 @@ from .link_conditions import (
     is_published_record,
 )
 from .permissions import EveryonePermissionPolicy
+from .timing import component_timings
 
 __all__ = (
+    "CompiledPermissionPolicyMixin",
     "EveryonePermissionPolicy",
+    "PermissionPlan",
+    "compile_permission_plan",
+    "compile_conditions",
+    "component_timings",
     "has_draft",
     "has_draft_permission",
     "has_permission",
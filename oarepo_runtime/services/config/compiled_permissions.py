@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+
+"""Permission policies evaluated from precomputed plans."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any
+
+from invenio_records_permissions.generators import (
+    AdminAction,
+    AnyUser,
+    AuthenticatedUser,
+    Disable,
+    SystemProcess,
+)
+from invenio_records_permissions.policies.base import BasePermissionPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from flask_principal import Need
+    from invenio_records_permissions.generators import Generator
+
+RECORD_INDEPENDENT_GENERATORS: set[type[Generator]] = {
+    AdminAction,
+    AnyUser,
+    AuthenticatedUser,
+    Disable,
+    SystemProcess,
+}
+"""Generator classes whose needs and excludes depend neither on the record nor on the context.
+
+Only exact classes are matched, subclasses (such as ``SystemProcessWithoutSuperUser``)
+might compute their needs differently and are evaluated on every permission check.
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class PermissionPlan:
+    """Needs and excludes of an action split into precomputed and record-dependent parts."""
+
+    needs: frozenset[Need]
+    """Needs of the record-independent generators."""
+
+    excludes: frozenset[Need]
+    """Excludes of the record-independent generators."""
+
+    generators: tuple[Generator, ...]
+    """Generators that need to be evaluated on every permission check."""
+
+
+def compile_permission_plan(generators: Iterable[Generator]) -> PermissionPlan:
+    """Precompute needs and excludes of record-independent generators."""
+    needs: set[Need] = set()
+    excludes: set[Need] = set()
+    dynamic: list[Generator] = []
+    for generator in generators:
+        if type(generator) in RECORD_INDEPENDENT_GENERATORS:
+            needs.update(generator.needs())
+            excludes.update(generator.excludes())
+        else:
+            dynamic.append(generator)
+    return PermissionPlan(needs=frozenset(needs), excludes=frozenset(excludes), generators=tuple(dynamic))
+
+
+_permission_plans: dict[tuple[type, str], PermissionPlan] = {}
+
+
+class CompiledPermissionPolicyMixin:
+    """Permission policy mixin evaluating actions from precomputed plans.
+
+    Needs and excludes of record-independent generators are computed only once
+    per policy class and action, only the remaining generators are called on
+    each permission check. Needs and excludes of a policy instance are loaded
+    together, so that action needs (such as superuser access) are expanded
+    only once per instance.
+
+    The mixin must precede the invenio permission policy class in bases.
+    """
+
+    action: str
+    over: dict[str, Any]
+    generators: Any
+    explicit_needs: set[Need]
+    explicit_excludes: set[Need]
+    _permissions: Any
+    _compiled_permissions_loaded = False
+
+    @property
+    def permission_plan(self) -> PermissionPlan:
+        """Return the evaluation plan of the action of this policy."""
+        if type(self).generators is not BasePermissionPolicy.generators:
+            # generators computed by the instance can not be shared between instances
+            return compile_permission_plan(self.generators)
+        key = (type(self), self.action)
+        plan = _permission_plans.get(key)
+        if plan is None:
+            plan = _permission_plans.setdefault(key, compile_permission_plan(self.generators))
+        return plan
+
+    def _load_compiled_permissions(self) -> None:
+        """Evaluate the plan and expand the resulting needs and excludes."""
+        if self._compiled_permissions_loaded:
+            return
+        plan = self.permission_plan
+        self.explicit_needs |= plan.needs
+        self.explicit_excludes |= plan.excludes
+        for generator in plan.generators:
+            self.explicit_needs.update(generator.needs(**self.over))
+            self.explicit_excludes.update(generator.excludes(**self.over))
+        self._load_permissions()  # type: ignore[attr-defined]
+        self._compiled_permissions_loaded = True
+
+    @property
+    def needs(self) -> set[Need]:
+        """Set of needs granting the permission."""
+        self._load_compiled_permissions()
+        return self._permissions.needs  # type: ignore[no-any-return]
+
+    @property
+    def excludes(self) -> set[Need]:
+        """Set of needs denying the permission."""
+        self._load_compiled_permissions()
+        return self._permissions.excludes  # type: ignore[no-any-return]
@@ -16,18 +16,24 @@ the input order whenever it does not conflict with the declared constraints.
 
 from __future__ import annotations
 
+import hashlib
 import heapq
 import inspect
+import json
+import logging
 from collections import defaultdict
 from functools import cached_property, partial
 from itertools import chain
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, override
 
 from invenio_base.utils import obj_or_import_string
 from invenio_records_resources.services.records.components import ServiceComponent
 
+from .timing import component_timing_enabled, component_timings
+
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Iterable
+    from collections.abc import Callable, Iterable, Iterator
 
     from invenio_records_resources.services.records.config import RecordServiceConfig
     from invenio_records_resources.services.records.service import RecordService
@@ -38,6 +44,90 @@ else:
     RecordService = object
 
 
+_ordered_components_cache: dict[tuple[type, tuple[Any, ...]], tuple[Any, ...]] = {}
+"""Module-level cache of ordered components.
+
+Keyed by the service class and the tuple of component entries from
+``config.components``. Ordering only depends on the component classes, so the
+result can be shared between service instances and application instances.
+"""
+
+
+log = logging.getLogger(__name__)
+
+_precomputed_orderings: dict[tuple[str, tuple[str, ...]], tuple[tuple[str, ...], str | None]] = {}
+"""Orderings loaded from a file generated by ``invenio oarepo components dump``.
+
+Keyed by the service class name and names of the component entries, the value
+contains names of the ordered components and the hash of the ordering declarations
+of the components at the time of the dump (see ``component_declarations_hash``).
+"""
+
+
+def clear_components_ordering_cache() -> None:
+    """Clear the cache of ordered components (e.g. after components were mutated in tests)."""
+    _ordered_components_cache.clear()
+
+
+def component_name(component: Any) -> str | None:
+    """Return a fully qualified name of a component class or a partial of it.
+
+    Returns None for factories, as their class is known only after they are called.
+    """
+    if inspect.isclass(component):
+        return f"{component.__module__}.{component.__qualname__}"
+    if isinstance(component, partial):
+        return component_name(component.func)
+    return None
+
+
+def load_precomputed_component_orderings(path: str | Path) -> None:
+    """Load component orderings precomputed by ``invenio oarepo components dump --format json``.
+
+    Orderings whose service class, component entries or ordering declarations of the
+    components do not match the running code are never used, so a stale file only means
+    the ordering is computed again (and a warning is logged).
+    """
+    with Path(path).open() as f:
+        data = json.load(f)
+    for info in data.values():
+        key = (info["service_class"], tuple(info["components"]))
+        _precomputed_orderings[key] = (tuple(info["order"]), info.get("declarations_hash"))
+
+
+def component_declarations_hash(component_data: Iterable[ComponentData]) -> str:
+    """Return a hash of everything the ordering of the components depends on.
+
+    That is the component classes with their base classes and their ``affects``,
+    ``depends_on``, ``replaces`` and ``replaced_by`` declarations.
+    """
+
+    def names(classes: Iterable[type]) -> list[str]:
+        return sorted(str(component_name(c)) for c in classes)
+
+    declarations = [
+        {
+            "component": component_name(cd.component_class),
+            "mro": names(cd.component_mro),
+            "affects": "*" if cd.affects_all else names(cd.affects),
+            "depends_on": "*" if cd.depends_on_all else names(cd.depends_on),
+            "replaces": names(cd.replaces),
+            "replaced_by": names(cd.replaced_by),
+        }
+        for cd in component_data
+    ]
+    return hashlib.sha256(json.dumps(declarations, sort_keys=True).encode()).hexdigest()
+
+
+def _resolve_component_type(component: Any, service: Any) -> type[ServiceComponent]:
+    """Return the class of components created by a component entry (a class, a partial or a factory)."""
+    if inspect.isclass(component):
+        return component
+    if isinstance(component, partial):
+        return _resolve_component_type(component.func, service)
+    return type(component(service))
+
+
 class ComponentData:
     """Normalized metadata extracted from a service component.
 
@@ -229,14 +319,146 @@ class ComponentsOrderingMixin(RecordService):
 
     @cached_property
     def component_classes(self) -> tuple[type[ServiceComponent], ...]:
-        """Return the ordered component classes as an immutable tuple."""
-        return self._order_components(self.config.components)
+        """Return the ordered component classes as an immutable tuple.
+
+        The ordering is memoized in a module-level cache keyed by the service class
+        and the component entries, so it is computed only once per process.
+        """
+        components = tuple(self.config.components)
+        cache_key = (type(self), components)
+        try:
+            return _ordered_components_cache[cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable component entry, can not be cached
+            return self._order_components(components)
+        ordered = self._get_precomputed_order(components)
+        if ordered is None:
+            ordered = self._order_components(components)
+        _ordered_components_cache[cache_key] = ordered
+        return ordered
+
+    def _get_precomputed_order(self, components: tuple[Any, ...]) -> tuple[Any, ...] | None:
+        """Return the ordering loaded by ``load_precomputed_component_orderings`` if there is one."""
+        if not _precomputed_orderings:
+            return None
+        names = [component_name(c) for c in components]
+        if None in names:
+            return None
+        precomputed = _precomputed_orderings.get((component_name(type(self)), tuple(names)))  # type: ignore[arg-type]
+        if precomputed is None:
+            return None
+        ordered_names, declarations_hash = precomputed
+        current_hash = component_declarations_hash(ComponentData(c, service=self) for c in components)
+        if declarations_hash != current_hash:
+            log.warning(
+                "Precomputed component ordering of %s is stale (ordering declarations of its components "
+                "changed since the dump), computing the ordering again",
+                component_name(type(self)),
+            )
+            return None
+        by_name: dict[str, Any] = {}
+        for name, component in zip(names, components, strict=True):
+            by_name.setdefault(name, component)  # type: ignore[arg-type]
+        return tuple(by_name[name] for name in ordered_names)
+
+    def get_components_ordering_info(self) -> dict[str, Any]:
+        """Compute the ordering and the dependency graph of the configured components.
+
+        The ordering is always computed from scratch (neither cached nor precomputed
+        orderings are used), so this raises ``ValueError`` on dependency cycles.
+        The result is JSON serializable and can be loaded by
+        ``load_precomputed_component_orderings``.
+        """
+        components = tuple(self.config.components)
+        component_data = self._deduplicate_components(components)
+        graph = self._create_topo_graph(component_data)
+        names = {id(cd.original_component): component_name(cd.component_class) for cd in component_data}
+        return {
+            "service_class": component_name(type(self)),
+            "components": [component_name(ComponentData(c, service=self).component_class) for c in components],
+            "declarations_hash": component_declarations_hash(ComponentData(c, service=self) for c in components),
+            "order": [names[id(c)] for c in self._order_components(components)],
+            "graph": {
+                names[id(cd.original_component)]: sorted(names[id(dep.original_component)] for dep in deps)
+                for cd, deps in graph.items()
+            },
+            "affects_all": sorted(names[id(cd.original_component)] for cd in component_data if cd.affects_all),
+            "depends_on_all": sorted(names[id(cd.original_component)] for cd in component_data if cd.depends_on_all),
+        }
+
+    @cached_property
+    def _component_types(self) -> tuple[type[ServiceComponent], ...]:
+        """Classes of the component entries in the computed order.
+
+        Classes and partials are resolved without instantiation, factories are
+        called once to find out the class of the components they create.
+        """
+        return tuple(_resolve_component_type(c, self) for c in self.component_classes)
+
+    @cached_property
+    def _components_dispatch_table(self) -> dict[str, tuple[Any, ...]]:
+        """Hook name -> component entries whose components implement the hook.
+
+        Filled lazily by ``_get_hook_components`` as the set of hooks is open-ended.
+        """
+        return {}
 
     @property
-    def components(self) -> Generator[ServiceComponent]:
+    def components(self) -> Iterator[ServiceComponent]:
         """Instantiate and yield components in the computed order."""
         return (c(self) for c in self.component_classes)
 
+    def run_components(self, action: str, *args: Any, **kwargs: Any) -> None:
+        """Run the given hook on components that implement it, in the computed order.
+
+        Components are instantiated on each call, as invenio components may keep
+        per-call state on ``self``; components that do not implement the hook are
+        not instantiated at all. If component timing is enabled (checked on each
+        call, so it can be toggled at runtime), the hooks are wrapped to record
+        their wall time.
+
+        As in invenio, the unit of work is not passed to the hooks but set as
+        ``component.uow`` for the duration of the hook.
+        """
+        uow = kwargs.pop("uow", None)
+        component_entries = self._get_hook_components(action)
+        timed = bool(component_entries) and component_timing_enabled()
+        for component_entry in component_entries:
+            component = component_entry(self)
+            if uow is not None:
+                component.uow = uow
+            hook = getattr(component, action)
+            if timed:
+                hook = component_timings.wrap(
+                    getattr(self.config, "service_id", None) or type(self).__name__,
+                    f"{type(hook.__self__).__module__}.{type(hook.__self__).__qualname__}",
+                    action,
+                    hook,
+                )
+            hook(*args, **kwargs)
+            component.uow = None
+
+    def _get_hook_components(self, action: str) -> tuple[Any, ...]:
+        """Return component entries whose components override the ``action`` hook.
+
+        Hooks inherited unchanged from ``ServiceComponent`` are no-ops and are skipped.
+        """
+        try:
+            return self._components_dispatch_table[action]
+        except KeyError:
+            pass
+        default_hook = getattr(ServiceComponent, action, None)
+        entries = tuple(
+            component_entry
+            for component_entry, component_type in zip(self.component_classes, self._component_types, strict=True)
+            if getattr(component_type, action, default_hook) is not default_hook
+            or (default_hook is None and hasattr(component_type, action))
+        )
+        self._components_dispatch_table[action] = entries
+        return entries
+
     def _order_components(
         self,
         components: Iterable[Any],
@@ -339,18 +561,30 @@ class ComponentsOrderingMixin(RecordService):
         for comp in components:
             graph[comp] = set()
 
+        mro_index = self._create_mro_index(components)
         for comp in components:
             for dep in comp.depends_on:
-                for other in self._find_components(components, dep):
+                for other in self._find_components(mro_index, dep):
                     graph[comp].add(other)
             for aff in comp.affects:
-                for other in self._find_components(components, aff):
+                for other in self._find_components(mro_index, aff):
                     graph[other].add(comp)
         return graph
 
-    def _find_components(self, components: list[ComponentData], cls: type) -> list[ComponentData]:
+    def _create_mro_index(self, components: list[ComponentData]) -> dict[type, list[ComponentData]]:
+        """Map each class from the components' ``component_mro`` to the components containing it.
+
+        The lists keep the order of ``components``.
+        """
+        mro_index: dict[type, list[ComponentData]] = defaultdict(list)
+        for comp in components:
+            for cls in comp.component_mro:
+                mro_index[cls].append(comp)
+        return mro_index
+
+    def _find_components(self, mro_index: dict[type, list[ComponentData]], cls: type) -> list[ComponentData]:
         """Return components whose ``component_mro`` includes the given class."""
-        return [comp for comp in components if cls in comp.component_mro]
+        return mro_index.get(cls, [])
 
     def _propagate_dependencies(
         self,
@@ -405,14 +639,15 @@ class ComponentsOrderingMixin(RecordService):
         """
         additional_selected_items = set[int]()
 
+        potential_indices: dict[type, list[int]] = defaultdict(list)
+        for idx, dep in enumerate(potential_dependencies):
+            for cls in dep.component_mro:
+                potential_indices[cls].append(idx)
+
         for s in selected:
-            additional_selected_from_s = selected_dependency_getter(s)
-            if not additional_selected_from_s:
-                continue
-            for idx, dep in enumerate(potential_dependencies):
-                if additional_selected_from_s & dep.component_mro:
-                    # the dependency matches, so should be in selected
-                    additional_selected_items.add(idx)
+            for cls in selected_dependency_getter(s):
+                # the dependency matches, so should be in selected
+                additional_selected_items.update(potential_indices.get(cls, ()))
 
         return additional_selected_items
 
@@ -430,14 +665,15 @@ class ComponentsOrderingMixin(RecordService):
         """
         additional_selected_items = set[int]()
 
+        selected_mro: set[type] = set()
+        for s in selected:
+            selected_mro.update(s.component_mro)
+
         for idx, p in enumerate(potential_dependencies):
             p_should_be_with = potential_dependency_getter(p)
-            if not p_should_be_with:
-                continue
-            for s in selected:
-                if p_should_be_with & s.component_mro:
-                    # the dependency matches, so should be in selected
-                    additional_selected_items.add(idx)
+            if p_should_be_with and not p_should_be_with.isdisjoint(selected_mro):
+                # the dependency matches, so should be in selected
+                additional_selected_items.add(idx)
 
         return additional_selected_items
 
@@ -12,23 +12,37 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections import Counter
 from logging import getLogger
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, override
 
 from invenio_pidstore.errors import PIDDoesNotExistError, PIDUnregistered
 from invenio_records_resources.records.api import FileRecord
 
 from oarepo_runtime.proxies import current_runtime
-from oarepo_runtime.records.drafts import get_draft
+from oarepo_runtime.records.drafts import get_draft, get_drafts
+from oarepo_runtime.request_cache import request_cache
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Hashable, Iterable
+
     from invenio_records.api import Record as RecordBase
 
 log = getLogger(__name__)
 
 
+type CompiledCondition = Callable[[Any, dict], bool]
+"""A condition compiled into a plain function of (record, context)."""
+
+
 class Condition:
-    """Base class for defining conditions with callable logic."""
+    """Base class for defining conditions with callable logic.
+
+    Conditions can be combined with ``&``, ``|`` and ``~`` into an expression
+    tree of ``And``, ``Or`` and ``Not`` nodes, which are evaluated with short-circuiting.
+    Conditions with the same class and parameters are equal, so that identical
+    sub-conditions can be evaluated only once (see ``compile_conditions``).
+    """
 
     @abstractmethod
     def __call__(self, obj: RecordBase, ctx: dict):
@@ -37,27 +51,287 @@ class Condition:
 
     def __and__(self, other: Any):
         """Combine two conditions using a logical AND."""
-        return type(
-            "And",
-            (Condition,),
-            {"__call__": lambda _, obj, ctx: self(obj, ctx) and other(obj, ctx)},
-        )()
+        return And(self, other)
 
     def __or__(self, other: Any):
         """Combine two conditions using a logical OR."""
-        return type(
-            "Or",
-            (Condition,),
-            {"__call__": lambda _, obj, ctx: self(obj, ctx) or other(obj, ctx)},
-        )()
+        return Or(self, other)
 
     def __invert__(self):
         """Negate the condition using a logical NOT."""
-        return type(
-            "Not",
-            (Condition,),
-            {"__call__": lambda _, obj, ctx: not self(obj, ctx)},
-        )()
+        return Not(self)
+
+    @property
+    def condition_key(self) -> Hashable:
+        """Key identifying the condition - conditions of the same class with the same parameters are equal."""
+        try:
+            key = (type(self), tuple(sorted(vars(self).items())))
+            hash(key)
+        except TypeError:
+            return (type(self), id(self))
+        return key
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if the other condition is of the same class and has the same parameters."""
+        if not isinstance(other, Condition):
+            return NotImplemented
+        return self.condition_key == other.condition_key
+
+    def __hash__(self) -> int:
+        """Return hash of the condition key."""
+        return hash(self.condition_key)
+
+    def children(self) -> tuple[Any, ...]:
+        """Return sub-conditions of this condition."""
+        return ()
+
+    def evaluate_many(self, objs: Iterable[RecordBase], ctx: dict) -> list[bool]:
+        """Evaluate the condition for all records, for example records of a search result page.
+
+        Subclasses can override this to evaluate the condition for all the records at once.
+        Results of permission checks are kept in the request cache, so evaluating the condition
+        on a page before rendering the links makes the links use the already computed results.
+        """
+        return [bool(self(obj, ctx)) for obj in objs]
+
+    def compile(self, shared: Collection[Any] = (), results: _ConditionResults | None = None) -> CompiledCondition:
+        """Compile the condition into a single function.
+
+        :param shared: sub-conditions whose results are memoized for the evaluated (record, context)
+        :param results: storage of memoized results, required if ``shared`` is not empty
+        """
+        func = self._compile(shared, results)
+        if results is not None and self in shared:
+            return results.memoize(self, func)
+        return func
+
+    def _compile(self, shared: Collection[Any], results: _ConditionResults | None) -> CompiledCondition:
+        """Compile the condition itself, without memoization of its result."""
+        _ = shared, results
+        call = self.__call__
+
+        def compiled(obj: Any, ctx: dict) -> bool:
+            return bool(call(obj, ctx))
+
+        return compiled
+
+
+def _compile_operand(
+    operand: Any, shared: Collection[Any], results: _ConditionResults | None
+) -> CompiledCondition:
+    """Compile an operand that might be a plain function instead of a Condition."""
+    if isinstance(operand, Condition):
+        return operand.compile(shared, results)
+
+    def compiled(obj: Any, ctx: dict) -> bool:
+        return bool(operand(obj, ctx))
+
+    return compiled
+
+
+class _BooleanOperation(Condition):
+    """Base of And and Or conditions, flattening nested operations of the same type."""
+
+    def __init__(self, *operands: Any):
+        """Initialize the operation, merging operands that are the same operation and dropping duplicates."""
+        flattened: list[Any] = []
+        for operand in operands:
+            for op in operand.operands if type(operand) is type(self) else (operand,):
+                if op not in flattened:
+                    flattened.append(op)
+        self.operands = tuple(flattened)
+
+    @override
+    def children(self) -> tuple[Any, ...]:
+        return self.operands
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(repr, self.operands))})"
+
+
+class And(_BooleanOperation):
+    """Condition that is true if all operands are true, evaluated left to right with short-circuiting."""
+
+    @override
+    def __call__(self, obj: RecordBase, ctx: dict) -> bool:
+        return all(operand(obj, ctx) for operand in self.operands)
+
+    @override
+    def _compile(self, shared: Collection[Any], results: _ConditionResults | None) -> CompiledCondition:
+        predicates = tuple(_compile_operand(operand, shared, results) for operand in self.operands)
+
+        def compiled(obj: Any, ctx: dict) -> bool:
+            for predicate in predicates:
+                if not predicate(obj, ctx):
+                    return False
+            return True
+
+        return compiled
+
+
+class Or(_BooleanOperation):
+    """Condition that is true if any operand is true, evaluated left to right with short-circuiting."""
+
+    @override
+    def __call__(self, obj: RecordBase, ctx: dict) -> bool:
+        return any(operand(obj, ctx) for operand in self.operands)
+
+    @override
+    def _compile(self, shared: Collection[Any], results: _ConditionResults | None) -> CompiledCondition:
+        predicates = tuple(_compile_operand(operand, shared, results) for operand in self.operands)
+
+        def compiled(obj: Any, ctx: dict) -> bool:
+            for predicate in predicates:
+                if predicate(obj, ctx):
+                    return True
+            return False
+
+        return compiled
+
+
+class Not(Condition):
+    """Negation of a condition."""
+
+    def __init__(self, operand: Any):
+        """Initialize the negation."""
+        self.operand = operand
+
+    @override
+    def __invert__(self):
+        return self.operand
+
+    @override
+    def __call__(self, obj: RecordBase, ctx: dict) -> bool:
+        return not self.operand(obj, ctx)
+
+    @override
+    def children(self) -> tuple[Any, ...]:
+        return (self.operand,)
+
+    @override
+    def _compile(self, shared: Collection[Any], results: _ConditionResults | None) -> CompiledCondition:
+        predicate = _compile_operand(self.operand, shared, results)
+
+        def compiled(obj: Any, ctx: dict) -> bool:
+            return not predicate(obj, ctx)
+
+        return compiled
+
+    @override
+    def __repr__(self) -> str:
+        return f"Not({self.operand!r})"
+
+
+class _ConditionResults:
+    """Results of shared sub-conditions for the (record, context) that is currently being evaluated.
+
+    Links of a record are rendered one after another with the same record and context,
+    so results are kept only for the last evaluated pair. They are stored in a request cache,
+    so that neither the record nor the context (with the identity) outlive the request.
+    Outside of a request the sub-conditions are evaluated every time.
+    """
+
+    REQUEST_CACHE_NAME = "oarepo_runtime.link_condition_results"
+    """Name of the request cache holding the results."""
+
+    def memoize(self, condition: Condition, func: CompiledCondition) -> CompiledCondition:
+        """Wrap the compiled condition so that it is evaluated only once for a (record, context)."""
+
+        def memoized(obj: Any, ctx: dict) -> bool:
+            cache = request_cache(self.REQUEST_CACHE_NAME)
+            if cache is None:
+                return func(obj, ctx)
+            last = cache.get(self)
+            if last is None or last[0] is not obj or last[1] is not ctx:
+                last = cache[self] = (obj, ctx, {})
+            values: dict[Condition, bool] = last[2]
+            try:
+                return values[condition]
+            except KeyError:
+                value = values[condition] = func(obj, ctx)
+                return value
+
+        return memoized
+
+
+def compile_conditions(*conditions: Any) -> list[CompiledCondition]:
+    """Compile conditions of a link set into functions that share results of identical sub-conditions.
+
+    Sub-conditions that occur more than once in the conditions (for example ``has_permission("update")``
+    in conditions of several links) are evaluated only once when links of a record are rendered
+    within a request:
+
+    .. code-block:: python
+
+        can_edit, can_publish = compile_conditions(
+            has_permission("update_draft") & is_draft(),
+            has_permission("update_draft") & has_permission("publish"),
+        )
+        links_item = {
+            "edit": RecordLink("...", when=can_edit),
+            "publish": RecordLink("...", when=can_publish),
+        }
+    """
+    counts: Counter[Any] = Counter()
+
+    def count(condition: Any) -> None:
+        if isinstance(condition, Condition):
+            counts[condition] += 1
+            for child in condition.children():
+                count(child)
+
+    for condition in conditions:
+        count(condition)
+
+    shared = {condition for condition, occurrences in counts.items() if occurrences > 1}
+    results = _ConditionResults() if shared else None
+    return [_compile_operand(condition, shared, results) for condition in conditions]
+
+
+def _permission_cache_key(identity: Any, action_name: str, record: Any) -> Hashable | None:
+    """Return the key of a permission check in the request cache, None if the result should not be cached."""
+    record_id = getattr(record, "id", None)
+    if identity is None or record_id is None:
+        return None
+    return (
+        getattr(identity, "id", None),
+        frozenset(getattr(identity, "provides", ())),
+        action_name,
+        type(record),
+        record_id,
+        getattr(record, "revision_id", None),
+    )
+
+
+def check_permission(action_name: str, record: RecordBase, ctx: dict, service_record: RecordBase | None = None) -> bool:
+    """Check the permission of the identity in the context for the record, memoized for the current request.
+
+    Results are cached per (identity, action, record id, record revision), so that links of several
+    records sharing the same action and search result pages evaluating the permission for several
+    links evaluate the permission policy once per record.
+
+    :param action_name: permission action
+    :param record: record the permission is checked for
+    :param ctx: link context, passed to the permission policy; must contain the identity
+    :param service_record: record used to look up the service, defaults to ``record``
+    """
+    cache = request_cache("link_permissions")
+    key = _permission_cache_key(ctx.get("identity"), action_name, record) if cache is not None else None
+    if key is not None:
+        try:
+            return cache[key]  # type: ignore[index]
+        except KeyError:
+            pass
+    service = current_runtime.get_record_service_for_record(service_record if service_record is not None else record)
+    try:
+        result = bool(service.check_permission(action_name=action_name, record=record, **ctx))
+    except Exception:  # pragma: no cover
+        log.exception("Unexpected exception.")
+        return False
+    if key is not None:
+        cache[key] = result  # type: ignore[index]
+    return result
 
 
 class has_permission(Condition):  # noqa: N801
@@ -71,11 +345,7 @@ class has_permission(Condition):  # noqa: N801
         """Evaluate the condition by checking the permission for a given record."""
         if isinstance(obj, FileRecord):
             obj = obj.record
-        service = current_runtime.get_record_service_for_record(obj)
-        try:
-            return service.check_permission(action_name=self.action_name, record=obj, **ctx)
-        except Exception:  # pragma: no cover
-            log.exception("Unexpected exception.")
+        return check_permission(self.action_name, obj, ctx)
 
 
 class has_draft_permission(Condition):  # noqa: N801
@@ -87,16 +357,19 @@ class has_draft_permission(Condition):  # noqa: N801
 
     def __call__(self, obj: RecordBase, ctx: dict):
         """Valuates the condition by checking the permission for a draft record."""
-        _ = ctx
         draft_record = get_draft(obj)
         if not draft_record:
             return False
-        service = current_runtime.get_record_service_for_record(obj)
-        try:
-            return service.check_permission(action_name=self.action_name, record=draft_record, **ctx)
-        except Exception:  # pragma: no cover
-            log.exception("Unexpected exception.")
-            return False
+        return check_permission(self.action_name, draft_record, ctx, service_record=obj)
+
+    @override
+    def evaluate_many(self, objs: Iterable[RecordBase], ctx: dict) -> list[bool]:
+        """Evaluate the condition for all records, fetching their drafts at once."""
+        objs = list(objs)
+        return [
+            bool(draft) and check_permission(self.action_name, draft, ctx, service_record=obj)  # type: ignore[arg-type]
+            for obj, draft in zip(objs, get_drafts(objs), strict=True)
+        ]
 
 
 class has_draft(Condition):  # noqa: N801
@@ -109,17 +382,34 @@ class has_draft(Condition):  # noqa: N801
 
 
 class has_published_record(Condition):  # noqa: N801
-    """Shortcut for links to determine if the given record has a published PID."""
+    """Shortcut for links to determine if the given record has a published PID.
+
+    Records and drafts share the PID, so the status of the PID stored in the record
+    (and in the search index) is used. The PID is resolved only for records without
+    the ``is_published`` field, the result is cached for the request.
+    """
 
     def __call__(self, obj: RecordBase, ctx: dict):
         """Check if the given record has a published PID."""
         _ = ctx
+        # reads the pid status from record data, without querying the database if the data contain it
+        is_published = getattr(obj, "is_published", None)
+        if is_published is not None:
+            return bool(is_published)
+
         service = current_runtime.get_record_service_for_record(obj)
+        cache = request_cache("published_records", read_only=True)
+        key = (service.record_cls, obj["id"])
+        if cache is not None and key in cache:
+            return cache[key]
         try:
             service.record_cls.pid.resolve(obj["id"])
+            published = True
         except PIDUnregistered, PIDDoesNotExistError:
-            return False
-        return True
+            published = False
+        if cache is not None:
+            cache[key] = published
+        return published
 
 
 class is_published_record(Condition):  # noqa: N801
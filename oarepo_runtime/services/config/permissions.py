@@ -15,8 +15,10 @@ from __future__ import annotations
 from invenio_records_permissions import RecordPermissionPolicy
 from invenio_records_permissions.generators import AnyUser, Generator, SystemProcess
 
+from .compiled_permissions import CompiledPermissionPolicyMixin
 
-class EveryonePermissionPolicy(RecordPermissionPolicy):
+
+class EveryonePermissionPolicy(CompiledPermissionPolicyMixin, RecordPermissionPolicy):
     """Record policy for read-only repository."""
 
     can_search: tuple[Generator, ...] = (SystemProcess(), AnyUser())
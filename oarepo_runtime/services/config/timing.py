@@ -0,0 +1,145 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Opt-in timing of service component hooks.
+
+When ``OAREPO_RUNTIME_COMPONENT_TIMING`` is set in the application config,
+``ComponentsOrderingMixin`` wraps every component hook it dispatches so that
+the wall time and number of calls are recorded per (service, component, hook)
+in the in-process ``component_timings`` registry. The registry can be dumped
+as JSON or in the Prometheus text exposition format.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import threading
+import time
+from functools import wraps
+from typing import TYPE_CHECKING, Any
+
+from flask import current_app, has_app_context
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def component_timing_enabled() -> bool:
+    """Return True if component timing is enabled in the current application."""
+    return has_app_context() and bool(current_app.config.get("OAREPO_RUNTIME_COMPONENT_TIMING", False))
+
+
+@dataclasses.dataclass
+class ComponentTiming:
+    """Accumulated timing of a single (service, component, hook) triple."""
+
+    calls: int = 0
+    """Number of invocations of the hook."""
+
+    total_time: float = 0.0
+    """Total wall time spent in the hook, in seconds."""
+
+    max_time: float = 0.0
+    """Longest single invocation of the hook, in seconds."""
+
+
+class ComponentTimingRegistry:
+    """Thread-safe in-process registry of component hook timings."""
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._lock = threading.Lock()
+        self._timings: dict[tuple[str, str, str], ComponentTiming] = {}
+
+    def record(self, service: str, component: str, hook: str, elapsed: float) -> None:
+        """Record a single invocation of the hook that took ``elapsed`` seconds."""
+        key = (service, component, hook)
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                timing = self._timings[key] = ComponentTiming()
+            timing.calls += 1
+            timing.total_time += elapsed
+            timing.max_time = max(timing.max_time, elapsed)
+
+    def wrap(self, service: str, component: str, hook: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a hook so that each invocation is recorded in this registry."""
+
+        @wraps(func)
+        def timed_hook(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(service, component, hook, time.perf_counter() - start)
+
+        return timed_hook
+
+    def reset(self) -> None:
+        """Remove all recorded timings."""
+        with self._lock:
+            self._timings.clear()
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return recorded timings as a list of dictionaries, slowest hooks first."""
+        with self._lock:
+            items = [(key, dataclasses.replace(timing)) for key, timing in self._timings.items()]
+        return [
+            {
+                "service": service,
+                "component": component,
+                "hook": hook,
+                "calls": timing.calls,
+                "total_time": timing.total_time,
+                "max_time": timing.max_time,
+            }
+            for (service, component, hook), timing in sorted(items, key=lambda x: -x[1].total_time)
+        ]
+
+    def to_json(self) -> str:
+        """Return recorded timings serialized as JSON."""
+        return json.dumps(self.as_list())
+
+    def to_prometheus(self) -> str:
+        """Return recorded timings in the Prometheus text exposition format."""
+        metrics = (
+            ("oarepo_component_hook_calls_total", "counter", "Number of component hook invocations.", "calls"),
+            (
+                "oarepo_component_hook_seconds_total",
+                "counter",
+                "Total wall time spent in component hooks.",
+                "total_time",
+            ),
+            (
+                "oarepo_component_hook_seconds_max",
+                "gauge",
+                "Longest single invocation of a component hook.",
+                "max_time",
+            ),
+        )
+        timings = self.as_list()
+        lines: list[str] = []
+        for name, metric_type, help_text, field in metrics:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for timing in timings:
+                labels = ",".join(
+                    f'{label}="{_escape_label_value(timing[label])}"' for label in ("service", "component", "hook")
+                )
+                lines.append(f"{name}{{{labels}}} {timing[field]}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+component_timings = ComponentTimingRegistry()
+"""Process-wide registry of component hook timings."""
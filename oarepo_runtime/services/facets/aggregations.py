@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+
+"""Aggregations with a precomputed search body."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from invenio_search.engine import dsl
+
+
+class PrecomputedAggregationMixin:
+    """Aggregation that serializes to a body computed when it was created.
+
+    Facet definitions are static, so their aggregations do not need to be
+    serialized again for every search. The returned body is shared and must
+    not be modified.
+    """
+
+    _precomputed_body: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the precomputed aggregation body."""
+        return self._precomputed_body
+
+
+_precomputed_aggregation_classes: dict[type, type] = {}
+
+
+def precomputed_aggregation(agg: dsl.aggs.Agg) -> dsl.aggs.Agg:
+    """Return a copy of the aggregation whose ``to_dict`` returns a body computed only once.
+
+    The copy is of a subclass of the original aggregation class, so it is handled
+    by the search (including parsing of the results) in the same way as the original.
+    """
+    if isinstance(agg, PrecomputedAggregationMixin):
+        return agg
+
+    agg_class = type(agg)
+    precomputed_class = _precomputed_aggregation_classes.get(agg_class)
+    if precomputed_class is None:
+        # named dsl subclasses are not registered in place of the original class
+        precomputed_class = _precomputed_aggregation_classes.setdefault(
+            agg_class,
+            type(f"Precomputed{agg_class.__name__}", (PrecomputedAggregationMixin, agg_class), {}),
+        )
+
+    ret = precomputed_class(**agg._params)  # noqa: SLF001
+    ret._precomputed_body = agg.to_dict()  # noqa: SLF001
+    return ret
@@ -17,7 +17,12 @@ from invenio_records_resources.services.records.facets import TermsFacet
 
 
 class LabelledValuesTermsFacet(TermsFacet):
-    """Define labelled facet."""
+    """Define labelled facet.
+
+    Labels are resolved in batches - ``value_labels`` and ``localized_value_labels``
+    receive all bucket keys of a response at once, so that subclasses can fetch
+    the labels in a single query (see ``VocabularyFacet``).
+    """
 
     def __init__(self, *args: Any, **kwargs: Any):
         """Initialize labeled facet."""
@@ -12,10 +12,12 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, override
 
 from invenio_search.engine import dsl
 
+from oarepo_runtime.proxies import current_timezone
 from oarepo_runtime.services.schema.ui import (
     LocalizedDate,
     LocalizedDateTime,
@@ -25,37 +27,80 @@ from oarepo_runtime.services.schema.ui import (
 
 from .base import LabelledValuesTermsFacet
 
+if TYPE_CHECKING:
+    from marshmallow_utils.fields.babel import BabelFormatField
 
-class DateFacet(LabelledValuesTermsFacet):
-    """Date facet."""
+EDTF_TIME_PART_RE = re.compile(r"T.*")
+
+
+@lru_cache(maxsize=256)
+def _get_formatter(formatter_class: type[BabelFormatField], locale: Any) -> BabelFormatField:
+    """Return a formatter of the given class for the locale, created once per (class, locale)."""
+    return formatter_class(locale=locale)
+
+
+@lru_cache(maxsize=8192)
+def _format_label(formatter_class: type[BabelFormatField], value: str, locale: Any, tzinfo: Any) -> Any:
+    """Format the value, memoized per (formatter class, value, locale, timezone)."""
+    _ = tzinfo  # part of the cache key only, formatters read the timezone themselves
+    return _get_formatter(formatter_class, locale).format_value(value)
 
+
+class LocalizedLabelsTermsFacet(LabelledValuesTermsFacet):
+    """Terms facet with values labelled by a localized formatter.
+
+    Formatted labels are cached in a bounded LRU cache shared by all facets
+    with the same formatter, as facet values repeat across requests.
+    """
+
+    formatter_class: ClassVar[type[BabelFormatField]]
+    """Localized marshmallow field used to format the values."""
+
+    @override
     def localized_value_labels(self, values: list, locale: Any) -> dict:
-        """Add date values as localize label."""
-        return {val: LocalizedDate(locale=locale).format_value(val) for val in values}
+        """Add values formatted for the locale as labels."""
+        tzinfo = self._label_timezone()
+        return {val: _format_label(self.formatter_class, self._label_value(val), locale, tzinfo) for val in values}
+
+    def _label_value(self, value: str) -> str:
+        """Convert the bucket value before it is formatted."""
+        return value
 
+    def _label_timezone(self) -> Any:
+        """Return the timezone the labels depend on, None if they do not depend on any."""
+        return None
 
-class TimeFacet(LabelledValuesTermsFacet):
+
+class DateFacet(LocalizedLabelsTermsFacet):
+    """Date facet."""
+
+    formatter_class = LocalizedDate
+
+
+class TimeFacet(LocalizedLabelsTermsFacet):
     """Time facet."""
 
-    def localized_value_labels(self, values: list, locale: Any) -> dict:
-        """Add date values as localize label."""
-        return {val: LocalizedTime(locale=locale).format_value(val) for val in values}
+    formatter_class = LocalizedTime
 
 
-class DateTimeFacet(LabelledValuesTermsFacet):
+class DateTimeFacet(LocalizedLabelsTermsFacet):
     """Date and time facet."""
 
-    def localized_value_labels(self, values: list, locale: Any) -> dict:
-        """Add date values as localize label."""
-        return {val: LocalizedDateTime(locale=locale).format_value(val) for val in values}
+    formatter_class = LocalizedDateTime
+
+    @override
+    def _label_timezone(self) -> Any:
+        return current_timezone.get(None)
 
 
-class EDTFFacet(LabelledValuesTermsFacet):
+class EDTFFacet(LocalizedLabelsTermsFacet):
     """Extended date time format facet."""
 
-    def localized_value_labels(self, values: list, locale: Any) -> dict:
-        """Add date values as localize label."""
-        return {val: LocalizedEDTF(locale=locale).format_value(convert_to_edtf(val)) for val in values}
+    formatter_class = LocalizedEDTF
+
+    @override
+    def _label_value(self, value: str) -> str:
+        return convert_to_edtf(value)
 
 
 class AutoDateHistogramFacet(dsl.DateHistogramFacet):
@@ -71,4 +116,4 @@ class AutoDateHistogramFacet(dsl.DateHistogramFacet):
 
 def convert_to_edtf(val: str) -> str:
     """Convert date to EDTF format."""
-    return re.sub(r"T.*", "", val)  # replace T12:00:00.000Z with nothing
+    return EDTF_TIME_PART_RE.sub("", val)  # replace T12:00:00.000Z with nothing
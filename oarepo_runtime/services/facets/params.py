@@ -11,8 +11,11 @@
 
 from __future__ import annotations
 
-import copy
+import dataclasses
 import logging
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, cast
 
 from flask import current_app
@@ -20,9 +23,12 @@ from invenio_access.permissions import system_user_id
 from invenio_app.helpers import obj_or_import_string
 from invenio_records_resources.services.records.facets import FacetsResponse
 from invenio_records_resources.services.records.params import FacetsParam
+from invenio_search.engine import dsl
+
+from .aggregations import precomputed_aggregation
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from flask_principal import Identity
     from invenio_records_resources.services.records.config import SearchOptions
@@ -33,18 +39,144 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+class PrecomputedFacets:
+    """Facets and facet groups of a search options class, computed once per class.
+
+    Merged facets and their aggregations are memoized per set of facet groups,
+    so that identities with the same groups share them. The memoized sets are kept
+    in a bounded LRU cache, as the number of distinct role combinations is not limited.
+    The returned mappings are read-only views shared between requests.
+    """
+
+    max_group_sets: int = 256
+    """Maximum number of memoized sets of facet groups."""
+
+    def __init__(self, config: type[SearchOptions]):
+        """Precompute facets and facet groups from the search options."""
+        self.facets: dict[str, TermsFacet] = {**getattr(config, "facets", {})}
+
+        groups = getattr(config, "facet_groups", None)
+        self.facet_groups: dict[str, dict[str, TermsFacet]] | None = (
+            None
+            if groups is None
+            else {group: {name: self.facets[name] for name in names} for group, names in groups.items()}
+        )
+
+        self._lock = threading.Lock()
+        self._facets_by_groups: OrderedDict[frozenset[str] | None, Mapping[str, TermsFacet]] = OrderedDict()
+        self._aggregations: dict[str, dsl.aggs.Agg] = {}
+        self._aggregations_by_groups: OrderedDict[
+            frozenset[str] | None, tuple[tuple[str, dsl.aggs.Agg], ...]
+        ] = OrderedDict()
+
+    @classmethod
+    def for_config(cls, config: type[SearchOptions]) -> PrecomputedFacets:
+        """Return precomputed facets for the search options, creating them on the first call."""
+        # vars() so that subclasses of search options do not see facets of their parent
+        precomputed = vars(config).get("_precomputed_facets")
+        if precomputed is None:
+            precomputed = cls(config)
+            setattr(config, "_precomputed_facets", precomputed)  # noqa: B010
+        return cast("PrecomputedFacets", precomputed)
+
+    def _lookup[T](self, cache: OrderedDict[frozenset[str] | None, T], groups: frozenset[str] | None) -> T | None:
+        """Return the memoized value for the groups, marking it as recently used."""
+        with self._lock:
+            value = cache.get(groups)
+            if value is not None:
+                cache.move_to_end(groups)
+            return value
+
+    def _store[T](self, cache: OrderedDict[frozenset[str] | None, T], groups: frozenset[str] | None, value: T) -> T:
+        """Memoize the value for the groups, evicting the least recently used sets of groups."""
+        with self._lock:
+            value = cache.setdefault(groups, value)
+            cache.move_to_end(groups)
+            while len(cache) > self.max_group_sets:
+                cache.popitem(last=False)
+            return value
+
+    def facets_for_groups(self, groups: frozenset[str] | None) -> Mapping[str, TermsFacet]:
+        """Return a read-only mapping of facets visible to members of the given groups.
+
+        ``None`` means that all facets are visible. Otherwise, the facets are those
+        of the ``default`` group merged with facets of the given groups.
+        """
+        memoized = self._lookup(self._facets_by_groups, groups)
+        if memoized is not None:
+            return memoized
+
+        if groups is None or not self.facet_groups:
+            user_facets = self.facets
+        else:
+            user_facets = {**self.facet_groups.get("default", {})}
+            for group, group_facets in self.facet_groups.items():
+                if group in groups:
+                    user_facets.update(group_facets)
+
+        return self._store(self._facets_by_groups, groups, MappingProxyType(user_facets))
+
+    def aggregation(self, name: str, facet: TermsFacet) -> dsl.aggs.Agg:
+        """Return the aggregation of the facet with its search body serialized only once."""
+        try:
+            return self._aggregations[name]
+        except KeyError:
+            pass
+        return self._aggregations.setdefault(name, precomputed_aggregation(facet.get_aggregation()))
+
+    def aggregations_for_groups(self, groups: frozenset[str] | None) -> tuple[tuple[str, dsl.aggs.Agg], ...]:
+        """Return aggregations of facets visible to members of the given groups.
+
+        The aggregation objects are shared, DSL search makes a copy of them
+        whenever they are accessed for modification.
+        """
+        memoized = self._lookup(self._aggregations_by_groups, groups)
+        if memoized is not None:
+            return memoized
+        aggregations = tuple(
+            (name, self.aggregation(name, facet)) for name, facet in self.facets_for_groups(groups).items()
+        )
+        return self._store(self._aggregations_by_groups, groups, aggregations)
+
+
+@dataclasses.dataclass(frozen=True)
+class FacetSelection:
+    """Facets and facet filters selected for a single search request.
+
+    It is passed to ``FacetsResponse`` in place of the facets param, so the
+    response iterates only over facets visible to the identity. Neither the
+    facets param nor the shared facet definitions are modified per request.
+    """
+
+    facets: Mapping[str, TermsFacet]
+    """Facets visible to the identity."""
+
+    groups: frozenset[str] | None
+    """Facet groups of the identity, None if all facets are visible."""
+
+    selected_values: Mapping[str, list] = dataclasses.field(default_factory=lambda: MappingProxyType({}))
+    """Facet values selected by the user, keyed by facet name."""
+
+    filters: Mapping[str, Any] = dataclasses.field(default_factory=lambda: MappingProxyType({}))
+    """Filter queries for the selected values, keyed by facet name."""
+
+
 class GroupedFacetsParam(FacetsParam):
-    """Facet parameter class that supports grouping of facets."""
+    """Facet parameter class that supports grouping of facets.
+
+    The param does not keep any per-request state when used via ``apply``,
+    so it is safe to use in multi-threaded workers.
+    """
 
     def __init__(self, config: type[SearchOptions]):
         """Initialize the facets parameter with the given config."""
         super().__init__(config)
-        self._facets = {**config.facets}
+        self._precomputed = PrecomputedFacets.for_config(config)
 
     @property
-    def facets(self) -> dict[str, TermsFacet]:
-        """Return the facets dictionary."""
-        return self._facets
+    def facets(self) -> Mapping[str, TermsFacet]:
+        """Return a read-only view of the facets shared by all params of the same search options."""
+        return MappingProxyType(self._precomputed.facets)
 
     def identity_facet_groups(self, identity: Identity) -> list[str]:
         """Return the facet groups for the given identity."""
@@ -63,77 +195,99 @@ class GroupedFacetsParam(FacetsParam):
     @property
     def facet_groups(self) -> dict[str, Any] | None:
         """Return facet groups."""
-        groups = getattr(self.config, "facet_groups", None)
-        if groups is None:
-            return None
-
-        facets = getattr(self.config, "facets", {})
-        return {group: {name: facets[name] for name in names} for group, names in groups.items()}
+        return self._precomputed.facet_groups
 
-    def identity_facets(self, identity: Identity) -> dict[str, TermsFacet]:
-        """Return the facets for the given identity."""
+    def identity_groups(self, identity: Identity) -> frozenset[str] | None:
+        """Return facet groups of the identity, None if the identity can see all facets."""
         if not self.facet_groups:
-            return self.facets
+            return None
 
         has_system_user_id = identity.id == system_user_id
         has_system_process_need = any(need.method == "system_process" for need in identity.provides)
         if has_system_user_id or has_system_process_need:
+            return None
+
+        return frozenset(self.identity_facet_groups(identity))
+
+    def identity_facets(self, identity: Identity) -> Mapping[str, TermsFacet]:
+        """Return the facets for the given identity."""
+        groups = self.identity_groups(identity)
+        if groups is None:
             return self.facets
 
-        return self._filter_user_facets(identity)
+        return self._filter_user_facets(identity, groups)
 
     def aggregate_with_user_facets(
-        self, search: RecordsSearchV2, user_facets: dict[str, TermsFacet]
+        self, search: RecordsSearchV2, user_facets: Mapping[str, TermsFacet]
     ) -> RecordsSearchV2:
         """Add aggregations representing the user facets."""
         for name, facet in user_facets.items():
-            agg = facet.get_aggregation()
+            if self.facets.get(name) is facet:
+                agg = self._precomputed.aggregation(name, facet)
+            else:
+                agg = facet.get_aggregation()
             search.aggs.bucket(name, agg)
 
         return search
 
-    def filter(self, search: RecordsSearchV2) -> RecordsSearchV2:
-        """Apply a post filter on the search."""
-        if not self._filters:
+    def filter(self, search: RecordsSearchV2, filters: Mapping[str, Any] | None = None) -> RecordsSearchV2:
+        """Apply a post filter on the search.
+
+        :param filters: filter queries keyed by facet name, filters added by ``add_filter`` if not passed.
+        """
+        if filters is None:
+            filters = self._filters
+        if not filters:
             return search
 
-        filters = list(self._filters.values())
+        filter_queries = list(filters.values())
 
-        _filter = filters[0]
-        for f in filters[1:]:
-            _filter &= f
+        # one bool query instead of a chain of intermediate queries created by &=
+        _filter = filter_queries[0] if len(filter_queries) == 1 else dsl.Q("bool", must=filter_queries)
 
         return search.filter(_filter).post_filter(_filter)
 
-    def apply(self, identity: Identity, search: RecordsSearchV2, params: dict) -> RecordsSearchV2:
-        """Evaluate the facets on the search."""
-        facets_values = params.pop("facets", {})
+    def select(self, identity: Identity, facets_values: dict[str, list]) -> FacetSelection:
+        """Create the per-request selection of facets and facet filters."""
+        selected_values: dict[str, list] = {}
+        filters: dict[str, Any] = {}
         for name, values in facets_values.items():
-            if name in self.facets:
-                self.add_filter(name, values)
+            facet = self.facets.get(name)
+            if facet is None:
+                continue
+            selected_values[name] = values
+            f = facet.add_filter(values)
+            if f is not None:
+                filters[name] = f
+
+        groups = self.identity_groups(identity)
+        return FacetSelection(
+            facets=self._precomputed.facets_for_groups(groups),
+            groups=groups,
+            selected_values=MappingProxyType(selected_values),
+            filters=MappingProxyType(filters),
+        )
 
-        user_facets = self.identity_facets(identity)
-        self_copy = copy.copy(self)
-        self_copy._facets = user_facets  # noqa: SLF001 - TODO: this looks like a hack
-        search = search.response_class(FacetsResponse.create_response_cls(self_copy))
+    def apply(self, identity: Identity, search: RecordsSearchV2, params: dict) -> RecordsSearchV2:
+        """Evaluate the facets on the search."""
+        selection = self.select(identity, params.pop("facets", {}))
+        search = search.response_class(FacetsResponse.create_response_cls(selection))
 
-        search = self.aggregate_with_user_facets(search, user_facets)
-        search = self.filter(search)
+        for name, agg in self._precomputed.aggregations_for_groups(selection.groups):
+            search.aggs.bucket(name, agg)
+        search = self.filter(search, selection.filters)
 
-        params.update(self.selected_values)
+        params.update(selection.selected_values)
 
         return search
 
-    def _filter_user_facets(self, identity: Identity) -> dict[str, TermsFacet]:
+    def _filter_user_facets(
+        self, identity: Identity, groups: frozenset[str] | None = None
+    ) -> Mapping[str, TermsFacet]:
         """Filter user facets based on the identity."""
-        user_facets = {}
         if not self.facet_groups:
-            user_facets.update(self.facets)  # pragma: no cover
-        else:
-            self.facets.clear()  # TODO: why is this needed?
-            user_facets.update(self.facet_groups.get("default", {}))
+            return self.facets  # pragma: no cover
 
-        groups = self.identity_facet_groups(identity)
-        for group in groups:
-            user_facets.update((self.facet_groups or {}).get(group, {}))
-        return user_facets
+        if groups is None:
+            groups = frozenset(self.identity_facet_groups(identity))
+        return self._precomputed.facets_for_groups(groups)
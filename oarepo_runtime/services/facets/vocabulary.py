@@ -0,0 +1,161 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+
+"""Facets labelled with vocabulary titles."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, override
+
+from invenio_i18n.ext import current_i18n
+from invenio_vocabularies.services.facets import get_vocabs
+from marshmallow_utils.fields.babel import gettext_from_dict
+
+from .base import LabelledValuesTermsFacet
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class VocabularyLabelsCache:
+    """Thread-safe, bounded LRU process cache of localized vocabulary labels with expiration.
+
+    Labels are stored per (vocabulary, locale, vocabulary item id), so that
+    different locales of the same item expire independently. Expired labels
+    are removed when they are looked up. When the cache is full, all expired
+    labels are purged first, then the least recently used labels are evicted.
+    """
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        """Create an empty cache.
+
+        :param maxsize: maximum number of cached labels, 0 disables the cache.
+        """
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._labels: OrderedDict[tuple[str, str, str], tuple[float, str]] = OrderedDict()
+
+    def get_many(self, vocabulary: str, locale: str, ids: Iterable[str]) -> tuple[dict[str, str], list[str]]:
+        """Return cached labels of the ids and a list of ids that are not cached (or have expired)."""
+        now = time.monotonic()
+        found: dict[str, str] = {}
+        missing: list[str] = []
+        with self._lock:
+            for id_ in ids:
+                key = (vocabulary, locale, id_)
+                entry = self._labels.get(key)
+                if entry is not None and entry[0] > now:
+                    self._labels.move_to_end(key)
+                    found[id_] = entry[1]
+                    continue
+                if entry is not None:
+                    del self._labels[key]
+                missing.append(id_)
+        return found, missing
+
+    def set_many(self, vocabulary: str, locale: str, labels: dict[str, str], ttl: float) -> None:
+        """Store labels that expire after ``ttl`` seconds, purging expired and least recently used labels."""
+        now = time.monotonic()
+        expires = now + ttl
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            for id_, label in labels.items():
+                key = (vocabulary, locale, id_)
+                self._labels[key] = (expires, label)
+                self._labels.move_to_end(key)
+            if len(self._labels) > self.maxsize:
+                for key in [key for key, (entry_expires, _) in self._labels.items() if entry_expires <= now]:
+                    del self._labels[key]
+            while len(self._labels) > self.maxsize:
+                self._labels.popitem(last=False)
+
+    def clear(self, vocabulary: str | None = None) -> None:
+        """Remove all labels, or only labels of the given vocabulary."""
+        with self._lock:
+            if vocabulary is None:
+                self._labels.clear()
+            else:
+                for key in [key for key in self._labels if key[0] == vocabulary]:
+                    del self._labels[key]
+
+    def __len__(self) -> int:
+        """Return the number of cached labels, including expired ones that have not been purged yet."""
+        with self._lock:
+            return len(self._labels)
+
+
+vocabulary_labels_cache = VocabularyLabelsCache()
+"""Process-wide cache of vocabulary labels used by vocabulary facets.
+
+The size is set from ``OAREPO_RUNTIME_VOCABULARY_LABELS_CACHE_SIZE`` when the application is initialized.
+"""
+
+
+class VocabularyFacet(LabelledValuesTermsFacet):
+    """Terms facet labelled with titles of vocabulary items.
+
+    Titles of all bucket keys of a response are resolved at once - keys whose
+    labels are not in the cache are fetched in a single vocabulary search.
+    Keys that are not found in the vocabulary are labelled with themselves.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        vocabulary: str,
+        service_id: str | None = None,
+        cache_ttl: float = 3600,
+        **kwargs: Any,
+    ):
+        """Initialize the facet.
+
+        :param vocabulary: the vocabulary type of the facet values.
+        :param service_id: the id of the registered service used to fetch the vocabulary items,
+            vocabularies service by default.
+        :param cache_ttl: expiration of cached labels in seconds.
+        """
+        self.vocabulary = vocabulary
+        self.service_id = service_id
+        self.cache_ttl = cache_ttl
+        super().__init__(*args, **kwargs)
+
+    @override
+    def value_labels(self, values: list) -> dict:
+        """Label the values with vocabulary titles in the current locale."""
+        return self.localized_value_labels(values, str(current_i18n.locale))
+
+    @override
+    def localized_value_labels(self, values: list, locale: str) -> dict:
+        """Label the values with vocabulary titles in the given locale."""
+        if not values:
+            return {}
+        locale = str(locale)
+        cache_key = f"{self.service_id or ''}:{self.vocabulary}"
+        labels, missing = vocabulary_labels_cache.get_many(cache_key, locale, values)
+        if missing:
+            resolved = self.resolve_labels(missing, locale)
+            # cache unknown values as well so that they are not searched for on every request
+            resolved = {id_: resolved.get(id_, id_) for id_ in missing}
+            vocabulary_labels_cache.set_many(cache_key, locale, resolved, self.cache_ttl)
+            labels.update(resolved)
+        return {val: labels[val] for val in values}
+
+    def resolve_labels(self, values: list[str], locale: str) -> dict[str, str]:
+        """Fetch titles of the vocabulary items in a single search.
+
+        :return: mapping of item id to its title; ids of items not found in the vocabulary are missing.
+        """
+        return {
+            vocab["id"]: gettext_from_dict(vocab.get("title") or {}, locale, "en") or vocab["id"]
+            for vocab in get_vocabs(self.service_id, self.vocabulary, ("id", "title"), values)
+        }
@@ -10,10 +10,13 @@
 
 from __future__ import annotations
 
+import threading
+import time
 import warnings
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Literal, override
 
+import sqlalchemy as sa
 from invenio_access.models import ActionRoles, ActionUsers
 from invenio_administration.generators import (
     Administration,
@@ -27,14 +30,19 @@ from invenio_records_permissions.generators import (
     ConditionalGenerator as InvenioConditionalGenerator,
 )
 from invenio_records_permissions.generators import Generator as InvenioGenerator
+from invenio_db import db
 from invenio_search.engine import dsl
 
+from oarepo_runtime.records.systemfields.draft_type import get_draft_type
+from oarepo_runtime.request_cache import clear_request_cache, request_cache
+
 if TYPE_CHECKING:
     from collections.abc import Collection, Sequence
 
-    from flask_principal import Need
+    from flask_principal import Identity, Need
     from invenio_rdm_records.records.api import RDMRecord
     from invenio_records.api import Record
+    from sqlalchemy.orm import ORMExecuteState
 
 
 class Generator(InvenioGenerator):
@@ -137,7 +145,12 @@ class AggregateGenerator(CompositeGenerator):
 
 
 class IfDraftType(ConditionalGenerator):
-    """Match if record is a draft of specified type(s)."""
+    """Match if record is a draft of specified type(s).
+
+    If the record class has a :class:`~oarepo_runtime.records.systemfields.DraftTypeSystemField`,
+    the type is taken from it. Pass the indexed path of the field as ``draft_type_field``
+    to filter searches by an exact term query on the field.
+    """
 
     def __init__(
         self,
@@ -146,16 +159,20 @@ class IfDraftType(ConditionalGenerator):
         ),
         then_: (InvenioGenerator | list[InvenioGenerator] | tuple[InvenioGenerator] | None) = None,
         else_: (InvenioGenerator | list[InvenioGenerator] | tuple[InvenioGenerator] | None) = None,
+        draft_type_field: str | None = None,
     ):
         """Create the generator.
 
         :param draft_types: One or more of 'initial', 'metadata', 'new_version'.
         :param then_: Generators to use if condition matches.
         :param else_: Generators to use if condition does not match.
+        :param draft_type_field: Path of the indexed draft type field. If not set, only 'initial'
+            drafts can be filtered in searches.
         """
         if not isinstance(draft_types, (list, tuple)):
             draft_types = [draft_types]
         self._draft_types = draft_types
+        self._draft_type_field = draft_type_field
         if not then_:
             then_ = [Disable()]
         if not else_:
@@ -172,32 +189,22 @@ class IfDraftType(ConditionalGenerator):
         if not record:
             return False
 
-        index = record.versions.index
-        is_latest = record.versions.is_latest
-        is_draft = record.is_draft
-
-        if not is_draft:
-            return False
-
-        if index == 1 and not is_latest:
-            draft_type = "initial"
-        elif index > 1 and not is_latest:
-            draft_type = "new_version"
-        else:
-            draft_type = "metadata"
-
-        return draft_type in self._draft_types
+        draft_type = get_draft_type(record)
+        return draft_type is not None and draft_type in self._draft_types
 
     @override
     def _query_instate(self, **_context: Any) -> dsl.query.Query:
+        if self._draft_type_field:
+            return dsl.Q("terms", **{self._draft_type_field: list(self._draft_types)})
+
         queries = []
         if "initial" in self._draft_types:
             queries.append(dsl.Q("term", **{"versions.index": 1}) & dsl.Q("term", **{"metadata.is_latest_draft": True}))
         if "metadata" in self._draft_types:
-            # unknown how the "edit_metadata" type of draft could be differentiated from new_version
+            # edit_metadata drafts can be differentiated from new_version only by the draft type field
             queries.append(dsl.Q("match_none"))
         if "new_version" in self._draft_types:
-            # unknown how the "new_version" type of draft could be differentiated from edit_metadata
+            # new_version drafts can be differentiated from edit_metadata only by the draft type field
             queries.append(dsl.Q("match_none"))
         if not queries:
             # No recognized draft types; match no documents explicitly
@@ -205,6 +212,121 @@ class IfDraftType(ConditionalGenerator):
         return dsl.Q("bool", should=queries, minimum_should_match=1)
 
 
+class ActionAccessCache:
+    """Thread-safe cache of action access results with a time to live.
+
+    The cache is local to the process. Grants and revocations made through
+    the database session of this process, including bulk ORM updates and deletes,
+    invalidate it immediately. Changes made by other processes or by plain SQL
+    become visible after the time to live expires.
+    """
+
+    def __init__(self, ttl: float = 60) -> None:
+        """Create an empty cache.
+
+        :param ttl: number of seconds a result is kept, 0 disables the cache.
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[Any, tuple[float, bool]] = {}
+
+    def get(self, key: Any) -> bool | None:
+        """Return the cached result for the key or None if it is not cached or has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Any, value: bool) -> None:
+        """Store the result for the key."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+action_access_cache = ActionAccessCache()
+"""Process-wide cache of results of :class:`ActionQueryFilterMixin` access checks."""
+
+ACTION_ACCESS_REQUEST_CACHE = "action_access"
+
+
+def _invalidate_action_access(*_args: Any) -> None:
+    """Drop all cached action access results when an action is granted or revoked."""
+    action_access_cache.clear()
+    clear_request_cache(ACTION_ACCESS_REQUEST_CACHE)
+
+
+def _invalidate_action_access_on_bulk(orm_execute_state: ORMExecuteState) -> None:
+    """Drop cached action access results on bulk updates and deletes, which emit no mapper events.
+
+    invenio-access revokes actions by ``query.delete(synchronize_session=False)``.
+    """
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in (ActionUsers, ActionRoles):
+        _invalidate_action_access()
+
+
+for _model in (ActionUsers, ActionRoles):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        sa.event.listen(_model, _event, _invalidate_action_access)
+sa.event.listen(sa.orm.Session, "do_orm_execute", _invalidate_action_access_on_bulk)
+
+
+def has_action_access(identity: Identity, action: str) -> bool:
+    """Return True if the user or one of the roles of the identity is allowed the action.
+
+    The result is cached for the current request and, for a short time, in
+    :data:`action_access_cache`.
+    """
+    user_ids = tuple(sorted(need.value for need in identity.provides if need.method == "id"))
+    user_roles = frozenset(need.value for need in identity.provides if need.method == "role")
+    if not user_ids and not user_roles:
+        return False
+
+    key = (user_ids[:1], user_roles, action)
+    cache = request_cache(ACTION_ACCESS_REQUEST_CACHE)
+    if cache is not None and key in cache:
+        return bool(cache[key])
+
+    allowed = action_access_cache.get(key)
+    if allowed is None:
+        conditions = []
+        if user_ids:
+            conditions.append(
+                sa.exists().where(
+                    ActionUsers.user_id == user_ids[0],
+                    ActionUsers.action == action,
+                    ActionUsers.exclude.is_(False),
+                )
+            )
+        if user_roles:
+            conditions.append(
+                sa.exists().where(
+                    ActionRoles.role_id.in_(user_roles),
+                    ActionRoles.action == action,
+                    ActionRoles.exclude.is_(False),
+                )
+            )
+        allowed = bool(db.session.execute(sa.select(sa.or_(*conditions))).scalar())
+        action_access_cache.set(key, allowed)
+
+    if cache is not None:
+        cache[key] = allowed
+    return allowed
+
+
 class ActionQueryFilterMixin:
     """Administration mixin that filters users based on action access."""
 
@@ -212,27 +334,8 @@ class ActionQueryFilterMixin:
 
     def query_filter(self, **kwargs: Any) -> dsl.query.Query | list[dsl.query.Query] | None:
         """Return search filter that allows all in case user (or one of the roles the user belongs to) has access."""
-        identity = kwargs["identity"]
-        user_ids = [need.value for need in identity.provides if need.method == "id"]
-
-        if user_ids:
-            has_direct_access = ActionUsers.query.filter(
-                ActionUsers.user_id == user_ids[0],
-                ActionUsers.action == self.access_action.value,
-                ActionUsers.exclude.is_(False),
-            ).count()
-            if has_direct_access:
-                return dsl.query.MatchAll()
-
-        user_roles = [need.value for need in identity.provides if need.method == "role"]
-        if user_roles:
-            has_access_through_roles = ActionRoles.query.filter(
-                ActionRoles.role_id.in_(user_roles),
-                ActionRoles.action == self.access_action.value,
-                ActionRoles.exclude.is_(False),
-            ).count()
-            if has_access_through_roles:
-                return dsl.query.MatchAll()
+        if has_action_access(kwargs["identity"], self.access_action.value):
+            return dsl.query.MatchAll()
 
         # If no direct access or roles, return no match
         return dsl.query.MatchNone()
@@ -0,0 +1,165 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+
+"""Query parser caching transformed queries."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from invenio_records_resources.services.errors import QuerystringValidationError
+from invenio_records_resources.services.records.queryparser import QueryParser
+from invenio_records_resources.services.records.queryparser.transformer import RestrictedTerm, RestrictedTermValue
+from invenio_search.engine import dsl
+from luqum.auto_head_tail import auto_head_tail
+from luqum.exceptions import ParseError
+from luqum.parser import parser as luqum_parser
+
+
+class QueryCache:
+    """Thread-safe LRU cache of transformed queries with hit-rate statistics."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Create an empty cache.
+
+        :param maxsize: maximum number of cached queries, 0 disables the cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+
+    def get(self, key: Any) -> tuple[bool, Any]:
+        """Return a tuple (found, value) for the key, marking the entry as recently used."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store the value, evicting the least recently used entries if the cache is full."""
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return hits, misses, hit rate and size of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+query_cache = QueryCache()
+"""Process-wide cache of queries transformed by ``CachedQueryParser``.
+
+The size is set from ``OAREPO_RUNTIME_QUERY_CACHE_SIZE`` when the application is initialized.
+"""
+
+
+class CachedQueryParser(QueryParser):
+    """Query parser that caches parsed and transformed query strings.
+
+    Use it in place of ``QueryParser`` in search options::
+
+        class SearchOptions:
+            query_parser_cls = CachedQueryParser.factory(
+                tree_transformer_cls=SearchQueryValidator,
+                fields=["metadata.title^2", "metadata.description"],
+            )
+
+    The cache is keyed by the query string, the tree transformer and the parameters
+    given to the factory (including mapping and allow list), so queries of different
+    search options never share an entry. The tree transformer must not depend
+    on the identity of the caller, as the transformed queries are shared between users.
+    Queries of search options whose mapping contains ``RestrictedTerm`` or
+    ``RestrictedTermValue`` depend on the identity and are therefore never cached.
+    """
+
+    def __init__(
+        self,
+        identity: Any = None,
+        extra_params: dict[str, Any] | None = None,
+        tree_transformer_cls: Any = None,
+    ):
+        """Initialise the parser."""
+        super().__init__(identity=identity, extra_params=extra_params, tree_transformer_cls=tree_transformer_cls)
+        # the factory passes the same extra_params on each instantiation, so its identity
+        # identifies the search options; the dictionary is kept alive by the cached entries
+        self._factory_params = extra_params
+        self._identity_dependent = any(
+            isinstance(value, (RestrictedTerm, RestrictedTermValue)) for value in self.mapping.values()
+        )
+
+    def parse(self, query_str: str) -> dsl.query.Query:
+        """Parse the query, using the cached transformed query if available."""
+        if self._identity_dependent:
+            transformed = self.transform(query_str)
+        else:
+            key = (query_str, self.tree_transformer_cls, id(self._factory_params))
+            found, cached = query_cache.get(key)
+            if found:
+                transformed = cached[1]
+            else:
+                transformed = self.transform(query_str)
+                query_cache.set(key, (self._factory_params, transformed))
+
+        if transformed is None:
+            return self.fallback_query(query_str)
+        return dsl.Q("query_string", query=transformed, **self.extra_params)
+
+    def transform(self, query_str: str) -> str | None:
+        """Parse and transform the query string.
+
+        :return: the transformed query string or None if the query is invalid.
+        """
+        try:
+            tree = luqum_parser.parse(query_str)
+            if self.tree_transformer_cls is None:
+                return query_str
+            transformer = self.tree_transformer_cls(
+                mapping=self.mapping,
+                allow_list=self.allow_list,
+            )
+            new_tree = transformer.visit(tree, context={"identity": self.identity})
+            return str(auto_head_tail(new_tree))
+        except (ParseError, QuerystringValidationError):
+            return None
+
+    def fallback_query(self, query_str: str) -> dsl.query.Query:
+        """Return a multi-match query used for query strings that can not be parsed."""
+        if self.allow_list:
+            # if there is an allow list it must overwrite a potential value
+            # given by the query to include it in the fields
+            return dsl.Q("multi_match", query=query_str, **{**self.extra_params, "fields": self.fields})
+        return dsl.Q("multi_match", query=query_str, **self.extra_params)
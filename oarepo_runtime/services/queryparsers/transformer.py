@@ -14,10 +14,8 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, Any
 
-from luqum.auto_head_tail import auto_head_tail
-from luqum.parser import parser
-from luqum.tree import Phrase, Term, Word
-from luqum.visitor import TreeTransformer
+from invenio_records_resources.services.records.queryparser.transformer import SearchFieldTransformer
+from luqum.tree import BaseOperation, Phrase, Regex, SearchField, Term, Word
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -51,48 +49,149 @@ ILLEGAL_START_ELASTICSEARCH_CHARACTERS_REGEX = r"^\-"
 
 SEARCH_FIELD_EDGE_CASES_REGEX = r"https?://|doi:|handle:|oai:https://"
 
+ILLEGAL_ELASTICSEARCH_CHARACTERS_RE = re.compile(
+    f"{ILLEGAL_ELASTICSEARCH_CHARACTERS_REGEX}|{ILLEGAL_START_ELASTICSEARCH_CHARACTERS_REGEX}"
+)
+SEARCH_FIELD_EDGE_CASES_RE = re.compile(SEARCH_FIELD_EDGE_CASES_REGEX)
+SPECIAL_CHARACTERS_RE = re.compile(r'[\\/+!(){}\[\]^"~*?:&|-]')
+"""Characters without which no part of the query can be transformed by SearchQueryValidator."""
+
 
 def _get_phrase(val: str) -> Phrase:
     val = val.replace('"', '\\"').replace("'", "\\'")
     return Phrase(f'"{val}"')
 
 
-class SearchQueryValidator(TreeTransformer):
-    """Validate search terms for illegal Elasticsearch characters."""
+def _get_text_phrase(text: str, head: str, tail: str) -> Phrase:
+    """Create a phrase from a part of the query, moving the surrounding whitespace to head and tail."""
+    value = text.strip()
+    phrase = _get_phrase(value)
+    phrase.head = head + text[: len(text) - len(text.lstrip())]
+    phrase.tail = text[len(text.rstrip()) :] + tail
+    return phrase
+
+
+def _is_split_url_start(node: Item) -> bool:
+    """Return True if the node ends with the start of an url that luqum split, such as ``https://``."""
+    if node.tail:
+        return False
+    if isinstance(node, SearchField):
+        node_str = str(node)
+        return node_str.endswith("//") and bool(SEARCH_FIELD_EDGE_CASES_RE.search(node_str))
+    if isinstance(node, BaseOperation) and node.children:
+        return _is_split_url_start(node.children[-1])
+    return False
+
+
+def _is_adjacent(node: Item) -> bool:
+    """Return True if there is no whitespace before the node."""
+    node_str = str(node)
+    return not node.head and bool(node_str) and not node_str[0].isspace()
+
+
+def _join_split_url(start: Item, rest: Item) -> Item:
+    """Join the start of an url with the node containing its rest into a single phrase."""
+    if isinstance(start, SearchField):
+        return _get_text_phrase(str(start) + str(rest), start.head, rest.tail)
+    joined = start.clone_item()
+    joined.children = [*start.children[:-1], _join_split_url(start.children[-1], rest)]
+    joined.tail = rest.tail
+    return joined
+
+
+class SearchQueryValidator(SearchFieldTransformer):
+    """Validate search terms for illegal Elasticsearch characters.
+
+    Terms that would be turned into expensive queries are quoted and thus searched as phrases:
+
+    * words containing illegal characters, including wildcards,
+    * regular expressions,
+    * searches in fields that are not in the allow list (if the allow list is given).
+
+    Field names are translated to index fields through the mapping. Fields mapped to
+    ``FieldValueMapper``, ``RestrictedTerm`` or ``RestrictedTermValue`` are handled by
+    invenio ``SearchFieldTransformer``, which checks the permissions of the identity
+    in the context and maps the searched values.
+    """
 
     def __init__(self, mapping: Any, allow_list: Any, *args: Any, **kwargs: Any):
-        """Initialize the transformer."""
-        _, _ = mapping, allow_list  # currently unused
-        super().__init__(*args, **kwargs)
+        """Initialize the transformer.
+
+        :param mapping: mapping of field names usable in queries to the index fields
+        :param allow_list: index fields that can be searched, all fields if empty
+        """
+        super().__init__(mapping or {}, allow_list or set(), *args, **kwargs)
 
     def visit(self, tree: Item, context: dict[str, Any] | None = None) -> Item:
-        """Transform the tree."""
-        query_str = str(auto_head_tail(tree))
-        if re.search(SEARCH_FIELD_EDGE_CASES_REGEX, query_str):
-            query_str = re.sub(
-                r"(https?://)\s", r"\1", query_str
-            )  # luqum breaks https://.+ into SearchField(http, Regex(//)) and Word/Phrase(.+);
-            new_words = []
-            words = query_str.split()
-            for word in words:
-                if re.search(SEARCH_FIELD_EDGE_CASES_REGEX, word):
-                    new_words.append(_get_phrase(word).value)
-                else:
-                    new_words.append(word)
-            new_query_string = " ".join(new_words)
-            tree = parser.parse(new_query_string)
+        """Transform the tree.
+
+        If the query does not contain any character that might need quoting,
+        the tree is returned untouched.
+        """
+        if not SPECIAL_CHARACTERS_RE.search(str(tree)):
+            return tree
         return super().visit(tree, context=context)
 
+    def clone_children(self, node: Item, new_node: Item, context: dict[str, Any]) -> Generator[Item]:
+        """Clone children, joining urls that luqum split into two nodes into a single phrase.
+
+        luqum parses ``https://doi.org/...`` as ``SearchField(https, Regex(//))`` followed
+        by a node with the rest of the url. The search field might be the last operand
+        of a preceding operation, as in ``x OR https://doi.org/...``.
+        """
+        children = list(node.children)
+        idx = 0
+        while idx < len(children) - 1:
+            if _is_split_url_start(children[idx]) and _is_adjacent(children[idx + 1]):
+                children[idx : idx + 2] = [_join_split_url(children[idx], children[idx + 1])]
+            else:
+                idx += 1
+        for child in children:
+            child_context = self.child_context(node, child, context, new_node=new_node)
+            yield from self.visit_iter(child, context=child_context)
+
+    def visit_search_field(self, node: SearchField, context: Any) -> Generator[Item]:
+        """Map the field name to the index field.
+
+        Url-like search fields (such as ``doi:10.5281/...``) and searches in fields
+        that are not allowed are converted to phrases.
+        """
+        node_str = str(node)
+        if SEARCH_FIELD_EDGE_CASES_RE.search(node_str):
+            yield _get_text_phrase(node_str, node.head, node.tail)
+            return
+
+        field_name = self._mapping.get(node.name, node.name)
+        if not isinstance(field_name, str):
+            # value mappers and restricted terms, raises QuerystringValidationError on denied fields
+            yield from super().visit_search_field(node, context)
+            return
+        if self._allow_list and field_name not in self._allow_list:
+            yield _get_text_phrase(node_str, node.head, node.tail)
+            return
+
+        new_node = node.clone_item()
+        new_node.name = field_name
+        new_node.children = list(self.clone_children(node, new_node, context))
+        yield new_node
+
+    def visit_regex(self, node: Regex, context: Any) -> Generator[Term]:
+        """Convert regular expressions to phrases, as they might be arbitrarily expensive."""
+        _ = context
+        phrase = _get_phrase(node.value)
+        phrase.head, phrase.tail = node.head, node.tail
+        yield phrase
+
     def visit_word(self, node: Word, context: Any) -> Generator[Term]:
         """Transform the word node."""
-        # unused context here but keeping the signature required by luqum visitor
-        _ = context
+        mapper = context.get("field_value_mapper") if context else None
+        if mapper is not None:
+            yield mapper.map_word(node, context=context)
+            return
         val = node.value
 
         # convert to phrase if the value contains an illegal elasticsearch character
-        if re.search(ILLEGAL_ELASTICSEARCH_CHARACTERS_REGEX, val) or re.search(
-            ILLEGAL_START_ELASTICSEARCH_CHARACTERS_REGEX, val
-        ):
+        if ILLEGAL_ELASTICSEARCH_CHARACTERS_RE.search(val):
             # Only \" is valid escape in ES phrases; single quotes don't need escaping
             yield _get_phrase(val)
             return
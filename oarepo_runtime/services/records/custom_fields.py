@@ -12,33 +12,25 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from invenio_records_resources.services.records import (
-    RecordService,
-    RecordServiceConfig,
-)
-
-from oarepo_runtime import current_runtime
+from oarepo_runtime.records.mapping import MappingUpdatePlan
 from oarepo_runtime.records.systemfields.custom_fields import (
-    update_record_system_fields_mapping_relation_field,
+    add_relation_fields_mapping,
 )
 
-if TYPE_CHECKING:
-    from invenio_records_resources.services.base import Service
+from .mapping import get_all_record_classes
 
+if TYPE_CHECKING:
+    from oarepo_runtime.records.mapping import MappingChange
 
-def update_all_records_mappings_relation_fields() -> None:
-    """Update all mappings for the registered record classes."""
-    service: Service
-    for service in current_runtime.services.values():
-        if not isinstance(service, RecordService):
-            continue
-
-        config: RecordServiceConfig = service.config
 
-        record_class = getattr(config, "record_cls", None)
-        if record_class:
-            update_record_system_fields_mapping_relation_field(record_class)
+def update_all_records_mappings_relation_fields(dry_run: bool = False, workers: int = 4) -> list[MappingChange]:
+    """Update all mappings of custom fields relations for the registered record classes.
 
-        draft_class = getattr(config, "draft_cls", None)
-        if draft_class:
-            update_record_system_fields_mapping_relation_field(draft_class)
+    :param dry_run: only return the changes, do not modify the indices
+    :param workers: maximum number of indices updated in parallel
+    :return: changes of the indices
+    """
+    plan = MappingUpdatePlan(source="relation_fields")
+    for record_class in get_all_record_classes():
+        add_relation_fields_mapping(plan, record_class)
+    return plan.execute(dry_run=dry_run, workers=workers)
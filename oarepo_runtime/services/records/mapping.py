@@ -18,14 +18,19 @@ from invenio_records_resources.services.records import (
 )
 
 from oarepo_runtime import current_runtime
-from oarepo_runtime.records.mapping import update_record_system_fields_mapping
+from oarepo_runtime.records.mapping import MappingUpdatePlan
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from invenio_records.api import RecordBase
     from invenio_records_resources.services.base import Service
 
+    from oarepo_runtime.records.mapping import MappingChange
+
 
-def update_all_records_mappings() -> None:
-    """Update all mappings for the registered record classes."""
+def get_all_record_classes() -> Iterator[type[RecordBase]]:
+    """Return record and draft classes of the registered record services."""
     service: Service
     for service in current_runtime.services.values():
         if not isinstance(service, RecordService):
@@ -35,8 +40,24 @@ def update_all_records_mappings() -> None:
 
         record_class = getattr(config, "record_cls", None)
         if record_class:
-            update_record_system_fields_mapping(record_class)
+            yield record_class
 
         draft_class = getattr(config, "draft_cls", None)
         if draft_class:
-            update_record_system_fields_mapping(draft_class)
+            yield draft_class
+
+
+def update_all_records_mappings(dry_run: bool = False, workers: int = 4) -> list[MappingChange]:
+    """Update all mappings for the registered record classes.
+
+    Mappings of all record classes sharing an index are merged and the indices
+    are updated in parallel, see :class:`MappingUpdatePlan`.
+
+    :param dry_run: only return the changes, do not modify the indices
+    :param workers: maximum number of indices updated in parallel
+    :return: changes of the indices
+    """
+    plan = MappingUpdatePlan(source="system_fields")
+    for record_class in get_all_record_classes():
+        plan.add_record_class(record_class)
+    return plan.execute(dry_run=dry_run, workers=workers)
@@ -12,6 +12,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from invenio_access.permissions import Identity
@@ -32,6 +33,37 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _normalize_aggregation(aggregation: Any) -> None:
+    """Convert keys and labels of aggregation buckets to strings, in place.
+
+    Aggregations nested in buckets (or in non-bucket aggregations, such as nested ones)
+    are normalized as well. Values that are already strings are kept as they are.
+    """
+    if not isinstance(aggregation, dict):
+        return
+    buckets = aggregation.get("buckets")
+    if buckets is None:
+        for value in aggregation.values():
+            if isinstance(value, dict):
+                _normalize_aggregation(value)
+        return
+    if isinstance(buckets, dict):
+        buckets = list(buckets.values())
+    if not buckets:
+        return
+    # all buckets of an aggregation have the same shape, so look for sub-aggregations only once
+    sub_aggregations = [name for name, value in buckets[0].items() if isinstance(value, dict)]
+    for bucket in buckets:
+        key = bucket.get("key")
+        if key is not None and not isinstance(key, str):
+            bucket["key"] = str(key)
+        label = bucket.get("label")
+        if label is not None and not isinstance(label, str):
+            bucket["label"] = str(label)
+        for name in sub_aggregations:
+            _normalize_aggregation(bucket.get(name))
+
+
 class ResultComponent:
     """Base class for result components that can modify the serialized record data."""
 
@@ -118,23 +150,20 @@ class RecordList(BaseRecordList):
 
     components: tuple[type[ResultComponent], ...] | property = ()
 
-    @property
+    @cached_property
     def aggregations(self) -> Any:
-        """Get the search result aggregations."""
+        """Get the search result aggregations.
+
+        Keys and labels of all buckets, including buckets of nested aggregations,
+        are converted to strings. The aggregations are computed only once and then
+        cached on the result, as serializers access them repeatedly.
+        """
         try:
             result = super().aggregations
             if result is None:
                 return result  # pragma: no cover
-            for key in result:
-                if "buckets" in result[key]:
-                    for bucket in result[key]["buckets"]:
-                        val = bucket["key"]
-                        label = bucket.get("label", "")
-
-                        if not isinstance(val, str):
-                            bucket["key"] = str(val)
-                        if not isinstance(label, str):
-                            bucket["label"] = str(label)
+            for aggregation in result.values():
+                _normalize_aggregation(aggregation)
         except AttributeError:  # pragma: no cover
             return None  # pragma: no cover
         return result
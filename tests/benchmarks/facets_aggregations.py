@@ -0,0 +1,97 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Benchmark of building facet aggregations for a search request.
+
+Compares building the aggregations from facet definitions on every request
+with the precomputed aggregations used by GroupedFacetsParam on a model with
+40 facets, 10 of them nested.
+
+Run with ``python tests/benchmarks/facets_aggregations.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from types import SimpleNamespace
+
+from flask import Flask
+from flask_principal import Identity, Need
+from invenio_search.engine import dsl
+
+from oarepo_runtime.services.facets.params import GroupedFacetsParam
+from oarepo_runtime.services.facets.utils import build_facet
+
+TERMS_FACET = "invenio_records_resources.services.records.facets.TermsFacet"
+NESTED_FACET = "oarepo_runtime.services.facets.nested_facet.NestedLabeledFacet"
+
+
+def create_facets(terms_count: int = 30, nested_count: int = 10) -> dict:
+    """Create facet definitions of a model."""
+    facets = {}
+    for idx in range(terms_count):
+        facets[f"metadata.field{idx}"] = build_facet(
+            [{"facet": TERMS_FACET, "field": f"metadata.field{idx}", "label": f"Field {idx}"}]
+        )
+    for idx in range(nested_count):
+        facets[f"metadata.nested{idx}.value"] = build_facet(
+            [
+                {"facet": NESTED_FACET, "path": f"metadata.nested{idx}"},
+                {"facet": TERMS_FACET, "field": f"metadata.nested{idx}.value", "label": f"Nested {idx}"},
+            ]
+        )
+    return facets
+
+
+def per_request_aggregations(facets: dict, selected: dict) -> dict:
+    """Build aggregations and filters from facet definitions, as done before precomputation."""
+    search = dsl.Search()
+    for name, facet in facets.items():
+        search.aggs.bucket(name, facet.get_aggregation())
+    filters = [facets[name].add_filter(values) for name, values in selected.items()]
+    _filter = filters[0]
+    for f in filters[1:]:
+        _filter &= f
+    search = search.filter(_filter).post_filter(_filter)
+    return search.to_dict()
+
+
+def precomputed_aggregations(config: SimpleNamespace, identity: Identity, selected: dict) -> dict:
+    """Build the search via GroupedFacetsParam."""
+    search = GroupedFacetsParam(config).apply(identity, dsl.Search(), {"facets": selected})  # type: ignore[arg-type]
+    return search.to_dict()
+
+
+def main(number: int = 2000) -> None:
+    """Run the benchmark and print time per request."""
+    facets = create_facets()
+    names = list(facets)
+    config = SimpleNamespace(
+        facets=facets,
+        facet_groups={"default": names[:20], "curator": names[20:]},
+    )
+    identity = Identity(1)
+    identity.provides.add(Need(method="role", value="curator"))
+    selected = {names[0]: ["a"], names[5]: ["b", "c"], names[25]: ["d"]}
+
+    app = Flask(__name__)
+    with app.app_context():
+        assert per_request_aggregations(facets, selected)["aggs"] == precomputed_aggregations(
+            config, identity, selected
+        )["aggs"]
+
+        for label, func in (
+            ("per request", lambda: per_request_aggregations(facets, selected)),
+            ("precomputed", lambda: precomputed_aggregations(config, identity, selected)),
+        ):
+            elapsed = timeit.timeit(func, number=number)
+            print(f"{label:>12}: {elapsed / number * 1e6:8.1f} us/request")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
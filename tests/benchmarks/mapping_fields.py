@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Benchmark of discovery of mapping system fields of a record class.
+
+Compares ``inspect.getmembers``, which evaluates every attribute of the class,
+with the cached lookup used by ``get_mapping_fields``.
+
+Run with ``python tests/benchmarks/mapping_fields.py``.
+"""
+
+from __future__ import annotations
+
+import inspect
+import timeit
+
+from invenio_records_resources.records.api import Record
+
+from oarepo_runtime.records.mapping import get_mapping_fields
+from oarepo_runtime.records.systemfields import PublicationStatusSystemField
+from oarepo_runtime.records.systemfields.mapping import MappingSystemFieldMixin
+
+
+class BenchmarkRecord(Record):  # type: ignore[misc]
+    """Record with a couple of mapping fields."""
+
+    status = PublicationStatusSystemField()
+    other_status = PublicationStatusSystemField("other_status")
+
+
+def getmembers_mapping_fields(record_class: type) -> list:
+    """Discover the mapping fields as done before the cache."""
+    return [attr for _, attr in inspect.getmembers(record_class, lambda x: isinstance(x, MappingSystemFieldMixin))]
+
+
+def main(number: int = 2000) -> None:
+    """Run the benchmark and print time per lookup."""
+    assert getmembers_mapping_fields(BenchmarkRecord) == list(get_mapping_fields(BenchmarkRecord))
+
+    for label, func in (
+        ("getmembers", lambda: getmembers_mapping_fields(BenchmarkRecord)),
+        ("cached", lambda: list(get_mapping_fields(BenchmarkRecord))),
+    ):
+        elapsed = timeit.timeit(func, number=number)
+        print(f"{label:>10}: {elapsed / number * 1e6:8.2f} us/lookup")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
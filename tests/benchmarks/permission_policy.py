@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Benchmark of permission checks of EveryonePermissionPolicy.
+
+Compares the invenio permission policy, which calls all generators and
+expands action needs separately for needs and excludes, with the policy
+evaluated from a precomputed plan.
+
+Run with ``python tests/benchmarks/permission_policy.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from cachelib import SimpleCache
+from flask import Flask
+from flask_principal import Identity
+from invenio_access import InvenioAccess
+from invenio_access.permissions import any_user
+from invenio_db import InvenioDB
+from invenio_records_permissions import RecordPermissionPolicy
+
+from oarepo_runtime.services.config import EveryonePermissionPolicy
+
+
+class PlainEveryonePermissionPolicy(RecordPermissionPolicy):
+    """EveryonePermissionPolicy without precomputed plans."""
+
+
+for _name, _value in vars(EveryonePermissionPolicy).items():
+    if _name.startswith("can_"):
+        setattr(PlainEveryonePermissionPolicy, _name, _value)
+
+
+def main(number: int = 20000) -> None:
+    """Run the benchmark and print time per permission check."""
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    InvenioDB(app)
+    InvenioAccess(app, cache=SimpleCache())
+    identity = Identity(None)
+    identity.provides.add(any_user)
+
+    with app.app_context():
+        from invenio_db import db
+
+        db.create_all()
+        for label, policy_cls in (("invenio", PlainEveryonePermissionPolicy), ("compiled", EveryonePermissionPolicy)):
+            assert policy_cls("read").allows(identity)
+            elapsed = timeit.timeit(lambda policy_cls=policy_cls: policy_cls("read").allows(identity), number=number)
+            print(f"{label:>9}: {elapsed / number * 1e6:8.2f} us/check")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Benchmark of SearchQueryValidator on a corpus of user queries.
+
+Compares the previous implementation, which stringified the whole tree, used
+uncompiled regular expressions and parsed the query again when it contained
+an url, with the current one.
+
+Run with ``python tests/benchmarks/query_validator.py``.
+"""
+
+from __future__ import annotations
+
+import re
+import timeit
+from typing import TYPE_CHECKING, Any
+
+from luqum.auto_head_tail import auto_head_tail
+from luqum.parser import parser
+from luqum.visitor import TreeTransformer
+
+from oarepo_runtime.services.queryparsers.transformer import (
+    ILLEGAL_ELASTICSEARCH_CHARACTERS_REGEX,
+    ILLEGAL_START_ELASTICSEARCH_CHARACTERS_REGEX,
+    SEARCH_FIELD_EDGE_CASES_REGEX,
+    SearchQueryValidator,
+    _get_phrase,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from luqum.tree import Item, Term, Word
+
+QUERIES = [
+    "climate change",
+    "machine learning",
+    "covid",
+    "novák",
+    "soil moisture europe",
+    "metadata.title:ocean",
+    "title:water AND creators.name:Smith",
+    "\"linked data\" OR rdf",
+    "dataset*",
+    "https://doi.org/10.5281/zenodo.18184329",
+    "doi:10.5281/zenodo.18184329",
+    "handle:11372/LRT-707",
+    "lalala http://www.tralala.fyi falala",
+    "c++ compiler",
+    "what is (this)?",
+    "year:[2000 TO 2010]",
+    "protein folding alphafold",
+    "Czech national corpus",
+    "-negative term",
+    "speech recognition czech",
+]
+"""Typical user queries, most of them plain words."""
+
+
+class LegacySearchQueryValidator(TreeTransformer):
+    """SearchQueryValidator before precompiled regexes and token level url handling."""
+
+    def __init__(self, mapping: Any, allow_list: Any, *args: Any, **kwargs: Any):
+        """Initialize the transformer."""
+        _, _ = mapping, allow_list
+        super().__init__(*args, **kwargs)
+
+    def visit(self, tree: Item, context: dict[str, Any] | None = None) -> Item:
+        """Transform the tree."""
+        query_str = str(auto_head_tail(tree))
+        if re.search(SEARCH_FIELD_EDGE_CASES_REGEX, query_str):
+            query_str = re.sub(r"(https?://)\s", r"\1", query_str)
+            new_words = []
+            for word in query_str.split():
+                if re.search(SEARCH_FIELD_EDGE_CASES_REGEX, word):
+                    new_words.append(_get_phrase(word).value)
+                else:
+                    new_words.append(word)
+            tree = parser.parse(" ".join(new_words))
+        return super().visit(tree, context=context)
+
+    def visit_word(self, node: Word, context: Any) -> Generator[Term]:
+        """Transform the word node."""
+        _ = context
+        val = node.value
+        if re.search(ILLEGAL_ELASTICSEARCH_CHARACTERS_REGEX, val) or re.search(
+            ILLEGAL_START_ELASTICSEARCH_CHARACTERS_REGEX, val
+        ):
+            yield _get_phrase(val)
+            return
+        yield node
+
+
+def transform(validator_cls: type[TreeTransformer], query: str) -> str:
+    """Parse and transform the query as done by the invenio query parser."""
+    tree = parser.parse(query)
+    new_tree = validator_cls(mapping={}, allow_list=set()).visit(tree, context={})  # type: ignore[call-arg]
+    return str(auto_head_tail(new_tree))
+
+
+def main(number: int = 200) -> None:
+    """Run the benchmark and print time per query."""
+    parser.parse("warm up")
+    for query in QUERIES:
+        legacy, current = transform(LegacySearchQueryValidator, query), transform(SearchQueryValidator, query)
+        if legacy != current:
+            print(f"different output for {query!r}: {legacy!r} -> {current!r}")  # noqa: T201
+
+    for label, validator_cls in (("legacy", LegacySearchQueryValidator), ("current", SearchQueryValidator)):
+        elapsed = timeit.timeit(
+            lambda cls=validator_cls: [transform(cls, query) for query in QUERIES],
+            number=number,
+        )
+        print(f"{label:>8}: {elapsed / number / len(QUERIES) * 1e6:8.1f} us/query")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
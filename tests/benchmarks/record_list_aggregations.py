@@ -0,0 +1,95 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Benchmark of post-processing of search result aggregations.
+
+Compares normalizing large terms facets on every access of
+``RecordList.aggregations`` (as serializers access the property several
+times per response) with normalizing them once and caching the result.
+
+Run with ``python tests/benchmarks/record_list_aggregations.py``.
+"""
+
+from __future__ import annotations
+
+import copy
+import timeit
+from typing import Any
+from unittest.mock import Mock, patch
+
+from invenio_access.permissions import Identity
+from invenio_records_resources.services.records.results import RecordList as BaseRecordList
+
+from oarepo_runtime.services.results import RecordList
+
+
+def create_aggregations(facets: int = 20, buckets: int = 1000) -> dict[str, Any]:
+    """Create aggregations of large terms facets, half of them with numeric keys."""
+    return {
+        f"facet{facet}": {
+            "buckets": [
+                {
+                    "key": idx if facet % 2 else f"value{idx}",
+                    "label": f"Value {idx}",
+                    "doc_count": idx,
+                    "is_selected": False,
+                }
+                for idx in range(buckets)
+            ],
+            "label": f"Facet {facet}",
+        }
+        for facet in range(facets)
+    }
+
+
+def per_access_aggregations(aggregations: dict[str, Any], accesses: int) -> None:
+    """Normalize the aggregations on every access, as done before caching."""
+    for _ in range(accesses):
+        for key in aggregations:
+            if "buckets" in aggregations[key]:
+                for bucket in aggregations[key]["buckets"]:
+                    val = bucket["key"]
+                    label = bucket.get("label", "")
+                    if not isinstance(val, str):
+                        bucket["key"] = str(val)
+                    if not isinstance(label, str):
+                        bucket["label"] = str(label)
+
+
+def cached_aggregations(aggregations: dict[str, Any], accesses: int) -> None:
+    """Access aggregations of a RecordList, they are normalized on the first access only."""
+    record_list = RecordList(
+        service=Mock(),
+        identity=Identity(1),
+        results=[],
+        params={},
+        links_tpl=Mock(),
+        links_item_tpl=Mock(),
+        schema=Mock(),
+    )
+    record_list._results = aggregations  # noqa: SLF001
+    for _ in range(accesses):
+        _ = record_list.aggregations
+
+
+def main(number: int = 50, accesses: int = 3) -> None:
+    """Run the benchmark and print time per response."""
+    aggregations = create_aggregations()
+    # the base RecordList returns aggregations of the search results, here the results are the aggregations
+    with patch.object(BaseRecordList, "aggregations", property(lambda self: self._results)):
+        for label, func in (
+            ("per access", per_access_aggregations),
+            ("cached", cached_aggregations),
+        ):
+            copies = [copy.deepcopy(aggregations) for _ in range(number)]
+            elapsed = timeit.timeit(lambda f=func, c=copies: f(c.pop(), accesses), number=number)
+            print(f"{label:>12}: {elapsed / number * 1e3:8.2f} ms/response")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
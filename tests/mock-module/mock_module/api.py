@@ -26,6 +26,7 @@ from invenio_records_resources.records.systemfields.pid import PIDField, PIDFiel
 
 from oarepo_runtime.records.pid_providers import UniversalPIDMixin
 from oarepo_runtime.records.systemfields import (
+    DraftTypeSystemField,
     MappingSystemFieldMixin,
     PublicationStatusSystemField,
 )
@@ -144,6 +145,8 @@ class Draft(DraftBase):
 
     status = PublicationStatusSystemField()
 
+    draft_type = DraftTypeSystemField()
+
     test_fld = TestMappingSystemField()
 
     has_draft = HasDraftCheckField()
@@ -0,0 +1,219 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+
+"""Tests for the component hook dispatch table."""
+
+from __future__ import annotations
+
+import json
+
+from invenio_records_resources.services.records.components import ServiceComponent
+from invenio_records_resources.services.records.config import ServiceConfig
+from invenio_records_resources.services.records.service import Service as InvenioService
+
+from oarepo_runtime.services.config import component_timings
+from oarepo_runtime.services.config.components import ComponentsOrderingMixin
+
+calls: list[tuple[str, str]] = []
+
+
+class CreateComponent(ServiceComponent):
+    """Component implementing only the create hook."""
+
+    def create(self, identity, **kwargs):
+        """Record the call."""
+        calls.append(("create", type(self).__name__))
+
+
+class UpdateComponent(ServiceComponent):
+    """Component implementing only the update hook."""
+
+    def update(self, identity, **kwargs):
+        """Record the call."""
+        calls.append(("update", type(self).__name__))
+
+
+class CustomHookComponent(CreateComponent):
+    """Component implementing a hook unknown to ServiceComponent."""
+
+    depends_on = (UpdateComponent,)
+
+    def custom_hook(self, identity, **kwargs):
+        """Record the call."""
+        calls.append(("custom_hook", type(self).__name__))
+
+
+class Service(ComponentsOrderingMixin, InvenioService):
+    """A sample invenio records service."""
+
+
+class Cfg(ServiceConfig):
+    """Service config with a couple of components."""
+
+    components = (CustomHookComponent, UpdateComponent, CreateComponent)
+
+
+class StatefulComponent(ServiceComponent):
+    """Component keeping per-call state on self, as invenio components may do."""
+
+    def create(self, identity, **kwargs):
+        """Record the state left by previous calls."""
+        calls.append(("create", getattr(self, "state", None)))
+        self.state = identity
+
+
+class StatefulCfg(ServiceConfig):
+    """Service config with a stateful component."""
+
+    components = (StatefulComponent,)
+
+
+def test_components_are_instantiated_per_call():
+    service = Service(Cfg())
+    first, second = list(service.components), list(service.components)
+    assert all(a is not b for a, b in zip(first, second, strict=True))
+    assert [type(x) for x in service.components] == [UpdateComponent, CustomHookComponent, CreateComponent]
+
+
+def test_component_state_does_not_leak_between_calls():
+    service = Service(StatefulCfg())
+    calls.clear()
+
+    service.run_components("create", "first")
+    service.run_components("create", "second")
+
+    assert calls == [("create", None), ("create", None)]
+
+
+def test_dispatch_table_contains_only_overriding_components():
+    service = Service(Cfg())
+
+    assert service._get_hook_components("create") == (CustomHookComponent, CreateComponent)  # noqa: SLF001
+    assert service._get_hook_components("update") == (UpdateComponent,)  # noqa: SLF001
+    assert service._get_hook_components("custom_hook") == (CustomHookComponent,)  # noqa: SLF001
+    assert service._get_hook_components("delete") == ()  # noqa: SLF001
+    assert service._get_hook_components("unknown") == ()  # noqa: SLF001
+
+
+def test_run_components():
+    service = Service(Cfg())
+    calls.clear()
+
+    service.run_components("create", None)
+    service.run_components("update", None)
+    service.run_components("custom_hook", None)
+    service.run_components("delete", None)
+
+    assert calls == [
+        ("create", "CustomHookComponent"),
+        ("create", "CreateComponent"),
+        ("update", "UpdateComponent"),
+        ("custom_hook", "CustomHookComponent"),
+    ]
+
+
+def test_component_timing(app):
+    """Hooks are timed when OAREPO_RUNTIME_COMPONENT_TIMING is enabled."""
+    component_timings.reset()
+    app.config["OAREPO_RUNTIME_COMPONENT_TIMING"] = True
+    try:
+        service = Service(Cfg())
+        service.run_components("create", None)
+        service.run_components("create", None)
+        service.run_components("update", None)
+    finally:
+        app.config["OAREPO_RUNTIME_COMPONENT_TIMING"] = False
+
+    timings = {(t["component"].rsplit(".", 1)[-1], t["hook"]): t for t in component_timings.as_list()}
+    assert set(timings) == {
+        ("CustomHookComponent", "create"),
+        ("CreateComponent", "create"),
+        ("UpdateComponent", "update"),
+    }
+    assert timings["CreateComponent", "create"]["calls"] == 2
+    assert timings["UpdateComponent", "update"]["calls"] == 1
+    assert json.loads(component_timings.to_json()) == component_timings.as_list()
+
+    prometheus = component_timings.to_prometheus()
+    assert "# TYPE oarepo_component_hook_calls_total counter" in prometheus
+    assert 'hook="update"} 1' in prometheus
+
+    component_timings.reset()
+    assert component_timings.as_list() == []
+
+
+def test_component_timing_can_be_toggled_at_runtime(app):
+    component_timings.reset()
+    service = Service(Cfg())
+    service.run_components("create", None)
+    assert component_timings.as_list() == []
+
+    app.config["OAREPO_RUNTIME_COMPONENT_TIMING"] = True
+    try:
+        service.run_components("create", None)
+    finally:
+        app.config["OAREPO_RUNTIME_COMPONENT_TIMING"] = False
+    service.run_components("create", None)
+
+    assert [t["calls"] for t in component_timings.as_list()] == [1, 1]
+    component_timings.reset()
+
+
+def test_component_timing_disabled(app):
+    """No timings are recorded by default."""
+    component_timings.reset()
+    service = Service(Cfg())
+    service.run_components("create", None)
+    assert component_timings.as_list() == []
+
+
+def test_dispatch_resolves_partials_and_factories():
+    from functools import partial
+
+    def factory(service):
+        return UpdateComponent(service)
+
+    class PartialCfg(ServiceConfig):
+        components = (partial(CreateComponent), factory)
+
+    service = Service(PartialCfg())
+    calls.clear()
+    service.run_components("create", None)
+    service.run_components("update", None)
+
+    assert calls == [("create", "CreateComponent"), ("update", "UpdateComponent")]
+
+
+class UowComponent(ServiceComponent):
+    """Component registering an operation on the unit of work, with a hook not accepting ``uow``."""
+
+    def create(self, identity, data=None, record=None):
+        """Register the operation on the unit of work of the call."""
+        self.uow.register(("create", identity))
+        calls.append(("create", self))
+
+
+class UowCfg(ServiceConfig):
+    """Service config with a component using the unit of work."""
+
+    components = (UowComponent,)
+
+
+def test_unit_of_work_is_set_on_components():
+    from unittest.mock import Mock
+
+    service = Service(UowCfg())
+    uow = Mock()
+    calls.clear()
+
+    service.run_components("create", "identity", uow=uow)
+
+    uow.register.assert_called_once_with(("create", "identity"))
+    component = calls[0][1]
+    assert component._uow is None  # noqa: SLF001
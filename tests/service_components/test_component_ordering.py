@@ -11,6 +11,7 @@
 from __future__ import annotations
 
 import functools
+import json
 import re
 
 import pytest
@@ -18,7 +19,13 @@ from invenio_records_resources.services.records.components import ServiceCompone
 from invenio_records_resources.services.records.config import ServiceConfig
 from invenio_records_resources.services.records.service import Service as InvenioService
 
-from oarepo_runtime.services.config.components import ComponentsOrderingMixin
+from oarepo_runtime.services.config.components import (
+    ComponentsOrderingMixin,
+    _precomputed_orderings,
+    clear_components_ordering_cache,
+    component_name,
+    load_precomputed_component_orderings,
+)
 
 
 class A(ServiceComponent):
@@ -206,3 +213,108 @@ def test_cycle_raises_cycleerror():
         match=re.escape("Cycle detected in dependencies: {CD(X): {CD(Y)}, CD(Y): {CD(X)}}"),
     ):
         _ = service.components
+
+
+def test_ordering_is_cached_across_service_instances():
+    """The ordering is computed once per service class and component entries."""
+
+    class Cfg(ServiceConfig):
+        components = (DependingOnX, A, B)
+
+    first = Service(Cfg())
+    second = Service(Cfg())
+    assert first.component_classes is second.component_classes
+    assert names(second.components) == ["A", "DependingOnX", "B"]
+
+    clear_components_ordering_cache()
+    third = Service(Cfg())
+    assert third.component_classes is not first.component_classes
+    assert third.component_classes == first.component_classes
+
+
+def test_ordering_many_components():
+    """Ordering of a long chain of components keeps dependencies satisfied."""
+    classes: list[type[ServiceComponent]] = []
+    for idx in range(60):
+        depends_on = (classes[-1],) if classes else ()
+        classes.append(type(f"Chain{idx}", (ServiceComponent,), {"depends_on": depends_on}))
+
+    class Cfg(ServiceConfig):
+        components = tuple(reversed(classes))
+
+    service = Service(Cfg())
+    assert service.component_classes == tuple(classes)
+
+
+def test_components_ordering_info_and_precomputed_orderings(tmp_path):
+    """Ordering info can be dumped and loaded back as a precomputed ordering."""
+
+    class Cfg(ServiceConfig):
+        components = (DependingOnX, A, B)
+
+    info = Service(Cfg()).get_components_ordering_info()
+    assert [x.rsplit(".", 1)[-1] for x in info["order"]] == ["A", "DependingOnX", "B"]
+    assert info["graph"][component_name(DependingOnX)] == [component_name(A)]
+
+    # reverse the order in the precomputed file to check that it is really used
+    info["order"] = list(reversed(info["order"]))
+    path = tmp_path / "orderings.json"
+    path.write_text(json.dumps({"test": info}))
+
+    clear_components_ordering_cache()
+    load_precomputed_component_orderings(path)
+    try:
+        assert names(Service(Cfg()).components) == ["B", "DependingOnX", "A"]
+    finally:
+        _precomputed_orderings.clear()
+        clear_components_ordering_cache()
+
+
+def test_stale_precomputed_orderings_are_not_used(tmp_path, caplog, monkeypatch):
+    """Precomputed orderings are ignored when ordering declarations changed since the dump."""
+
+    class Cfg(ServiceConfig):
+        components = (DependingOnX, A, B)
+
+    info = Service(Cfg()).get_components_ordering_info()
+    info["order"] = list(reversed(info["order"]))
+    path = tmp_path / "orderings.json"
+    path.write_text(json.dumps({"test": info}))
+    # B now must run before DependingOnX
+    monkeypatch.setattr(DependingOnX, "depends_on", (A, B))
+
+    clear_components_ordering_cache()
+    load_precomputed_component_orderings(path)
+    try:
+        with caplog.at_level("WARNING"):
+            assert names(Service(Cfg()).components) == ["A", "B", "DependingOnX"]
+        assert "is stale" in caplog.text
+
+        # files dumped without the declarations hash are not trusted either
+        del info["declarations_hash"]
+        path.write_text(json.dumps({"test": info}))
+        monkeypatch.undo()
+        clear_components_ordering_cache()
+        load_precomputed_component_orderings(path)
+        assert names(Service(Cfg()).components) == ["A", "DependingOnX", "B"]
+    finally:
+        _precomputed_orderings.clear()
+        clear_components_ordering_cache()
+
+
+def test_components_ordering_info_raises_on_cycle():
+    """Cycles are reported by get_components_ordering_info."""
+
+    class X(ServiceComponent):
+        depends_on = ()
+
+    class Y(ServiceComponent):
+        depends_on = (X,)
+
+    X.depends_on = (Y,)
+
+    class Cfg(ServiceConfig):
+        components = (X, Y)
+
+    with pytest.raises(ValueError, match="Cycle detected"):
+        Service(Cfg()).get_components_ordering_info()
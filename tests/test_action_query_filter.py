@@ -10,10 +10,26 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import pytest
 from flask_principal import Identity, RoleNeed, UserNeed
+from invenio_access.models import ActionUsers
 from invenio_search.engine import dsl
 
-from oarepo_runtime.services.generators import AdministrationWithQueryFilter
+from oarepo_runtime.services.generators import (
+    ActionAccessCache,
+    AdministrationWithQueryFilter,
+    action_access_cache,
+    has_action_access,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_action_access_cache():
+    action_access_cache.clear()
+    yield
+    action_access_cache.clear()
 
 
 def _test_internal(entity, result_filter_type, is_role=False) -> None:
@@ -41,3 +57,63 @@ def test_administrator_user(app, db, user_with_administration_rights, search_cle
 
 def test_administrator_role(app, db, role_with_administration_rights, search_clear):
     _test_internal(role_with_administration_rights, dsl.query.MatchAll, is_role=True)
+
+
+def test_access_is_cached_for_request(app, db, user_with_administration_rights, search_clear):
+    i = Identity(user_with_administration_rights.id)
+    i.provides.add(UserNeed(user_with_administration_rights.id))
+    with app.test_request_context("/"), patch.object(action_access_cache, "get", return_value=None) as get:
+        assert has_action_access(i, "administration-access")
+        assert has_action_access(i, "administration-access")
+        assert get.call_count == 1
+
+
+def test_revoke_invalidates_cache(app, db, user_with_administration_rights, search_clear):
+    _test_internal(user_with_administration_rights, dsl.query.MatchAll)
+
+    for action in ActionUsers.query.filter(ActionUsers.user_id == user_with_administration_rights.id):
+        db.session.delete(action)
+    db.session.commit()
+    _test_internal(user_with_administration_rights, dsl.query.MatchNone)
+
+
+def test_bulk_revoke_invalidates_cache(app, db, user_with_administration_rights, search_clear):
+    _test_internal(user_with_administration_rights, dsl.query.MatchAll)
+
+    ActionUsers.query.filter(ActionUsers.user_id == user_with_administration_rights.id).delete(
+        synchronize_session=False
+    )
+    db.session.commit()
+    _test_internal(user_with_administration_rights, dsl.query.MatchNone)
+
+
+def test_grant_invalidates_cache(app, db, users, search_clear):
+    _test_internal(users[0], dsl.query.MatchNone)
+
+    actions = app.extensions["invenio-access"].actions
+    db.session.add(ActionUsers.allow(actions["administration-access"], user_id=users[0].id))
+    db.session.commit()
+    _test_internal(users[0], dsl.query.MatchAll)
+
+
+def test_anonymous_identity_does_not_query(app, db, search_clear):
+    with patch("oarepo_runtime.services.generators.db") as mocked_db:
+        assert not has_action_access(Identity(None), "administration-access")
+    mocked_db.session.execute.assert_not_called()
+
+
+def test_action_access_cache_ttl():
+    cache = ActionAccessCache(ttl=10)
+    cache.set("a", True)
+    cache.set("b", False)
+    assert cache.get("a") is True
+    assert cache.get("b") is False
+    assert cache.get("c") is None
+    with patch("oarepo_runtime.services.generators.time.monotonic", return_value=1e12):
+        assert cache.get("a") is None
+    cache.clear()
+    assert cache.get("b") is None
+
+    disabled = ActionAccessCache(ttl=0)
+    disabled.set("a", True)
+    assert disabled.get("a") is None
@@ -8,8 +8,11 @@
 #
 from __future__ import annotations
 
+import json
+
 from invenio_search.cli import destroy
 
+from oarepo_runtime.cli.components import components
 from oarepo_runtime.cli.search import init
 
 
@@ -19,3 +22,22 @@ def test_cli(app, search):
     result = runner.invoke(destroy, "--yes-i-know")
     result = runner.invoke(init)
     assert result.exit_code == 0
+
+
+def test_components_cli(app, tmp_path):
+    """Test component ordering commands."""
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(components, ["check"])
+    assert result.exit_code == 0, result.output
+
+    output = tmp_path / "orderings.json"
+    result = runner.invoke(components, ["dump", "--output", str(output)])
+    assert result.exit_code == 0, result.output
+    orderings = json.loads(output.read_text())
+    for info in orderings.values():
+        assert set(info["order"]) <= set(info["components"])
+
+    result = runner.invoke(components, ["dump", "--format", "dot"])
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith("digraph components {")
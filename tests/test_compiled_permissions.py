@@ -0,0 +1,135 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests of permission policies evaluated from precomputed plans."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from flask_principal import Identity, UserNeed
+from invenio_access.permissions import any_user, authenticated_user, system_process
+from invenio_records_permissions import RecordPermissionPolicy
+from invenio_records_permissions.generators import (
+    AnyUser,
+    AuthenticatedUser,
+    Disable,
+    Generator,
+    RecordOwners,
+    SystemProcess,
+)
+
+from oarepo_runtime.services.config import (
+    CompiledPermissionPolicyMixin,
+    EveryonePermissionPolicy,
+    compile_permission_plan,
+)
+
+
+class CountingOwners(RecordOwners):
+    calls = 0
+
+    def needs(self, record=None, **kwargs):
+        type(self).calls += 1
+        return super().needs(record=record, **kwargs)
+
+
+class Policy(CompiledPermissionPolicyMixin, RecordPermissionPolicy):
+    can_read = (SystemProcess(), AnyUser())
+    can_update = (SystemProcess(), CountingOwners())
+    can_delete = (Disable(),)
+
+
+class PlainPolicy(RecordPermissionPolicy):
+    can_read = Policy.can_read
+    can_update = Policy.can_update
+    can_delete = Policy.can_delete
+
+
+def _load_without_database(self):
+    """Load permissions without expanding action needs (that requires database)."""
+    self._permissions = type("P", (), {})()
+    self._permissions.needs = {need for need in self.explicit_needs if need.method != "action"}
+    self._permissions.excludes = {need for need in self.explicit_excludes if need.method != "action"}
+
+
+def test_compile_permission_plan():
+    owners = RecordOwners()
+    plan = compile_permission_plan([SystemProcess(), AuthenticatedUser(), Disable(), owners])
+    assert plan.needs == {system_process, authenticated_user}
+    assert plan.excludes == {any_user}
+    assert plan.generators == (owners,)
+
+
+def test_plan_is_shared_between_instances():
+    assert Policy("delete").permission_plan is Policy("delete").permission_plan
+    assert Policy("delete").permission_plan is not Policy("read").permission_plan
+
+
+def test_plan_of_undefined_action_is_disabled():
+    plan = Policy("unknown_action").permission_plan
+    assert plan.excludes == {any_user}
+    assert not plan.needs
+
+
+def test_overridden_generators_are_not_shared():
+    generators = [[AnyUser()], [Disable()]]
+
+    class DynamicPolicy(CompiledPermissionPolicyMixin, RecordPermissionPolicy):
+        @property
+        def generators(self):
+            return generators.pop(0)
+
+    assert DynamicPolicy("read").permission_plan.needs == {any_user}
+    assert DynamicPolicy("read").permission_plan.excludes == {any_user}
+
+
+def test_same_result_as_invenio_policy(app):
+    owner = Identity(1)
+    owner.provides.add(UserNeed(1))
+    other = Identity(2)
+    other.provides.add(UserNeed(2))
+    system = Identity(3)
+    system.provides.add(system_process)
+    record = {"owners": [1]}
+
+    with patch.object(RecordPermissionPolicy, "_load_permissions", _load_without_database):
+        for action in ("read", "update", "delete", "unknown_action"):
+            for identity in (owner, other, system):
+                compiled = Policy(action, record=record)
+                plain = PlainPolicy(action, record=record)
+                assert compiled.needs == plain.needs
+                assert compiled.excludes == plain.excludes
+                assert compiled.allows(identity) == plain.allows(identity)
+
+
+def test_dynamic_generators_evaluated_once_per_instance(app):
+    CountingOwners.calls = 0
+    with patch.object(RecordPermissionPolicy, "_load_permissions", _load_without_database):
+        policy = Policy("update", record={"owners": [1]})
+        assert policy.needs == {system_process, UserNeed(1)}
+        assert policy.excludes == set()
+        assert policy.needs == {system_process, UserNeed(1)}
+    assert CountingOwners.calls == 1
+
+
+def test_everyone_permission_policy(app):
+    with patch.object(RecordPermissionPolicy, "_load_permissions", _load_without_database):
+        policy = EveryonePermissionPolicy("read")
+        assert not policy.permission_plan.generators
+        assert policy.allows(Identity(None)) is False
+        anonymous = Identity(None)
+        anonymous.provides.add(any_user)
+        assert policy.allows(anonymous)
+
+
+def test_generator_base_class_is_dynamic():
+    class Custom(Generator):
+        pass
+
+    assert len(compile_permission_plan([Custom()]).generators) == 1
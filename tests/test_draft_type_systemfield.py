@@ -0,0 +1,119 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+
+"""Test draft type system field."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from invenio_drafts_resources.records.api import Draft
+from invenio_records_resources.records.api import Record
+
+from oarepo_runtime.records.systemfields import DraftTypeSystemField
+from oarepo_runtime.records.systemfields.draft_type import compute_draft_type, get_draft_type
+
+
+class MockRecord(Record):  # type: ignore[misc]
+    """Mock record class for testing."""
+
+    draft_type = DraftTypeSystemField()
+
+
+class MockDraftRecord(Draft):  # type: ignore[misc]
+    """Mock draft record class for testing."""
+
+    draft_type = DraftTypeSystemField()
+
+
+class MockDraftWithoutField(Draft):  # type: ignore[misc]
+    """Mock draft record class without the draft type field."""
+
+
+def versions(index, is_latest):
+    return patch.object(
+        Draft,
+        "versions",
+        new_callable=PropertyMock,
+        return_value=SimpleNamespace(index=index, is_latest=is_latest),
+    )
+
+
+def test_draft_type_field_mapping():
+    field = DraftTypeSystemField()
+    assert field.mapping == {"draft_type": {"type": "keyword"}}
+
+
+def test_draft_type_field_class_access():
+    assert isinstance(MockDraftRecord.draft_type, DraftTypeSystemField)
+
+
+@pytest.mark.parametrize(
+    ("index", "is_latest", "expected"),
+    [
+        (1, False, "initial"),
+        (1, True, "metadata"),
+        (3, True, "metadata"),
+        (3, False, "new_version"),
+    ],
+)
+def test_compute_draft_type(index, is_latest, expected):
+    with versions(index, is_latest):
+        assert compute_draft_type(MockDraftRecord({})) == expected
+        assert MockDraftRecord({}).draft_type == expected
+        assert get_draft_type(MockDraftRecord({})) == expected
+        assert get_draft_type(MockDraftWithoutField({})) == expected
+
+
+def test_draft_type_of_published_record():
+    record = MockRecord({})
+    assert record.draft_type is None
+    assert compute_draft_type(record) is None
+    assert get_draft_type(record) is None
+
+    data = {"title": "Test"}
+    MockRecord.draft_type.post_dump(record, data)
+    assert data == {"title": "Test"}
+
+
+def test_draft_type_is_computed_once():
+    with versions(1, False) as versions_mock:
+        record = MockDraftRecord({})
+        assert record.draft_type == "initial"
+        assert record.draft_type == "initial"
+        assert versions_mock.call_count == 1
+
+
+def test_draft_type_post_dump():
+    record = MockDraftRecord({})
+    data = {"title": "Test"}
+    with versions(2, False):
+        MockDraftRecord.draft_type.post_dump(record, data)
+    assert data == {"title": "Test", "draft_type": "new_version"}
+
+
+def test_draft_type_post_load_uses_indexed_value():
+    record = MockDraftRecord({})
+    data = {"title": "Test", "draft_type": "metadata"}
+    MockDraftRecord.draft_type.post_load(record, data)
+    assert data == {"title": "Test"}
+
+    with versions(1, False) as versions_mock:
+        assert record.draft_type == "metadata"
+        assert get_draft_type(record) == "metadata"
+    versions_mock.assert_not_called()
+
+
+def test_draft_type_post_load_without_value():
+    record = MockDraftRecord({})
+    data = {"title": "Test"}
+    MockDraftRecord.draft_type.post_load(record, data)
+    assert data == {"title": "Test"}
@@ -82,3 +82,35 @@ def test_date_facet(app):
         ]
     )
     assert facet.agg_type == "auto_date_histogram"
+
+
+def test_date_facet_labels_are_memoized(app):
+    from oarepo_runtime.services.facets import date
+
+    facet = build_facet(
+        [
+            {
+                "facet": "oarepo_runtime.services.facets.date.EDTFFacet",
+                "path": "metadata.created",
+                "label": "created",
+            }
+        ]
+    )
+    date._format_label.cache_clear()  # noqa: SLF001
+    date._get_formatter.cache_clear()  # noqa: SLF001
+    with app.app_context():
+        first = facet.localized_value_labels(["1996-10-12T00:00:00.000Z", "2000"], "cs")
+        second = facet.localized_value_labels(["1996-10-12T00:00:00.000Z", "2000"], "cs")
+        assert first == second
+        assert first["1996-10-12T00:00:00.000Z"] == "12. 10. 1996"
+
+        info = date._format_label.cache_info()  # noqa: SLF001
+        assert info.hits == 2
+        assert info.misses == 2
+        # one formatter per (facet formatter class, locale)
+        assert date._get_formatter.cache_info().currsize == 1  # noqa: SLF001
+
+        facet.localized_value_labels(["2000"], "en")
+        assert date._get_formatter.cache_info().currsize == 2  # noqa: SLF001
+
+    assert date.convert_to_edtf("1996-10-12T12:00:00.000Z") == "1996-10-12"
@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for vocabulary facets."""
+
+from __future__ import annotations
+
+from oarepo_runtime.services.facets import vocabulary
+from oarepo_runtime.services.facets.utils import build_facet
+
+
+def test_vocabulary_facet_labels_are_fetched_in_batch_and_cached(app, monkeypatch):
+    calls = []
+
+    def get_vocabs(service_id, vocabulary_type, fields, ids):
+        calls.append((service_id, vocabulary_type, list(ids)))
+        items = {
+            "eng": {"id": "eng", "title": {"en": "English", "cs": "Angličtina"}},
+            "ces": {"id": "ces", "title": {"en": "Czech", "cs": "Čeština"}},
+        }
+        return [items[id_] for id_ in ids if id_ in items]
+
+    monkeypatch.setattr(vocabulary, "get_vocabs", get_vocabs)
+    vocabulary.vocabulary_labels_cache.clear()
+
+    facet = build_facet(
+        [
+            {
+                "facet": "oarepo_runtime.services.facets.vocabulary.VocabularyFacet",
+                "field": "metadata.languages.id",
+                "label": "languages",
+                "vocabulary": "languages",
+            }
+        ]
+    )
+    with app.app_context():
+        assert facet.localized_value_labels(["eng", "ces", "xxx"], "cs") == {
+            "eng": "Angličtina",
+            "ces": "Čeština",
+            "xxx": "xxx",
+        }
+        assert calls == [(None, "languages", ["eng", "ces", "xxx"])]
+
+        # cached, including the unknown value
+        assert facet.localized_value_labels(["ces", "xxx"], "cs") == {"ces": "Čeština", "xxx": "xxx"}
+        assert len(calls) == 1
+
+        # locales are cached separately
+        assert facet.localized_value_labels(["ces"], "en") == {"ces": "Czech"}
+        assert calls[-1] == (None, "languages", ["ces"])
+
+        # expired labels are fetched again
+        facet.cache_ttl = -1
+        facet.localized_value_labels(["eng"], "de")
+        facet.localized_value_labels(["eng"], "de")
+        assert calls[-2:] == [(None, "languages", ["eng"]), (None, "languages", ["eng"])]
+
+    vocabulary.vocabulary_labels_cache.clear()
+
+
+def test_vocabulary_labels_cache_is_bounded(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(vocabulary.time, "monotonic", lambda: now[0])
+    cache = vocabulary.VocabularyLabelsCache(maxsize=3)
+
+    cache.set_many("languages", "en", {"eng": "English", "ces": "Czech"}, ttl=10)
+    cache.set_many("languages", "en", {"deu": "German"}, ttl=100)
+    # recently used labels are kept
+    assert cache.get_many("languages", "en", ["eng"]) == ({"eng": "English"}, [])
+    cache.set_many("languages", "en", {"fra": "French"}, ttl=100)
+    assert len(cache) == 3
+    assert cache.get_many("languages", "en", ["eng", "ces", "deu", "fra"]) == (
+        {"eng": "English", "deu": "German", "fra": "French"},
+        ["ces"],
+    )
+
+    # expired labels are purged before recently used ones are evicted
+    now[0] += 50
+    cache.set_many("languages", "cs", {"eng": "Angličtina"}, ttl=100)
+    assert len(cache) == 3
+    assert cache.get_many("languages", "en", ["deu", "fra", "eng"]) == (
+        {"deu": "German", "fra": "French"},
+        ["eng"],
+    )
+    assert cache.get_many("languages", "cs", ["eng"]) == ({"eng": "Angličtina"}, [])
+
+    disabled = vocabulary.VocabularyLabelsCache(maxsize=0)
+    disabled.set_many("languages", "en", {"eng": "English"}, ttl=10)
+    assert len(disabled) == 0
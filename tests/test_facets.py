@@ -22,8 +22,13 @@ from invenio_access.permissions import system_user_id
 from invenio_records_resources.services.records.facets import TermsFacet
 from invenio_search.engine import dsl
 
+from oarepo_runtime.services.facets.aggregations import precomputed_aggregation
 from oarepo_runtime.services.facets.nested_facet import NestedLabeledFacet
-from oarepo_runtime.services.facets.params import GroupedFacetsParam
+from oarepo_runtime.services.facets.params import (
+    FacetSelection,
+    GroupedFacetsParam,
+    PrecomputedFacets,
+)
 from oarepo_runtime.services.facets.utils import (
     I18nLabel,
     _label_for_field,
@@ -290,7 +295,7 @@ def test_identity_facets_system_user_or_process_returns_all() -> None:
     assert params_proc.identity_facets(ident_proc) == params_proc.facets
 
 
-def test_filter_user_facets_with_groups_and_side_effect_mutation() -> None:
+def test_filter_user_facets_with_groups_does_not_mutate_facets() -> None:
     all_facets = {
         "publication_status": TermsFacet(field="publication_status"),
         "another": TermsFacet(field="another"),
@@ -313,8 +318,8 @@ def test_filter_user_facets_with_groups_and_side_effect_mutation() -> None:
     # After: user facets should be default + curator
     assert set(user_facets.keys()) == {"publication_status", "another"}
 
-    # Side effect: params.facets was cleared in _filter_user_facets
-    assert params.facets == {}
+    # No side effect on the shared facets
+    assert set(params.facets.keys()) == {"publication_status", "another"}
 
 
 def test_aggregate_with_user_facets_adds_aggs() -> None:
@@ -473,3 +478,120 @@ def test_i18n_label_falls_back_to_en_when_no_locale(app):
 
     with app.test_request_context(), patch("flask_babel.get_locale", return_value=None):
         assert str(label) == "Status"
+
+
+def test_precomputed_facets_shared_per_config_and_groups() -> None:
+    all_facets = {
+        "publication_status": TermsFacet(field="publication_status"),
+        "another": TermsFacet(field="another"),
+    }
+    facet_groups = {
+        "default": ["publication_status"],
+        "curator": ["another"],
+    }
+    config = _dummy_config(all_facets, facet_groups)
+
+    curator = Identity(2)
+    curator.provides.add(Need(method="role", value="curator"))
+    other_curator = Identity(3)
+    other_curator.provides.add(Need(method="role", value="curator"))
+
+    first = GroupedFacetsParam(config)  # type: ignore[arg-type]
+    second = GroupedFacetsParam(config)  # type: ignore[arg-type]
+
+    assert first.facet_groups is second.facet_groups
+    assert first.identity_facets(curator) is second.identity_facets(other_curator)
+    assert set(first.identity_facets(curator)) == {"publication_status", "another"}
+
+    precomputed = PrecomputedFacets.for_config(config)  # type: ignore[arg-type]
+    assert precomputed is PrecomputedFacets.for_config(config)  # type: ignore[arg-type]
+    aggregations = precomputed.aggregations_for_groups(frozenset({"curator"}))
+    assert aggregations is precomputed.aggregations_for_groups(frozenset({"curator"}))
+    assert [name for name, _ in aggregations] == ["publication_status", "another"]
+    assert [name for name, _ in precomputed.aggregations_for_groups(frozenset())] == ["publication_status"]
+
+
+def test_precomputed_facets_read_only_and_bounded() -> None:
+    all_facets = {
+        "publication_status": TermsFacet(field="publication_status"),
+        "another": TermsFacet(field="another"),
+    }
+    config = _dummy_config(all_facets, {"default": ["publication_status"], "curator": ["another"]})
+    params = GroupedFacetsParam(config)  # type: ignore[arg-type]
+    precomputed = PrecomputedFacets.for_config(config)  # type: ignore[arg-type]
+    precomputed.max_group_sets = 2
+
+    curator = Identity(2)
+    curator.provides.add(Need(method="role", value="curator"))
+    with pytest.raises(TypeError):
+        params.facets["injected"] = TermsFacet(field="injected")  # type: ignore[index]
+    with pytest.raises(TypeError):
+        params.identity_facets(curator)["injected"] = TermsFacet(field="injected")  # type: ignore[index]
+    assert set(params.facets) == {"publication_status", "another"}
+
+    curator_facets = precomputed.facets_for_groups(frozenset({"curator"}))
+    for index in range(5):
+        precomputed.facets_for_groups(frozenset({"curator"}))
+        precomputed.facets_for_groups(frozenset({f"role-{index}"}))
+        precomputed.aggregations_for_groups(frozenset({f"role-{index}"}))
+    assert len(precomputed._facets_by_groups) == 2  # noqa: SLF001
+    assert len(precomputed._aggregations_by_groups) == 2  # noqa: SLF001
+    # recently used group sets are kept
+    assert precomputed.facets_for_groups(frozenset({"curator"})) is curator_facets
+
+
+def test_apply_keeps_request_state_in_selection() -> None:
+    all_facets = {
+        "publication_status": TermsFacet(field="publication_status"),
+        "another": TermsFacet(field="another"),
+    }
+    facet_groups = {"default": ["publication_status"], "curator": ["another"]}
+    params = GroupedFacetsParam(_dummy_config(all_facets, facet_groups))  # type: ignore[arg-type]
+
+    curator = Identity(2)
+    curator.provides.add(Need(method="role", value="curator"))
+    anonymous = Identity(3)
+
+    curator_params: dict[str, Any] = {"facets": {"another": ["x"]}}
+    curator_search = params.apply(curator, dsl.Search(), curator_params)
+    anonymous_params: dict[str, Any] = {"facets": {"publication_status": ["published"]}}
+    anonymous_search = params.apply(anonymous, dsl.Search(), anonymous_params)
+
+    # the param itself is not modified by apply
+    assert params.selected_values == {}
+    assert params._filters == {}  # noqa: SLF001
+    assert set(params.facets) == {"publication_status", "another"}
+
+    curator_selection = curator_search._response_class._facets_param  # noqa: SLF001
+    anonymous_selection = anonymous_search._response_class._facets_param  # noqa: SLF001
+    assert isinstance(curator_selection, FacetSelection)
+    assert set(curator_selection.facets) == {"publication_status", "another"}
+    assert dict(curator_selection.selected_values) == {"another": ["x"]}
+    assert set(anonymous_selection.facets) == {"publication_status"}
+    assert dict(anonymous_selection.selected_values) == {"publication_status": ["published"]}
+    with pytest.raises(TypeError):
+        anonymous_selection.selected_values["another"] = ["y"]  # type: ignore[index]
+
+    assert set(curator_search.to_dict()["aggs"]) == {"publication_status", "another"}
+    assert set(anonymous_search.to_dict()["aggs"]) == {"publication_status"}
+    assert curator_params["another"] == ["x"]
+    assert anonymous_params["publication_status"] == ["published"]
+
+
+def test_precomputed_aggregation_serialized_once() -> None:
+    facet = build_facet(
+        [
+            {"facet": "oarepo_runtime.services.facets.nested_facet.NestedLabeledFacet", "path": "metadata.titles"},
+            {"facet": "invenio_records_resources.services.records.facets.TermsFacet", "field": "metadata.titles.lang"},
+        ]
+    )
+    agg = precomputed_aggregation(facet.get_aggregation())
+
+    assert isinstance(agg, type(facet.get_aggregation()))
+    assert agg.to_dict() is agg.to_dict()
+    assert agg.to_dict() == facet.get_aggregation().to_dict()
+    assert precomputed_aggregation(agg) is agg
+
+    search = dsl.Search()
+    search.aggs.bucket("titles", agg)
+    assert search.to_dict()["aggs"] == {"titles": facet.get_aggregation().to_dict()}
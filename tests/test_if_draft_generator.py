@@ -54,6 +54,7 @@ def test_if_draft_generators(app, db, search_with_field_mapping, service, search
     assert_matches(record_from_result(rec), generator_for_state_initial)
     assert_not_matches(record_from_result(rec), generator_for_state_metadata)
     assert_not_matches(record_from_result(rec), generator_for_state_new_version)
+    assert record_from_result(rec).draft_type == "initial"
 
     rec = service.publish(identity_simple, rec.id)
 
@@ -67,6 +68,7 @@ def test_if_draft_generators(app, db, search_with_field_mapping, service, search
     assert_not_matches(record_from_result(rec), generator_for_state_initial)
     assert_matches(record_from_result(rec), generator_for_state_metadata)
     assert_not_matches(record_from_result(rec), generator_for_state_new_version)
+    assert record_from_result(rec).draft_type == "metadata"
 
     # Test that new_version still doesn't match
     rec = service.publish(identity_simple, rec.id)
@@ -80,6 +82,12 @@ def test_if_draft_generators(app, db, search_with_field_mapping, service, search
     assert_not_matches(record_from_result(rec), generator_for_state_initial)
     assert_not_matches(record_from_result(rec), generator_for_state_metadata)
     assert_matches(record_from_result(rec), generator_for_state_new_version)
+    assert record_from_result(rec).draft_type == "new_version"
+
+    # the draft type is indexed, so that drafts can be filtered by it
+    service.config.draft_cls.index.refresh()
+    hits = service.search_drafts(identity_simple, params={"q": "draft_type:new_version"}).to_dict()["hits"]["hits"]
+    assert [hit["id"] for hit in hits] == [rec.id]
 
 
 def test_if_draft_generators_without_record(
@@ -167,6 +175,30 @@ def test_filter_matches(
     assert query == generated_json
 
 
+@pytest.mark.parametrize(
+    ("draft_types", "expected_terms"),
+    [
+        ("initial", ["initial"]),
+        ("metadata", ["metadata"]),
+        (["metadata", "new_version"], ["metadata", "new_version"]),
+    ],
+)
+def test_filter_with_draft_type_field(draft_types, expected_terms):
+    """Test query_filter on the indexed draft type field."""
+    generator = IfDraftType(draft_types, then_=[AnyUser()], else_=[Disable()], draft_type_field="draft_type")
+
+    query = generator.query_filter().to_dict()
+
+    assert query == {
+        "bool": {
+            "should": [
+                {"bool": {"must_not": [{"terms": {"draft_type": expected_terms}}], "must": [{"match_none": {}}]}},
+                {"terms": {"draft_type": expected_terms}},
+            ]
+        }
+    }
+
+
 def test_default_arguments():
     """Test default arguments of IfDraftType."""
     generator = IfDraftType("initial")
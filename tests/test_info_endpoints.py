@@ -8,12 +8,15 @@
 #
 from __future__ import annotations
 
+from unittest.mock import patch
+
+from invenio_vocabularies.records.models import VocabularyType
 from packaging.version import Version
 
-from oarepo_runtime.info.views import to_current_language
+from oarepo_runtime.info.views import InfoResource, InfoResponseCache, invalidate_info_cache, to_current_language
 
 
-def test_info_repository_endpoint(client, lang_type, info_blueprint):
+def test_info_repository_endpoint(client, db, lang_type, info_blueprint):
     repository_info = client.get("/.well-known/repository/").json
     models_info = client.get("/.well-known/repository/models").json
     schema_info = client.get("/.well-known/repository/schema/requests/request-v1.0.0.json").json
@@ -95,8 +98,69 @@ def test_info_repository_endpoint(client, lang_type, info_blueprint):
     assert schema_info["properties"]["created_by"] == {"$ref": "local://definitions-v1.0.0.json#/entity_reference"}
     assert schema_info["properties"]["@v"] == {"type": "string"}
 
+    # responses are served from the cache, with an ETag
+    response = client.get("/.well-known/repository/")
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+    with patch.object(InfoResource, "repository_data") as repository_data:
+        assert client.get("/.well-known/repository/").headers["ETag"] == response.headers["ETag"]
+        repository_data.assert_not_called()
+    not_modified = client.get("/.well-known/repository/", headers={"If-None-Match": response.headers["ETag"]})
+    assert not_modified.status_code == 304
+    assert not not_modified.data
+
+    # new vocabulary types invalidate the cached responses
+    models_etag = client.get("/.well-known/repository/models").headers["ETag"]
+    VocabularyType.create(id="countries", pid_type="cnt")
+    db.session.commit()
+    response = client.get("/.well-known/repository/models")
+    assert response.headers["ETag"] != models_etag
+    assert "countries" in [model_dict["type"] for model_dict in response.json]
+
 
 def test_info_to_current_language_fn():
     assert to_current_language({"en": "test"}) == "test"
 
     assert to_current_language("not a dictionary") == "not a dictionary"
+
+
+def test_info_response_cache():
+    cache = InfoResponseCache(ttl=60)
+    cached = cache.set("key", b"{}", "application/json")
+    assert cache.get("key") is cached
+    assert cache.get("other") is None
+    assert cache.set("key2", b"{}", "application/json").etag == cached.etag
+    assert cache.set("key3", b"[]", "application/json").etag != cached.etag
+
+    invalidate_info_cache()
+    assert cache.get("key") is None
+
+    disabled = InfoResponseCache(ttl=0)
+    assert disabled.set("key", b"{}", "application/json").body == b"{}"
+    assert disabled.get("key") is None
+
+
+def test_info_response_cache_is_bounded(monkeypatch):
+    from oarepo_runtime.info import views
+
+    now = [1000.0]
+    monkeypatch.setattr(views.time, "monotonic", lambda: now[0])
+    cache = InfoResponseCache(ttl=60, maxsize=2)
+
+    first = cache.set("first", b"1", "application/json")
+    cache.set("second", b"2", "application/json")
+    assert cache.get("first") is first
+    cache.set("third", b"3", "application/json")
+    # the least recently used response is evicted
+    assert len(cache) == 2
+    assert cache.get("second") is None
+    assert cache.get("first") is first
+
+    # expired responses are purged when a response is stored
+    now[0] += 61
+    cache.set("fourth", b"4", "application/json")
+    assert len(cache) == 1
+    assert cache.get("fourth") is not None
+
+    disabled = InfoResponseCache(ttl=60, maxsize=0)
+    disabled.set("key", b"{}", "application/json")
+    assert len(disabled) == 0
@@ -9,7 +9,9 @@
 from __future__ import annotations
 
 from oarepo_runtime.services.config.link_conditions import (
+    And,
     Condition,
+    compile_conditions,
     has_draft,
     has_draft_permission,
     has_permission,
@@ -80,3 +82,163 @@ def test_link_conditions(app, db, search_with_field_mapping, service, search_cle
 
 
 # TODO: test link conditions with file record
+
+
+def test_condition_expression_tree():
+    calls = []
+
+    class flag(Condition):  # noqa: N801
+        def __init__(self, name, value):
+            self.name = name
+            self.value = value
+
+        def __call__(self, obj, ctx):
+            calls.append(self.name)
+            return self.value
+
+    a, b, c = flag("a", True), flag("b", False), flag("c", True)
+
+    assert isinstance(a & b, And)
+    assert (a & (b & c)).operands == (a, b, c)
+    assert (a | a).operands == (a,)
+    assert ~~a is a
+    assert flag("a", True) == a
+    assert flag("a", False) != a
+
+    # short-circuit evaluation
+    assert not (b & a)({}, {})
+    assert calls == ["b"]
+    calls.clear()
+    assert (c | b)({}, {})
+    assert calls == ["c"]
+    calls.clear()
+
+    compiled = (a & ~b & (b | c)).compile()
+    assert compiled({}, {}) is True
+    assert calls == ["a", "b", "b", "c"]
+
+
+def test_compile_conditions_evaluates_shared_subconditions_once(app):
+    from oarepo_runtime.request_cache import request_cache
+
+    calls = []
+
+    class flag(Condition):  # noqa: N801
+        def __init__(self, name):
+            self.name = name
+
+        def __call__(self, obj, ctx):
+            calls.append(self.name)
+            return obj[self.name]
+
+    first, second, third = compile_conditions(
+        flag("perm") & flag("draft"),
+        flag("perm") & ~flag("draft"),
+        flag("other"),
+    )
+    record = {"perm": True, "draft": True, "other": False}
+    ctx = {}
+    with app.test_request_context():
+        assert first(record, ctx)
+        assert not second(record, ctx)
+        assert not third(record, ctx)
+        assert calls == ["perm", "draft", "other"]
+
+        # another record is evaluated again
+        calls.clear()
+        other_record = {"perm": False, "draft": True, "other": True}
+        assert not first(other_record, ctx)
+        assert not second(other_record, ctx)
+        assert third(other_record, ctx)
+        assert calls == ["perm", "other"]
+
+    # results (with the record and context) do not outlive the request
+    with app.test_request_context():
+        assert request_cache("oarepo_runtime.link_condition_results") == {}
+
+    # outside of a request nothing is kept and shared sub-conditions are evaluated every time
+    calls.clear()
+    assert first(record, ctx)
+    assert not second(record, ctx)
+    assert calls == ["perm", "draft", "perm", "draft"]
+
+
+def test_permission_checks_are_memoized_per_request(app, monkeypatch):
+    from types import SimpleNamespace
+
+    from flask_principal import Identity
+
+    from oarepo_runtime.services.config import link_conditions
+
+    checks = []
+
+    def check_permission(action_name, record, identity, **kwargs):
+        checks.append((action_name, record.id))
+        return record.id % 2 == 0
+
+    service = SimpleNamespace(check_permission=check_permission)
+    monkeypatch.setattr(
+        link_conditions,
+        "current_runtime",
+        SimpleNamespace(get_record_service_for_record=lambda record: service),
+    )
+
+    records = [SimpleNamespace(id=idx, revision_id=1) for idx in range(4)]
+    ctx = {"identity": Identity(1)}
+
+    with app.test_request_context():
+        assert has_permission("read").evaluate_many(records, ctx) == [True, False, True, False]
+        assert len(checks) == 4
+
+        # links of the page reuse the results
+        assert has_permission("read")(records[0], ctx)
+        assert (has_permission("read") & ~has_permission("read"))(records[1], ctx) is False
+        assert len(checks) == 4
+
+        # a new revision or another action is checked again
+        assert has_permission("read")(SimpleNamespace(id=0, revision_id=2), ctx)
+        assert not has_permission("update")(records[1], ctx)
+        assert len(checks) == 6
+
+    with app.test_request_context():
+        has_permission("read")(records[0], ctx)
+        assert len(checks) == 7
+
+    # outside of a request nothing is cached
+    with app.app_context():
+        has_permission("read")(records[0], ctx)
+        has_permission("read")(records[0], ctx)
+        assert len(checks) == 9
+
+
+def test_has_published_record_uses_pid_status_of_the_record(app, monkeypatch):
+    from types import SimpleNamespace
+
+    from invenio_pidstore.errors import PIDUnregistered
+
+    from oarepo_runtime.services.config import link_conditions
+
+    assert has_published_record()(SimpleNamespace(is_published=True), {})
+    assert not has_published_record()(SimpleNamespace(is_published=False), {})
+
+    resolved = []
+
+    def resolve(pid_value):
+        resolved.append(pid_value)
+        if pid_value != "published":
+            raise PIDUnregistered("recid", pid_value)
+
+    class MockRecord:
+        pid = SimpleNamespace(resolve=resolve)
+
+    service = SimpleNamespace(record_cls=MockRecord)
+    monkeypatch.setattr(
+        link_conditions,
+        "current_runtime",
+        SimpleNamespace(get_record_service_for_record=lambda record: service),
+    )
+    with app.test_request_context():
+        for _ in range(2):
+            assert has_published_record()({"id": "published"}, {})
+            assert not has_published_record()({"id": "draft"}, {})
+    assert resolved == ["published", "draft"]
@@ -196,3 +196,72 @@ def test_url_with_quotes():
     result = '"http://www.tralal\\"a.fyi"'
 
     assert visit(query1) == result
+
+
+def test_query_without_special_characters_is_not_transformed():
+    tree = parser.parse("lalala AND tralala")
+    assert SearchQueryValidator(None, None).visit(tree, context=None) is tree
+
+
+def test_url_in_group():
+    assert visit("water AND (x OR https://doi.org/10.5281/zenodo.1)") == (
+        'water AND (x OR "https://doi.org/10.5281/zenodo.1")'
+    )
+    assert visit('"see https://doi.org" next') == '"see https://doi.org" next'
+
+
+def test_fields_are_mapped_and_checked_against_allow_list():
+    def visit_with(query, mapping, allow_list):
+        transformed = SearchQueryValidator(mapping, allow_list).visit(parser.parse(query), context=None)
+        return " ".join(str(auto_head_tail(transformed)).split())
+
+    mapping = {"title": "metadata.title", "year": "metadata.year"}
+    allow_list = {"metadata.title", "metadata.year", "id"}
+
+    assert visit_with("title:water", mapping, allow_list) == "metadata.title:water"
+    assert visit_with("id:abc AND year:[2000 TO 2010]", mapping, allow_list) == (
+        "id:abc AND metadata.year:[2000 TO 2010]"
+    )
+    # unknown fields are searched as phrases instead of being sent to unmapped fields
+    assert visit_with("secret:abc water", mapping, allow_list) == '"secret:abc" water'
+    # without allow list all fields are allowed
+    assert visit_with("secret:abc", mapping, None) == "secret:abc"
+
+
+def test_regex_and_wildcards_are_quoted():
+    assert visit("/joh?n.*/") == '"/joh?n.*/"'
+    assert visit("title:/.*water/") == 'title:"/.*water/"'
+    assert visit("*water") == '"*water"'
+
+
+def test_restricted_and_mapped_fields():
+    from invenio_records_resources.services.errors import QuerystringValidationError
+    from invenio_records_resources.services.records.queryparser.transformer import (
+        FieldValueMapper,
+        RestrictedTerm,
+        RestrictedTermValue,
+    )
+
+    class Permission:
+        def allows(self, identity):
+            return identity == "admin"
+
+    mapping = {
+        "notes": RestrictedTerm(Permission()),
+        "_exists_": RestrictedTermValue(Permission(), word=lambda _node: Word("public")),
+        "lang": FieldValueMapper("metadata.language.id", word=lambda node: Word(node.value.lower())),
+    }
+
+    def visit_as(query, identity):
+        transformed = SearchQueryValidator(mapping, None).visit(parser.parse(query), context={"identity": identity})
+        return str(auto_head_tail(transformed))
+
+    with pytest.raises(QuerystringValidationError):
+        visit_as("notes:secret", "anonymous")
+    assert visit_as("notes:secret", "admin") == "notes:secret"
+
+    assert visit_as("_exists_:internal", "anonymous") == "_exists_:public"
+    assert visit_as("_exists_:internal", "admin") == "_exists_:internal"
+
+    # the mapper applies to the values of the mapped field only
+    assert visit_as("lang:ENG AND ENG", "anonymous") == "metadata.language.id:eng AND ENG"
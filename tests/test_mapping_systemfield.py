@@ -14,6 +14,7 @@ from __future__ import annotations
 from invenio_records.api import Record
 from invenio_records.systemfields import SystemField
 
+from oarepo_runtime.records.systemfields.base import get_class_fields
 from oarepo_runtime.records.systemfields.mapping import MappingSystemFieldMixin
 
 
@@ -62,3 +63,21 @@ def test_mapping_system_field_mixin_default_templates():
     """Test default dynamic templates returns empty list."""
     rec = MockRecord({})
     assert rec.test_field.dynamic_templates == [{"template": True}]
+
+
+class MockRecordSubclass(MockRecord):
+    """Mock record subclass overriding and adding fields."""
+
+    test_field = "not a field anymore"
+    other_field = MockMappingField("other_field")
+
+
+def test_get_class_fields():
+    """Test discovery of fields along the class hierarchy."""
+    assert get_class_fields(MockRecord, MappingSystemFieldMixin) == (("test_field", MockRecord.test_field),)
+    assert get_class_fields(MockRecordSubclass, MappingSystemFieldMixin) == (
+        ("other_field", MockRecordSubclass.other_field),
+    )
+    assert get_class_fields(MockRecordSubclass, MappingSystemFieldMixin) is get_class_fields(
+        MockRecordSubclass, MappingSystemFieldMixin
+    )
@@ -0,0 +1,344 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+
+"""Test planned updates of index mappings."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from invenio_records.api import Record
+
+from oarepo_runtime.cli.mappings import mappings
+from oarepo_runtime.records.mapping import (
+    MAPPING_FINGERPRINTS_META_KEY,
+    IndexMappingUpdate,
+    MappingChange,
+    MappingUpdatePlan,
+    merge_dynamic_templates,
+    merge_mappings,
+)
+from oarepo_runtime.records.systemfields.mapping import MappingSystemFieldMixin
+
+
+class MockMappingField(MappingSystemFieldMixin):
+    """Mock mapping field for testing."""
+
+    def __init__(self, mapping=None, settings=None, templates=None):
+        """Initialize mock field."""
+        self._mapping = mapping or {}
+        self._settings = settings or {}
+        self._templates = templates or []
+
+    @property
+    def mapping(self) -> dict:
+        """Return mapping."""
+        return self._mapping
+
+    @property
+    def mapping_settings(self) -> dict:
+        """Return settings."""
+        return self._settings
+
+    @property
+    def dynamic_templates(self) -> list:
+        """Return templates."""
+        return self._templates
+
+
+class MockRecord(Record):
+    """Mock record with mapping fields."""
+
+    index = SimpleNamespace(_name="records")
+
+    field1 = MockMappingField(
+        mapping={"title": {"type": "text"}},
+        settings={"analysis": {"analyzer": {"folding": {"type": "custom", "tokenizer": "standard"}}}},
+        templates=[{"strings": {"match": "*", "mapping": {"type": "keyword"}}}],
+    )
+    field2 = MockMappingField(
+        mapping={"description": {"type": "text"}},
+        settings={"max_result_window": 20000},
+    )
+
+
+class MockDraft(Record):
+    """Mock draft in another index."""
+
+    index = SimpleNamespace(_name="drafts")
+
+    field = MockMappingField(mapping={"title": {"type": "text", "fields": {"keyword": {"type": "keyword"}}}})
+
+
+class MockRecordNoIndex(Record):
+    """Mock record without index."""
+
+    field = MockMappingField(mapping={"title": {"type": "text"}})
+
+
+class MockClient:
+    """Search client storing settings and mappings of indices in memory."""
+
+    def __init__(self, indices: dict[str, dict]):
+        self.state = indices
+        self.indices = Mock()
+        self.indices.get_settings.side_effect = lambda index: {f"{index}-v1": {"settings": self.state[index]["settings"]}}
+        self.indices.get_mapping.side_effect = lambda index: {f"{index}-v1": {"mappings": self.state[index]["mappings"]}}
+        self.threads: set[str] = set()
+        self.indices.put_mapping.side_effect = self._put_mapping
+        self.indices.put_settings.side_effect = lambda index, body: merge_mappings(
+            self.state[index.removesuffix("-v1")]["settings"]["index"], body
+        )
+
+    def _put_mapping(self, index, body):
+        self.threads.add(threading.current_thread().name)
+        mappings = self.state[index.removesuffix("-v1")]["mappings"]
+        merge_mappings(mappings.setdefault("properties", {}), body.get("properties", {}))
+        if "dynamic_templates" in body:
+            mappings["dynamic_templates"] = body["dynamic_templates"]
+        if "_meta" in body:
+            mappings["_meta"] = body["_meta"]
+
+
+@pytest.fixture
+def client():
+    client = MockClient(
+        {
+            "test-records": {
+                "settings": {"index": {"number_of_shards": "1", "max_result_window": "10000"}},
+                "mappings": {
+                    "properties": {"title": {"type": "text"}},
+                    "dynamic_templates": [{"existing": {"match": "x_*", "mapping": {"type": "long"}}}],
+                },
+            },
+            "test-drafts": {"settings": {"index": {}}, "mappings": {}},
+        }
+    )
+    proxy = Mock()
+    proxy._get_current_object.return_value = client  # noqa: SLF001
+    with (
+        patch("oarepo_runtime.records.mapping.current_search_client", proxy),
+        patch(
+            "oarepo_runtime.records.mapping.prefixed_index",
+            lambda index: SimpleNamespace(_name=f"test-{index._name}"),
+        ),
+    ):
+        yield client
+
+
+def test_merge_mappings():
+    target = {"a": {"type": "object", "properties": {"b": {"type": "text"}}}}
+    merge_mappings(target, {"a": {"properties": {"c": {"type": "keyword"}}}, "d": {"type": "long"}})
+    assert target == {
+        "a": {"type": "object", "properties": {"b": {"type": "text"}, "c": {"type": "keyword"}}},
+        "d": {"type": "long"},
+    }
+
+
+def test_merge_dynamic_templates():
+    templates = [{"a": {"match": "a"}}, {"b": {"match": "b"}}]
+    merge_dynamic_templates(templates, [{"b": {"match": "bb"}}, {"c": {"match": "c"}}])
+    assert templates == [{"a": {"match": "a"}}, {"b": {"match": "bb"}}, {"c": {"match": "c"}}]
+
+
+def test_plan_merges_fields_per_index(client):
+    plan = MappingUpdatePlan()
+    plan.add_record_class(MockRecord)
+    plan.add_record_class(MockDraft)
+    plan.add_record_class(MockRecordNoIndex)
+
+    assert set(plan.updates) == {"test-records", "test-drafts"}
+    update = plan.updates["test-records"]
+    assert update.properties == {"title": {"type": "text"}, "description": {"type": "text"}}
+    assert update.settings == {
+        "analysis": {"analyzer": {"folding": {"type": "custom", "tokenizer": "standard"}}},
+        "max_result_window": 20000,
+    }
+    assert update.dynamic_templates == [{"strings": {"match": "*", "mapping": {"type": "keyword"}}}]
+
+
+def test_dry_run_reports_changes(client):
+    plan = MappingUpdatePlan()
+    plan.add_record_class(MockRecord)
+    plan.add_record_class(MockDraft)
+
+    changes = plan.execute(dry_run=True)
+
+    assert {(change.index, change.kind, change.path) for change in changes} == {
+        ("test-records-v1", "settings", "index.analysis.analyzer.folding.type"),
+        ("test-records-v1", "settings", "index.analysis.analyzer.folding.tokenizer"),
+        ("test-records-v1", "settings", "index.max_result_window"),
+        ("test-records-v1", "mapping", "description"),
+        ("test-records-v1", "dynamic_templates", "strings"),
+        ("test-drafts-v1", "mapping", "title"),
+    }
+    assert str(MappingChange("i", "settings", "index.max_result_window", "10000", "20000")) == (
+        "i: change settings index.max_result_window from '10000' to '20000'"
+    )
+    client.indices.close.assert_not_called()
+    client.indices.put_settings.assert_not_called()
+    client.indices.put_mapping.assert_not_called()
+
+
+def test_execute_applies_changes_once_per_index(client):
+    plan = MappingUpdatePlan()
+    plan.add_record_class(MockRecord)
+    plan.add_record_class(MockDraft)
+
+    plan.execute(workers=2)
+
+    client.indices.close.assert_called_once_with(index="test-records-v1")
+    client.indices.put_settings.assert_called_once_with(
+        index="test-records-v1", body=plan.updates["test-records"].settings
+    )
+    client.indices.open.assert_called_once_with(index="test-records-v1")
+    assert client.indices.put_mapping.call_count == 2
+    assert client.state["test-records"]["mappings"]["dynamic_templates"] == [
+        {"existing": {"match": "x_*", "mapping": {"type": "long"}}},
+        {"strings": {"match": "*", "mapping": {"type": "keyword"}}},
+    ]
+    assert client.threads and threading.current_thread().name not in client.threads
+
+
+def test_unchanged_index_only_stores_fingerprint(client):
+    update = IndexMappingUpdate("test-records")
+    update.add({"max_result_window": 10000}, {"title": {"type": "text"}})
+
+    assert update.apply(client) == []
+    client.indices.close.assert_not_called()
+    client.indices.put_mapping.assert_called_once_with(
+        index="test-records-v1",
+        body={"_meta": {MAPPING_FINGERPRINTS_META_KEY: {"default": update.fingerprint}}},
+    )
+
+
+def test_matching_fingerprint_skips_index(client):
+    plan = MappingUpdatePlan(source="system_fields")
+    plan.add_record_class(MockRecord)
+    assert plan.execute()
+    client.indices.reset_mock()
+
+    assert plan.execute() == []
+    client.indices.get_mapping.assert_called_once_with(index="test-records")
+    client.indices.get_settings.assert_not_called()
+    client.indices.put_mapping.assert_not_called()
+
+    # other sources keep their own fingerprints
+    other = IndexMappingUpdate("test-records", source="relation_fields")
+    other.add({}, {"related": {"type": "object"}})
+    other.apply(client)
+    fingerprints = client.state["test-records"]["mappings"]["_meta"][MAPPING_FINGERPRINTS_META_KEY]
+    assert fingerprints == {
+        "system_fields": plan.updates["test-records"].fingerprint,
+        "relation_fields": other.fingerprint,
+    }
+
+    # forced update compares the index again
+    client.indices.reset_mock()
+    assert plan.execute(force=True) == []
+    client.indices.get_settings.assert_called_once()
+
+
+def test_fingerprint_changes_with_mapping():
+    first = IndexMappingUpdate("test-records")
+    first.add({"a": 1}, {"title": {"type": "text"}}, [{"t": {"match": "*"}}])
+    same = IndexMappingUpdate("test-records")
+    same.add({"a": 1}, {"title": {"type": "text"}}, [{"t": {"match": "*"}}])
+    other = IndexMappingUpdate("test-records")
+    other.add({"a": 2}, {"title": {"type": "text"}}, [{"t": {"match": "*"}}])
+
+    assert first.fingerprint == same.fingerprint
+    assert first.fingerprint != other.fingerprint
+
+
+def test_mapping_only_change_does_not_close_index(client):
+    update = IndexMappingUpdate("test-records")
+    update.add({"number_of_shards": 1}, {"title": {"type": "text"}, "abstract": {"type": "text"}})
+
+    changes = update.apply(client)
+
+    assert [change.path for change in changes] == ["abstract"]
+    client.indices.close.assert_not_called()
+    client.indices.put_mapping.assert_called_once_with(
+        index="test-records-v1",
+        body={
+            "properties": {"title": {"type": "text"}, "abstract": {"type": "text"}},
+            "_meta": {MAPPING_FINGERPRINTS_META_KEY: {"default": update.fingerprint}},
+        },
+    )
+
+
+def test_index_is_reopened_on_settings_error(client):
+    client.indices.put_settings.side_effect = RuntimeError("failed")
+    update = IndexMappingUpdate("test-records")
+    update.add({"max_result_window": 20000}, {})
+
+    with pytest.raises(RuntimeError):
+        update.apply(client)
+    client.indices.open.assert_called_once_with(index="test-records-v1")
+
+
+def test_implicit_object_type_is_not_a_change():
+    update = IndexMappingUpdate("test-records")
+    update.add({}, {"metadata": {"type": "object", "properties": {"title": {"type": "text"}}}})
+
+    live_mapping = {"properties": {"metadata": {"properties": {"title": {"type": "text"}}}}}
+    assert update.diff({}, live_mapping) == []
+
+
+def test_all_indices_behind_alias_are_updated():
+    update = IndexMappingUpdate("test-records")
+    update.add({}, {"title": {"type": "text"}})
+    current = {
+        "mappings": {
+            "properties": {"title": {"type": "text"}},
+            "_meta": {MAPPING_FINGERPRINTS_META_KEY: {"default": update.fingerprint}},
+        }
+    }
+    outdated = {"mappings": {"properties": {}}}
+
+    client = Mock()
+    client.indices.get_mapping.return_value = {"test-records-v1": current, "test-records-v2": outdated}
+    client.indices.get_settings.return_value = {"test-records-v1": {}, "test-records-v2": {}}
+
+    changes = update.apply(client)
+
+    assert [(change.index, change.path) for change in changes] == [("test-records-v2", "title")]
+    assert [call.kwargs["index"] for call in client.indices.put_mapping.call_args_list] == [
+        "test-records-v1",
+        "test-records-v2",
+    ]
+
+    # fingerprint matching in all the indices skips the update
+    client.reset_mock()
+    client.indices.get_mapping.return_value = {"test-records-v1": current, "test-records-v2": current}
+    assert update.apply(client) == []
+    client.indices.put_mapping.assert_not_called()
+
+
+def test_mappings_cli(app):
+    changes = [MappingChange("test-records-v1", "mapping", "title", None, {"type": "text"})]
+    runner = app.test_cli_runner()
+    with (
+        patch("oarepo_runtime.cli.mappings.get_all_record_classes", return_value=[MockRecord]),
+        patch("oarepo_runtime.cli.mappings.MappingUpdatePlan.add_record_class") as add_record_class,
+        patch("oarepo_runtime.cli.mappings.add_relation_fields_mapping") as add_relation_fields,
+        patch("oarepo_runtime.cli.mappings.MappingUpdatePlan.execute", return_value=changes) as execute,
+    ):
+        result = runner.invoke(mappings, ["update", "--dry-run", "--workers", "8"])
+
+    assert result.exit_code == 0, result.output
+    add_record_class.assert_called_once_with(MockRecord)
+    add_relation_fields.assert_called_once()
+    execute.assert_called_once_with(dry_run=True, workers=8, force=False)
+    assert "test-records-v1: add mapping title = {'type': 'text'}" in result.output
+    assert "1 changes would be made." in result.output
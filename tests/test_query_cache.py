@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for the caching query parser."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from invenio_records_resources.services.records.queryparser import QueryParser
+
+from oarepo_runtime.services.queryparsers.cache import CachedQueryParser, QueryCache, query_cache
+from oarepo_runtime.services.queryparsers.transformer import SearchQueryValidator
+
+
+def test_query_cache_lru_and_stats():
+    cache = QueryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") == (False, None)
+    assert cache.get("c") == (True, 3)
+    assert cache.stats() == {"hits": 2, "misses": 1, "hit_rate": 2 / 3, "size": 2, "maxsize": 2}
+
+    disabled = QueryCache(maxsize=0)
+    disabled.set("a", 1)
+    assert disabled.get("a") == (False, None)
+
+
+def test_cached_query_parser_returns_same_queries_as_query_parser():
+    query_cache.clear()
+    cached_factory = CachedQueryParser.factory(tree_transformer_cls=SearchQueryValidator, fields=["title"])
+    factory = QueryParser.factory(tree_transformer_cls=SearchQueryValidator, fields=["title"])
+    other_factory = CachedQueryParser.factory(tree_transformer_cls=SearchQueryValidator, fields=["description"])
+
+    queries = ["lalala", "doi:10.5281/zenodo.1", "title:(unbalanced", "lalala"]
+    for query in queries:
+        assert cached_factory().parse(query) == factory().parse(query)
+    assert query_cache.stats()["hits"] == 1
+
+    # other search options do not share the cached entries
+    assert other_factory().parse("lalala").to_dict() == {
+        "query_string": {"query": "lalala", "fields": ["description"]}
+    }
+    assert query_cache.stats()["hits"] == 1
+
+    with patch.object(CachedQueryParser, "transform") as transform:
+        for query in queries:
+            cached_factory().parse(query)
+        transform.assert_not_called()
+    query_cache.clear()
+
+
+def test_queries_with_restricted_terms_are_not_cached():
+    from invenio_records_resources.services.records.queryparser.transformer import RestrictedTerm
+
+    class Permission:
+        def allows(self, identity):
+            return identity == "admin"
+
+    query_cache.clear()
+    factory = CachedQueryParser.factory(
+        tree_transformer_cls=SearchQueryValidator, fields=["title"], mapping={"notes": RestrictedTerm(Permission())}
+    )
+
+    assert factory(identity="admin").parse("notes:secret").to_dict() == {
+        "query_string": {"query": "notes:secret", "fields": ["title"]}
+    }
+    # the denied query falls back to a text search instead of reusing the admin's query
+    assert factory(identity="anonymous").parse("notes:secret").to_dict() == {
+        "multi_match": {"query": "notes:secret", "fields": ["title"]}
+    }
+    assert query_cache.stats()["size"] == 0
@@ -15,7 +15,7 @@ from unittest.mock import Mock, patch
 
 from invenio_records.api import Record
 
-from oarepo_runtime.records.drafts import get_draft, has_draft
+from oarepo_runtime.records.drafts import get_draft, get_drafts, has_draft
 
 
 class MockDraftRecord(Record):
@@ -168,3 +168,52 @@ def test_get_draft_multiple_drafts_returns_first(mock_runtime, app):
         assert result is mock_draft1
         mock_runtime.get_record_service_for_record.assert_called_once_with(record)
         mock_draft_cls.get_records_by_parent.assert_called_once_with(record.parent, with_deleted=False)
+
+
+def test_get_drafts_fetches_drafts_at_once_and_caches_them(app):
+    """Test get_drafts fetches drafts of all records in one go and get_draft uses the result."""
+    parent_with_draft = Mock(id="p1")
+    parent_without_draft = Mock(id="p2")
+    draft_record = MockDraftRecord({})
+
+    published_with_draft = MockPublishedRecordWithDraft({})
+    published_with_draft.parent = parent_with_draft
+    published_without_draft = MockPublishedRecordWithDraft({})
+    published_without_draft.parent = parent_without_draft
+    another_with_draft = MockPublishedRecordWithDraft({})
+    another_with_draft.parent = parent_with_draft
+
+    mock_service = Mock()
+    mock_draft_cls = mock_service.config.draft_cls
+    mock_draft = Mock()
+
+    with (
+        patch("oarepo_runtime.records.drafts.current_runtime") as mock_runtime,
+        patch("oarepo_runtime.records.drafts._fetch_drafts_by_parents") as mock_fetch,
+        app.test_request_context(),
+    ):
+        mock_runtime.get_record_service_for_record = Mock(return_value=mock_service)
+        mock_fetch.return_value = {"p1": mock_draft}
+
+        drafts = get_drafts(
+            [published_with_draft, draft_record, published_without_draft, MockVocabularyRecord({}), another_with_draft]
+        )
+        assert drafts == [mock_draft, draft_record, None, None, mock_draft]
+        mock_fetch.assert_called_once()
+        assert list(mock_fetch.call_args.args[1]) == ["p1", "p2"]
+
+        # cached for the rest of the request, including the missing draft
+        assert get_draft(published_with_draft) is mock_draft
+        assert get_draft(published_without_draft) is None
+        assert get_drafts([published_without_draft]) == [None]
+        mock_fetch.assert_called_once()
+        mock_draft_cls.get_records_by_parent.assert_not_called()
+
+    # not cached in requests that might modify data
+    with (
+        patch("oarepo_runtime.records.drafts.current_runtime") as mock_runtime,
+        app.test_request_context(method="POST"),
+    ):
+        mock_runtime.get_record_service_for_record = Mock(return_value=mock_service)
+        mock_draft_cls.get_records_by_parent.return_value = iter([])
+        assert get_draft(published_with_draft) is None
@@ -0,0 +1,369 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-runtime (see http://github.com/oarepo/oarepo-runtime).
+#
+# oarepo-runtime is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+
+"""Test reindex of records into new versioned indices."""
+
+from __future__ import annotations
+
+import copy
+import fnmatch
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from invenio_records.api import Record
+
+from oarepo_runtime.cli.reindex import reindex
+from oarepo_runtime.records.mapping import MAPPING_FINGERPRINTS_META_KEY, merge_mappings
+from oarepo_runtime.records.reindex import (
+    REINDEX_META_KEY,
+    ReindexError,
+    ReindexJob,
+    ReindexProgress,
+    TargetIndexer,
+    Throttle,
+)
+from oarepo_runtime.records.systemfields.mapping import MappingSystemFieldMixin
+
+
+class MockMappingField(MappingSystemFieldMixin):
+    """Mock mapping field for testing."""
+
+    @property
+    def mapping(self) -> dict:
+        """Return mapping."""
+        return {"system": {"type": "keyword"}}
+
+
+class MockRecord(Record):
+    """Mock record with a mapping field."""
+
+    index = SimpleNamespace(_name="records")
+
+    field = MockMappingField()
+
+
+class MockSearchClient:
+    """Search client keeping indices, aliases and documents in memory."""
+
+    def __init__(self):
+        self.state: dict[str, dict] = {}
+        self.tasks = Mock()
+        self.tasks.get.side_effect = lambda task_id: self.task_results[task_id]
+        self.task_results: dict[str, dict] = {}
+        self.indices = Mock()
+        self.indices.exists.side_effect = lambda index: index in self.state
+        self.indices.exists_alias.side_effect = lambda name: bool(self._aliased(name))
+        self.indices.get_alias.side_effect = self._get_alias
+        self.indices.get_mapping.side_effect = self._get_mapping
+        self.indices.create.side_effect = self._create
+        self.indices.delete.side_effect = lambda index: self.state.pop(index)
+        self.indices.put_mapping.side_effect = lambda index, body: self.state[index]["mappings"].update(
+            copy.deepcopy(body)
+        )
+        self.indices.put_settings.side_effect = lambda index, body: merge_mappings(
+            self.state[index]["settings"], body
+        )
+        self.indices.update_aliases.side_effect = self._update_aliases
+        self.reindex = Mock(side_effect=self._reindex)
+        self.count = Mock(side_effect=lambda index, body: {"count": len(self.search(index, body["query"]))})
+        self.bulk_errors: list[dict] = []
+
+    def search(self, index, query):
+        """Return ids of documents of the index matching a match_all or a range query on the updated field."""
+        docs = self.state[index]["docs"]
+        if "range" not in query:
+            return list(docs)
+        condition = query["range"]["updated"]
+        return [
+            key
+            for key, doc in docs.items()
+            if ("lt" not in condition or doc["updated"] < condition["lt"])
+            and ("gte" not in condition or doc["updated"] >= condition["gte"])
+        ]
+
+    def scan(self, client, index, query, size):
+        assert client is self
+        return [{"_id": key} for key in self.search(index, query["query"])]
+
+    def bulk(self, client, actions, raise_on_error, raise_on_exception):
+        assert client is self
+        actions = list(actions)
+        for action in actions:
+            docs = self.state[action["_index"]]["docs"]
+            if action["_op_type"] == "delete":
+                docs.pop(action["_id"], None)
+            else:
+                docs[action["_id"]] = action["_source"]
+        return len(actions) - len(self.bulk_errors), self.bulk_errors
+
+    def add_index(self, name, aliases, docs):
+        self.state[name] = {"settings": {}, "mappings": {}, "aliases": dict(aliases), "docs": dict(docs)}
+
+    def _aliased(self, name):
+        return [index for index, value in self.state.items() if name in value["aliases"]]
+
+    def _get_alias(self, name=None, index=None):
+        if index is not None:
+            return {index: {"aliases": self.state[index]["aliases"]}}
+        return {index: {"aliases": {name: {}}} for index in self._aliased(name)}
+
+    def _get_mapping(self, index, allow_no_indices=False):
+        return {
+            name: {"mappings": copy.deepcopy(value["mappings"])}
+            for name, value in self.state.items()
+            if fnmatch.fnmatch(name, index)
+        }
+
+    def _create(self, index, body):
+        self.state[index] = {
+            "settings": copy.deepcopy(body.get("settings", {})),
+            "mappings": copy.deepcopy(body["mappings"]),
+            "aliases": {},
+            "docs": {},
+        }
+
+    def _update_aliases(self, body):
+        for action in body["actions"]:
+            for kind, definition in action.items():
+                definition = dict(definition)
+                index, alias = definition.pop("index"), definition.pop("alias")
+                if kind == "add":
+                    self.state[index]["aliases"][alias] = definition
+                else:
+                    del self.state[index]["aliases"][alias]
+
+    def _reindex(self, body, slices, requests_per_second, wait_for_completion):
+        docs = self.state[body["source"]["index"]]["docs"]
+        source = {key: docs[key] for key in self.search(body["source"]["index"], body["source"].get("query", {}))}
+        self.state[body["dest"]["index"]]["docs"].update(source)
+        task_id = f"task-{len(self.task_results)}"
+        status = {"created": len(source), "total": len(source)}
+        self.task_results[task_id] = {"completed": True, "task": {"status": status}}
+        return {"task": task_id}
+
+
+@pytest.fixture
+def client(tmp_path):
+    mapping_file = tmp_path / "records.json"
+    mapping_file.write_text(
+        json.dumps(
+            {
+                "settings": {"index": {"refresh_interval": "5s", "number_of_replicas": 1}},
+                "mappings": {"properties": {"title": {"type": "text"}}},
+            }
+        )
+    )
+    client = MockSearchClient()
+    client.add_index(
+        "records-20240101",
+        {"records": {}, "all": {"is_write_index": False}},
+        {"1": {"title": "old", "updated": "2020-01-01"}},
+    )
+    proxy = Mock()
+    proxy._get_current_object.return_value = client  # noqa: SLF001
+    with (
+        patch("oarepo_runtime.records.reindex.current_search_client", proxy),
+        patch("oarepo_runtime.records.reindex.current_search", SimpleNamespace(mappings={"records": mapping_file})),
+        patch("oarepo_runtime.records.reindex.timestamp_suffix", return_value="-20250101"),
+        patch("oarepo_runtime.records.mapping.prefixed_index", lambda index: index),
+        patch("oarepo_runtime.records.reindex.search.helpers.scan", client.scan),
+        patch("oarepo_runtime.records.reindex.search.helpers.bulk", client.bulk),
+    ):
+        yield client
+
+
+def test_reindex_from_search(client):
+    reports: list[ReindexProgress] = []
+    job = ReindexJob(MockRecord, slices=3, requests_per_second=100, progress=reports.append, poll_interval=0)
+
+    assert job.run() == "records-20250101"
+
+    target = client.state["records-20250101"]
+    assert target["docs"] == {"1": {"title": "old", "updated": "2020-01-01"}}
+    assert target["mappings"]["properties"] == {"title": {"type": "text"}, "system": {"type": "keyword"}}
+    assert MAPPING_FINGERPRINTS_META_KEY in target["mappings"]["_meta"]
+    assert target["mappings"]["_meta"][REINDEX_META_KEY]["status"] == "done"
+    # bulk settings are replaced with the registered ones after the copy
+    assert target["settings"]["index"] == {"refresh_interval": "5s", "number_of_replicas": 1}
+    assert target["aliases"] == {"records": {}, "all": {"is_write_index": False}}
+    assert client.state["records-20240101"]["aliases"] == {}
+
+    copy_call, catch_up_call = client.reindex.call_args_list
+    assert copy_call.kwargs["slices"] == 3
+    assert copy_call.kwargs["requests_per_second"] == 100
+    assert copy_call.kwargs["body"]["dest"] == {"index": "records-20250101", "version_type": "external"}
+    assert "range" in catch_up_call.kwargs["body"]["source"]["query"]
+    client.indices.update_aliases.assert_called_once()
+    assert str(reports[-1]) == "records: done, using index records-20250101"
+
+
+def test_records_modified_during_copy_are_copied_after_swap(client):
+    def modify_during_copy(*args, **kwargs):
+        response = MockSearchClient._reindex(client, *args, **kwargs)
+        if len(client.reindex.call_args_list) == 1:
+            client.state["records-20240101"]["docs"]["2"] = {"title": "new", "updated": "2100-01-01"}
+        return response
+
+    client.reindex.side_effect = modify_during_copy
+
+    ReindexJob(MockRecord, poll_interval=0).run(delete_old=True)
+
+    assert set(client.state["records-20250101"]["docs"]) == {"1", "2"}
+    assert "records-20240101" not in client.state
+
+
+def test_records_deleted_during_copy_are_removed_after_swap(client):
+    client.state["records-20240101"]["docs"]["2"] = {"title": "deleted", "updated": "2020-01-01"}
+
+    def delete_during_copy(*args, **kwargs):
+        response = MockSearchClient._reindex(client, *args, **kwargs)
+        client.state["records-20240101"]["docs"].pop("2", None)
+        return response
+
+    client.reindex.side_effect = delete_during_copy
+
+    ReindexJob(MockRecord, poll_interval=0).run()
+
+    assert set(client.state["records-20250101"]["docs"]) == {"1"}
+
+
+def test_records_created_after_swap_are_kept(client):
+    job = ReindexJob(MockRecord, poll_interval=0)
+    with patch.object(job, "catch_up", side_effect=RuntimeError("interrupted")), pytest.raises(RuntimeError):
+        job.run()
+    # written through the aliases to the new index only
+    client.state["records-20250101"]["docs"]["3"] = {"title": "created", "updated": "2100-01-01"}
+
+    ReindexJob(MockRecord, poll_interval=0).run()
+
+    assert set(client.state["records-20250101"]["docs"]) == {"1", "3"}
+
+
+def test_incomplete_copy_does_not_swap_aliases(client):
+    client.reindex.side_effect = lambda **kwargs: (
+        client.task_results.setdefault("empty", {"completed": True, "task": {"status": {}}}) and {"task": "empty"}
+    )
+
+    with pytest.raises(ReindexError, match="contains 0 documents"):
+        ReindexJob(MockRecord, poll_interval=0).run()
+
+    client.indices.update_aliases.assert_not_called()
+    assert client.state["records-20240101"]["aliases"] == {"records": {}, "all": {"is_write_index": False}}
+
+
+def test_bulk_failures_do_not_swap_aliases(client):
+    client.bulk_errors = [{"index": {"_id": "1", "status": 400, "error": "mapper_parsing_exception"}}]
+    job = ReindexJob(MockRecord, source="db", slices=2, poll_interval=0)
+    indexer = Mock()
+    indexer._index_action.side_effect = lambda payload: {  # noqa: SLF001
+        "_op_type": "index",
+        "_index": job.target,
+        "_id": payload["id"],
+        "_source": {"updated": "2020-01-01"},
+    }
+
+    with (
+        patch.object(job, "_record_ids", return_value=["1"]),
+        patch.object(job, "_indexer", return_value=indexer),
+        pytest.raises(ReindexError, match="failed for 1 documents"),
+    ):
+        job.run()
+
+    client.indices.update_aliases.assert_not_called()
+    assert client.state["records-20240101"]["aliases"] == {"records": {}, "all": {"is_write_index": False}}
+
+    # version conflicts of records modified during the reindex are expected
+    client.bulk_errors = [{"index": {"_id": "1", "status": 409}}, {"delete": {"_id": "2", "status": 404}}]
+    with patch.object(job, "_record_ids", return_value=["1"]), patch.object(job, "_indexer", return_value=indexer):
+        job._index_batch(["1"])  # noqa: SLF001
+
+
+def test_interrupted_reindex_is_resumed(client):
+    job = ReindexJob(MockRecord, poll_interval=0)
+    with patch.object(job, "swap_aliases", side_effect=RuntimeError("interrupted")), pytest.raises(RuntimeError):
+        job.run()
+    assert client.state["records-20250101"]["mappings"]["_meta"][REINDEX_META_KEY]["status"] == "copied"
+    client.reindex.reset_mock()
+
+    with patch("oarepo_runtime.records.reindex.timestamp_suffix", return_value="-20250102"):
+        assert ReindexJob(MockRecord, poll_interval=0).run() == "records-20250101"
+
+    assert "records-20250102" not in client.state
+    # only the records modified during the copy are copied again
+    assert client.reindex.call_count == 1
+    assert "query" in client.reindex.call_args.kwargs["body"]["source"]
+    assert client.state["records-20250101"]["aliases"] == {"records": {}, "all": {"is_write_index": False}}
+
+
+def test_reindex_resumed_after_swap_only_catches_up(client):
+    job = ReindexJob(MockRecord, poll_interval=0)
+    with patch.object(job, "catch_up", side_effect=RuntimeError("interrupted")), pytest.raises(RuntimeError):
+        job.run()
+    client.reindex.reset_mock()
+    client.indices.update_aliases.reset_mock()
+
+    assert ReindexJob(MockRecord, poll_interval=0).run() == "records-20250101"
+
+    client.indices.update_aliases.assert_not_called()
+    assert client.reindex.call_count == 1
+    assert client.state["records-20250101"]["mappings"]["_meta"][REINDEX_META_KEY]["status"] == "done"
+
+
+def test_failed_copy_raises(client):
+    client.reindex.side_effect = None
+    client.reindex.return_value = {"task": "failed"}
+    client.task_results["failed"] = {"completed": True, "response": {"failures": ["boom"]}}
+
+    with pytest.raises(ReindexError, match="boom"):
+        ReindexJob(MockRecord, poll_interval=0).run()
+    assert client.state["records-20240101"]["aliases"]
+
+
+def test_index_without_alias_is_not_reindexed(client):
+    client.state["records-20240101"]["aliases"] = {}
+
+    with pytest.raises(ReindexError, match="not an alias"):
+        ReindexJob(MockRecord).run()
+
+
+def test_target_indexer_uses_target_index():
+    indexer = TargetIndexer("prefix-records-20250101", search_client=Mock(), record_cls=MockRecord)
+    assert indexer._prepare_index(indexer.record_to_index(None)) == "prefix-records-20250101"  # noqa: SLF001
+
+
+def test_throttle():
+    assert Throttle(None).wait(1000) is None
+
+    throttle = Throttle(100)
+    start = time.monotonic()
+    throttle.wait(1)
+    throttle.wait(2)
+    assert time.monotonic() - start >= 0.01
+
+
+def test_reindex_cli(app):
+    model = SimpleNamespace(record_cls=MockRecord, draft_cls=None)
+    runner = app.test_cli_runner()
+    with (
+        patch("oarepo_runtime.cli.reindex.current_runtime", SimpleNamespace(models={"test": model})),
+        patch("oarepo_runtime.cli.reindex.ReindexJob") as job,
+    ):
+        result = runner.invoke(reindex, ["test", "--source", "db", "--slices", "2", "--delete-old"])
+        assert result.exit_code == 0, result.output
+        assert job.call_args.args == (MockRecord,)
+        assert job.call_args.kwargs["source"] == "db"
+        assert job.call_args.kwargs["slices"] == 2
+        job.return_value.run.assert_called_once_with(delete_old=True)
+
+        result = runner.invoke(reindex, ["unknown"])
+        assert result.exit_code != 0
+        assert "Unknown models: unknown" in result.output
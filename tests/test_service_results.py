@@ -276,6 +276,50 @@ def test_record_list_aggregations_processing():
         assert buckets[1]["label"] == "Published"
 
 
+def test_record_list_aggregations_nested_and_cached():
+    """Test that nested buckets are normalized and aggregations are computed once."""
+    record_list = RecordList(
+        service=Mock(),
+        identity=Identity(1),
+        results=[],
+        params={},
+        links_tpl=Mock(),
+        links_item_tpl=Mock(),
+        schema=Mock(),
+    )
+
+    label = "Published"
+    mock_aggregations = {
+        "status": {"buckets": [{"key": "published", "label": label, "doc_count": 10}]},
+        "nested": {
+            "inner": {
+                "buckets": [
+                    {
+                        "key": 1,
+                        "doc_count": 5,
+                        "label": 1,
+                        "inner": {"buckets": [{"key": 2, "label": 3, "doc_count": 1}]},
+                    }
+                ]
+            }
+        },
+    }
+
+    with patch.object(BaseRecordList, "aggregations", new_callable=PropertyMock) as mock_agg:
+        mock_agg.return_value = mock_aggregations
+
+        result = record_list.aggregations
+        assert record_list.aggregations is result
+        assert mock_agg.call_count == 1
+
+    assert result["status"]["buckets"][0]["label"] is label
+    outer = result["nested"]["inner"]["buckets"][0]
+    assert outer["key"] == "1"
+    assert outer["label"] == "1"
+    assert outer["doc_count"] == 5
+    assert outer["inner"]["buckets"][0] == {"key": "2", "label": "3", "doc_count": 1}
+
+
 def test_record_list_aggregations_none():
     """Test RecordList aggregations when None."""
     mock_results = []
@@ -46,7 +46,7 @@ def test_update_all_records_mappings_with_record_services():
 
     with (
         patch("oarepo_runtime.services.records.mapping.current_runtime", mock_runtime),
-        patch("oarepo_runtime.services.records.mapping.update_record_system_fields_mapping") as mock_update,
+        patch("oarepo_runtime.services.records.mapping.MappingUpdatePlan.add_record_class") as mock_update,
     ):
         update_all_records_mappings()
 
@@ -78,7 +78,7 @@ def test_update_all_records_mappings_no_record_cls():
 
     with (
         patch("oarepo_runtime.services.records.mapping.current_runtime", mock_runtime),
-        patch("oarepo_runtime.services.records.mapping.update_record_system_fields_mapping") as mock_update,
+        patch("oarepo_runtime.services.records.mapping.MappingUpdatePlan.add_record_class") as mock_update,
     ):
         update_all_records_mappings()
 
@@ -93,7 +93,7 @@ def test_update_all_records_mappings_no_services():
 
     with (
         patch("oarepo_runtime.services.records.mapping.current_runtime", mock_runtime),
-        patch("oarepo_runtime.services.records.mapping.update_record_system_fields_mapping") as mock_update,
+        patch("oarepo_runtime.services.records.mapping.MappingUpdatePlan.add_record_class") as mock_update,
     ):
         update_all_records_mappings()
 
@@ -127,7 +127,7 @@ def test_update_all_records_mappings_mixed_services():
 
     with (
         patch("oarepo_runtime.services.records.mapping.current_runtime", mock_runtime),
-        patch("oarepo_runtime.services.records.mapping.update_record_system_fields_mapping") as mock_update,
+        patch("oarepo_runtime.services.records.mapping.MappingUpdatePlan.add_record_class") as mock_update,
     ):
         update_all_records_mappings()
 
@@ -166,7 +166,7 @@ def test_update_all_records_mappings_service_config_variations():
 
     with (
         patch("oarepo_runtime.services.records.mapping.current_runtime", mock_runtime),
-        patch("oarepo_runtime.services.records.mapping.update_record_system_fields_mapping") as mock_update,
+        patch("oarepo_runtime.services.records.mapping.MappingUpdatePlan.add_record_class") as mock_update,
     ):
         update_all_records_mappings()
 
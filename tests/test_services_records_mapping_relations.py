@@ -11,7 +11,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 from invenio_records_resources.services.records import (
     RecordService,
@@ -48,11 +48,11 @@ def test_update_all_records_mappings_relations_fields_with_record_services():
 
     with (
         patch(
-            "oarepo_runtime.services.records.custom_fields.current_runtime",
+            "oarepo_runtime.services.records.mapping.current_runtime",
             mock_runtime,
         ),
         patch(
-            "oarepo_runtime.services.records.custom_fields.update_record_system_fields_mapping_relation_field"
+            "oarepo_runtime.services.records.custom_fields.add_relation_fields_mapping"
         ) as mock_update,
     ):
         update_all_records_mappings_relation_fields()
@@ -67,7 +67,7 @@ def test_update_all_records_mappings_relations_fields_with_record_services():
         ]
 
         assert mock_update.call_count == 3
-        actual_calls = [call[0] for call in mock_update.call_args_list]
+        actual_calls = [call[0][1:] for call in mock_update.call_args_list]
 
         for expected_call in expected_calls:
             assert expected_call in actual_calls
@@ -85,11 +85,11 @@ def test_update_all_records_mappings_no_record_cls():
 
     with (
         patch(
-            "oarepo_runtime.services.records.custom_fields.current_runtime",
+            "oarepo_runtime.services.records.mapping.current_runtime",
             mock_runtime,
         ),
         patch(
-            "oarepo_runtime.services.records.custom_fields.update_record_system_fields_mapping_relation_field"
+            "oarepo_runtime.services.records.custom_fields.add_relation_fields_mapping"
         ) as mock_update,
     ):
         update_all_records_mappings_relation_fields()
@@ -105,11 +105,11 @@ def test_update_all_records_mappings_no_services():
 
     with (
         patch(
-            "oarepo_runtime.services.records.custom_fields.current_runtime",
+            "oarepo_runtime.services.records.mapping.current_runtime",
             mock_runtime,
         ),
         patch(
-            "oarepo_runtime.services.records.custom_fields.update_record_system_fields_mapping_relation_field"
+            "oarepo_runtime.services.records.custom_fields.add_relation_fields_mapping"
         ) as mock_update,
     ):
         update_all_records_mappings_relation_fields()
@@ -144,19 +144,19 @@ def test_update_all_records_mappings_mixed_services():
 
     with (
         patch(
-            "oarepo_runtime.services.records.custom_fields.current_runtime",
+            "oarepo_runtime.services.records.mapping.current_runtime",
             mock_runtime,
         ),
         patch(
-            "oarepo_runtime.services.records.custom_fields.update_record_system_fields_mapping_relation_field"
+            "oarepo_runtime.services.records.custom_fields.add_relation_fields_mapping"
         ) as mock_update,
     ):
         update_all_records_mappings_relation_fields()
 
         # Should only be called for the valid record service
         assert mock_update.call_count == 2
-        mock_update.assert_any_call(mock_record_service.config.record_cls)
-        mock_update.assert_any_call(mock_record_service.config.draft_cls)
+        mock_update.assert_any_call(ANY, mock_record_service.config.record_cls)
+        mock_update.assert_any_call(ANY, mock_record_service.config.draft_cls)
 
 
 def test_update_all_records_mappings_service_config_variations():
@@ -188,11 +188,11 @@ def test_update_all_records_mappings_service_config_variations():
 
     with (
         patch(
-            "oarepo_runtime.services.records.custom_fields.current_runtime",
+            "oarepo_runtime.services.records.mapping.current_runtime",
             mock_runtime,
         ),
         patch(
-            "oarepo_runtime.services.records.custom_fields.update_record_system_fields_mapping_relation_field"
+            "oarepo_runtime.services.records.custom_fields.add_relation_fields_mapping"
         ) as mock_update,
     ):
         update_all_records_mappings_relation_fields()
@@ -203,7 +203,7 @@ def test_update_all_records_mappings_service_config_variations():
         # - both record_cls and draft_cls from both service
         assert mock_update.call_count == 4
 
-        calls = [call[0][0] for call in mock_update.call_args_list]
+        calls = [call[0][1] for call in mock_update.call_args_list]
         assert mock_service_record_only.config.record_cls in calls
         assert mock_service_draft_only.config.draft_cls in calls
         assert mock_service_both.config.record_cls in calls